@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import typer
+from rich.table import Table
+
+from benchmarks.init_phases import run
+from benchmarks.results import BenchmarkResult, compare
+from zentra_sdk.cli.constants import console
+
+app = typer.Typer(add_completion=False)
+
+
+def results_table(result: BenchmarkResult, baseline: BenchmarkResult | None) -> Table:
+    """Creates a printable table of the phase timings, with the change from the baseline."""
+    table = Table(title="Init Benchmarks", title_style="bright_green")
+    table.add_column("Phase", style="cyan")
+    table.add_column("Median", justify="right")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Change", justify="right")
+
+    for phase, seconds in result.phases.items():
+        before = baseline.phases.get(phase) if baseline else None
+        change = f"{(seconds / before - 1) * 100:+.1f}%" if before else "-"
+        table.add_row(
+            phase,
+            f"{seconds * 1000:.1f}ms",
+            f"{before * 1000:.1f}ms" if before else "-",
+            change,
+        )
+
+    return table
+
+
+@app.command()
+def main(
+    size: int = typer.Option(50, help="Size of the synthetic template, in MB."),
+    files: int = typer.Option(200, help="Number of files in the template."),
+    repeat: int = typer.Option(5, help="Number of runs per phase."),
+    output: Path = typer.Option(
+        None, "--output", "-o", help="Save the results as JSON."
+    ),
+    baseline: Path = typer.Option(
+        None, "--compare", help="Compare against a previous results file."
+    ),
+    threshold: float = typer.Option(
+        0.2,
+        help="Slowdown, as a fraction of the baseline, that counts as a regression.",
+    ),
+) -> None:
+    """Times each phase of `zentra init` against a fake Docker engine."""
+    result = run(size * 1024**2, files, repeat)
+    previous = BenchmarkResult.load(baseline) if baseline else None
+
+    console.print(results_table(result, previous))
+
+    if output:
+        result.save(output)
+
+    if previous:
+        regressions = compare(previous, result, threshold)
+        for r in regressions:
+            console.print(f"[red]Regression[/red] in {r.phase}: {r.change:+.1%}")
+
+        if regressions:
+            raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,132 @@
+import io
+import random
+import tarfile
+import time
+from types import SimpleNamespace
+from typing import Iterator
+
+from docker.errors import ImageNotFound, NotFound
+
+from zentra_sdk.cli.builder.archive import ARCHIVE_CHUNK_SIZE
+from zentra_sdk.cli.constants import FRONTEND_FILES_TO_REMOVE
+
+LAYER_SIZE = 4 * 1024 * 1024
+
+
+def synthetic_template(size: int, files: int = 200, seed: int = 0) -> bytes:
+    """Creates a tar archive shaped like the frontend template, with `size` bytes of incompressible file data."""
+    rng = random.Random(seed)
+    files = max(files, 1)
+    file_size, remainder = divmod(size, files)
+    buffer = io.BytesIO()
+
+    def add(name: str, data: bytes) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
+
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name in FRONTEND_FILES_TO_REMOVE:
+            add(f"frontend/{name}", b"template")
+
+        for i in range(files):
+            extra = remainder if i == files - 1 else 0
+            add(
+                f"frontend/src/module_{i // 50}/file_{i}.ts",
+                rng.randbytes(file_size + extra),
+            )
+
+    return buffer.getvalue()
+
+
+class FakeContainer:
+    """A created container that serves the synthetic template from `get_archive`."""
+
+    def __init__(self, archive: bytes) -> None:
+        self.archive = archive
+
+    def get_archive(
+        self, path: str, chunk_size: int = ARCHIVE_CHUNK_SIZE
+    ) -> tuple[Iterator[bytes], dict]:
+        view = memoryview(self.archive)
+        chunks = (
+            bytes(view[i : i + chunk_size]) for i in range(0, len(view), chunk_size)
+        )
+        return chunks, {"name": path.strip("/"), "size": len(self.archive)}
+
+    def remove(self, force: bool = False) -> None:
+        pass
+
+
+class FakeContainers:
+    def __init__(self, archive: bytes) -> None:
+        self.archive = archive
+
+    def get(self, name: str) -> FakeContainer:
+        raise NotFound(f"No such container: {name}")
+
+    def list(self, all: bool = False, filters: dict | None = None) -> list:
+        return []
+
+    def create(self, image: str, name: str | None = None, **kwargs) -> FakeContainer:
+        return FakeContainer(self.archive)
+
+
+class FakeImages:
+    def __init__(self, digest: str) -> None:
+        self.digest = digest
+
+    def get(self, name: str) -> None:
+        raise ImageNotFound(f"No such image: {name}")
+
+    def get_registry_data(self, name: str) -> SimpleNamespace:
+        return SimpleNamespace(id=self.digest)
+
+    def remove(self, image: str, **kwargs) -> None:
+        pass
+
+
+class FakeAPI:
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.timeout = None
+
+    def pull(self, repository: str, tag: str | None = None, **kwargs) -> Iterator[dict]:
+        """Yields the events of a streaming pull, one layer per `LAYER_SIZE` bytes."""
+        layers = max(-(-self.size // LAYER_SIZE), 1)
+
+        for i in range(layers):
+            layer = f"{i:012x}"
+            total = min(LAYER_SIZE, self.size - i * LAYER_SIZE) or 1
+
+            for current in range(0, total, ARCHIVE_CHUNK_SIZE):
+                yield {
+                    "id": layer,
+                    "status": "Downloading",
+                    "progressDetail": {"current": current, "total": total},
+                }
+
+            yield {"id": layer, "status": "Download complete"}
+            yield {"id": layer, "status": "Extracting"}
+            yield {"id": layer, "status": "Pull complete"}
+
+        yield {"status": f"Status: Downloaded newer image for {repository}:{tag}"}
+
+
+class FakeDockerClient:
+    """
+    An in-process stand-in for `docker.DockerClient` with just enough of its API for the `init` command. Serves a synthetic template of `size` bytes, so benchmarks run without a daemon or network.
+    """
+
+    def __init__(self, size: int, files: int = 200) -> None:
+        self.archive = synthetic_template(size, files)
+        self.api = FakeAPI(size)
+        self.containers = FakeContainers(self.archive)
+        self.images = FakeImages(f"sha256:{'0' * 64}")
+
+    def ping(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
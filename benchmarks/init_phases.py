@@ -0,0 +1,112 @@
+import importlib.util
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+from unittest.mock import patch
+
+from rich.progress import Progress
+
+from benchmarks.engine import FakeDockerClient
+from benchmarks.results import BenchmarkResult
+from zentra_sdk.cli.builder.cache import TemplateCache
+from zentra_sdk.cli.builder.client import docker_connection
+from zentra_sdk.cli.builder.docker import DockerBuilder
+from zentra_sdk.cli.commands.setup import SetupTasks
+from zentra_sdk.cli.constants import DOCKER_FRONTEND_DETAILS, ProjectPaths
+
+
+@contextmanager
+def fake_docker(size: int, files: int) -> Iterator[FakeDockerClient]:
+    """Makes the shared Docker connection use a fake engine."""
+    client = FakeDockerClient(size, files)
+
+    with patch("docker.from_env", return_value=client):
+        docker_connection.reset()
+        try:
+            yield client
+        finally:
+            docker_connection.reset()
+
+
+@contextmanager
+def project_dir() -> Iterator[Path]:
+    """Creates an empty project directory and makes it the working directory."""
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory(prefix="zentra-bench-") as tmp:
+        os.chdir(tmp)
+        try:
+            yield Path(tmp)
+        finally:
+            os.chdir(cwd)
+
+
+class PhaseTimer:
+    """Collects the time of each call to a phase across repeats."""
+
+    def __init__(self) -> None:
+        self.samples: dict[str, list[float]] = {}
+
+    def time(self, name: str, func: Callable, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.samples.setdefault(name, []).append(time.perf_counter() - start)
+        return result
+
+    def medians(self) -> dict[str, float]:
+        return {name: statistics.median(s) for name, s in self.samples.items()}
+
+
+def docker_steps(timer: PhaseTimer, root: Path) -> None:
+    """Times each `DockerBuilder` step."""
+    builder = DockerBuilder(**DOCKER_FRONTEND_DETAILS)
+    progress = Progress(disable=True)
+
+    timer.time("docker.pull", builder.pull, progress)
+    timer.time("docker.remove_stale", builder.remove_stale)
+    container = timer.time("docker.create", builder.create)
+    timer.time(
+        "docker.copy", builder.copy, container, "/frontend", Path(root, "docker")
+    )
+    timer.time("docker.cleanup", builder.cleanup, container)
+
+
+def setup_phases(timer: PhaseTimer, root: Path) -> None:
+    """Times each `SetupTasks` phase, in the order `zentra init` runs them."""
+    tasks = SetupTasks(ProjectPaths(root), test_logging=True)
+    tasks.progress = Progress(disable=True)
+    tasks.template_cache = TemplateCache(root=Path(root, ".cache"))
+
+    if importlib.util.find_spec("zentra_api") is not None:
+        timer.time("setup.build_backend", tasks._build_backend)
+
+    timer.time("setup.build_frontend", tasks._build_frontend)
+    shutil.rmtree(tasks.paths.FRONTEND_PATH)
+    timer.time("setup.build_frontend_cached", tasks._build_frontend)
+
+    timer.time("setup.remove_files", tasks._remove_files)
+    timer.time("setup.move_files", tasks._move_files)
+
+
+def run(size: int, files: int = 200, repeat: int = 5) -> BenchmarkResult:
+    """
+    Runs the `init` benchmarks against a fake Docker engine serving a template of `size` bytes. Each phase is reported as its median over `repeat` runs.
+
+    `setup.build_backend` is only timed when the `zentra-api` command is installed.
+    """
+    timer = PhaseTimer()
+
+    with fake_docker(size, files):
+        for _ in range(repeat):
+            with project_dir() as root:
+                docker_steps(timer, root)
+                setup_phases(timer, root)
+
+    return BenchmarkResult(
+        size=size, files=files, repeat=repeat, phases=timer.medians()
+    )
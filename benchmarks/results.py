@@ -0,0 +1,62 @@
+import json
+import platform
+import time
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+# Differences below this many seconds are treated as noise
+NOISE_FLOOR = 0.005
+
+
+class BenchmarkResult(BaseModel):
+    """The median time of each benchmarked phase, along with the settings it ran with."""
+
+    size: int
+    files: int
+    repeat: int
+    python: str = Field(default_factory=platform.python_version)
+    created: float = Field(default_factory=time.time)
+    phases: dict[str, float] = Field(default_factory=dict)
+
+    def save(self, path: Path) -> None:
+        """Writes the result to a JSON file."""
+        Path(path).write_text(json.dumps(self.model_dump(), indent=2))
+
+    @classmethod
+    def load(cls, path: Path) -> "BenchmarkResult":
+        """Reads a result from a JSON file."""
+        return cls(**json.loads(Path(path).read_text()))
+
+
+class Regression(BaseModel):
+    """A phase that got slower than its baseline by more than the threshold."""
+
+    phase: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1
+
+
+def compare(
+    baseline: BenchmarkResult,
+    current: BenchmarkResult,
+    threshold: float = 0.2,
+) -> list[Regression]:
+    """Returns the phases that regressed past the `threshold`, as a fraction of the baseline time."""
+    regressions = []
+
+    for phase, seconds in current.phases.items():
+        before = baseline.phases.get(phase)
+        if not before:
+            continue
+
+        if seconds - before > NOISE_FLOOR and seconds > before * (1 + threshold):
+            regressions.append(
+                Regression(phase=phase, baseline=before, current=seconds)
+            )
+
+    return regressions
@@ -0,0 +1,71 @@
+import io
+import tarfile
+from pathlib import Path
+
+from benchmarks.engine import FakeDockerClient, synthetic_template
+from benchmarks.init_phases import fake_docker, run
+from benchmarks.results import BenchmarkResult, compare
+from zentra_sdk.cli.builder.docker import DockerBuilder
+from zentra_sdk.cli.constants import DOCKER_FRONTEND_DETAILS
+
+MB = 1024**2
+
+
+def result(**phases: float) -> BenchmarkResult:
+    return BenchmarkResult(size=MB, files=10, repeat=1, phases=phases)
+
+
+class TestSyntheticTemplate:
+    @staticmethod
+    def test_size():
+        archive = synthetic_template(MB, files=10)
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            sizes = [m.size for m in tar.getmembers() if "/src/" in m.name]
+
+        assert len(sizes) == 10
+        assert sum(sizes) == MB
+
+
+class TestFakeDockerClient:
+    @staticmethod
+    def test_use(tmp_path):
+        with fake_docker(MB, files=10) as client:
+            stats = DockerBuilder(**DOCKER_FRONTEND_DETAILS).use(
+                "/frontend", dest=tmp_path
+            )
+
+        assert isinstance(client, FakeDockerClient)
+        assert stats.bytes == MB
+        assert len(list(Path(tmp_path, "frontend", "src").rglob("*.ts"))) == 10
+
+
+class TestCompare:
+    @staticmethod
+    def test_regression():
+        regressions = compare(result(copy=0.1), result(copy=0.2), threshold=0.2)
+
+        assert [r.phase for r in regressions] == ["copy"]
+        assert regressions[0].change == 1.0
+
+    @staticmethod
+    def test_within_threshold():
+        assert compare(result(copy=0.1), result(copy=0.11), threshold=0.2) == []
+
+    @staticmethod
+    def test_noise_floor():
+        assert compare(result(create=0.0001), result(create=0.001)) == []
+
+    @staticmethod
+    def test_new_phase():
+        assert compare(result(), result(copy=0.1)) == []
+
+
+class TestRun:
+    @staticmethod
+    def test_round_trip(tmp_path):
+        current = run(MB, files=10, repeat=1)
+        path = Path(tmp_path, "results.json")
+        current.save(path)
+
+        assert "setup.build_frontend" in current.phases
+        assert BenchmarkResult.load(path) == current
@@ -0,0 +1,53 @@
+import io
+import tarfile
+
+import pytest
+
+from zentra_sdk.cli.builder.archive import ChunkStream, extract_stream
+
+
+@pytest.fixture
+def archive() -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, data in [("frontend/a.txt", b"a" * 5000), ("frontend/b.txt", b"b")]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    return buffer.getvalue()
+
+
+class TestChunkStream:
+    @staticmethod
+    def test_read():
+        stream = ChunkStream(iter([b"ab", b"", b"cde"]))
+        assert stream.read() == b"abcde"
+
+    @staticmethod
+    def test_holds_one_chunk():
+        chunks = iter([b"abc", b"def"])
+        stream = ChunkStream(chunks)
+
+        assert stream.read(2) == b"ab"
+        assert next(chunks) == b"def"
+
+
+class TestExtractStream:
+    @staticmethod
+    def test_extracts_chunks(archive: bytes, tmp_path):
+        chunks = (archive[i : i + 100] for i in range(0, len(archive), 100))
+        extract_stream(chunks, tmp_path)
+
+        assert (tmp_path / "frontend" / "a.txt").read_bytes() == b"a" * 5000
+        assert (tmp_path / "frontend" / "b.txt").read_bytes() == b"b"
+
+    @staticmethod
+    def test_rejects_unsafe_paths(tmp_path):
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            info = tarfile.TarInfo("../outside.txt")
+            tar.addfile(info, io.BytesIO(b""))
+
+        with pytest.raises(tarfile.FilterError):
+            extract_stream([buffer.getvalue()], tmp_path / "dest")
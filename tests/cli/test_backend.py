@@ -0,0 +1,178 @@
+import sys
+import textwrap
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import typer
+
+from zentra_sdk.cli.builder.backend import (
+    BackendInit,
+    LogWriter,
+    capture_thread_output,
+    run_backend_init,
+    worker_pool,
+)
+from zentra_sdk.cli.conf.logger import ErrorLoggers
+from zentra_sdk.cli.constants import CommonErrorCodes
+
+FAKE_API = """
+from pathlib import Path
+import sys
+
+import typer
+
+app = typer.Typer()
+
+
+@app.command()
+def init(name: str, hide_output: bool = typer.Option(False, "--hide-output")):
+    print(f"Creating {name}")
+    print("warning", file=sys.stderr)
+
+    if Path("fail").exists():
+        raise typer.Exit(code=2)
+
+    if Path("exit").exists():
+        sys.exit(Path("exit").read_text() or None)
+
+    Path(name).mkdir()
+
+
+@app.command()
+def new_key():
+    pass
+"""
+
+
+@pytest.fixture
+def fake_api(tmp_path, monkeypatch):
+    package = Path(tmp_path, "site", "zentra_api", "cli")
+    package.mkdir(parents=True)
+    Path(package.parent, "__init__.py").touch()
+    Path(package, "__init__.py").touch()
+    Path(package, "main.py").write_text(textwrap.dedent(FAKE_API))
+
+    monkeypatch.syspath_prepend(str(Path(tmp_path, "site")))
+    project = Path(tmp_path, "project")
+    project.mkdir()
+    monkeypatch.chdir(project)
+
+    yield project
+
+    for name in [m for m in sys.modules if m.startswith("zentra_api")]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def loggers() -> ErrorLoggers:
+    return ErrorLoggers(stdout=MagicMock(), stderr=MagicMock())
+
+
+class TestLogWriter:
+    @staticmethod
+    def test_lines():
+        log = MagicMock()
+        writer = LogWriter(log)
+
+        writer.write("first\nsec")
+        writer.write("ond\n\n")
+        writer.write("partial")
+        writer.close()
+
+        assert [c.args[0] for c in log.call_args_list] == [
+            "first",
+            "second",
+            "partial",
+        ]
+
+
+class TestCaptureThreadOutput:
+    @staticmethod
+    def test_only_current_thread(capsys):
+        log = MagicMock()
+        original = sys.stdout
+
+        with capture_thread_output(LogWriter(log), LogWriter(MagicMock())):
+            print("captured")
+            thread = threading.Thread(target=print, args=("not captured",))
+            thread.start()
+            thread.join()
+
+        assert sys.stdout is original
+        log.assert_called_once_with("captured")
+        assert "not captured" in capsys.readouterr().out
+
+
+class TestRunBackendInit:
+    @staticmethod
+    def test_missing_package(monkeypatch):
+        monkeypatch.setitem(sys.modules, "zentra_api.cli.main", None)
+
+        with pytest.raises(typer.Exit) as excinfo:
+            run_backend_init()
+
+        assert excinfo.value.exit_code == CommonErrorCodes.BACKEND_NOT_INSTALLED
+
+    @staticmethod
+    def test_success(fake_api: Path):
+        assert run_backend_init() == 0
+        assert Path(fake_api, "backend").is_dir()
+
+    @staticmethod
+    def test_failure(fake_api: Path):
+        Path(fake_api, "fail").touch()
+        assert run_backend_init() == 2
+
+    @staticmethod
+    def test_sys_exit(fake_api: Path):
+        Path(fake_api, "exit").touch()
+        assert run_backend_init() == 0
+
+    @staticmethod
+    def test_sys_exit_message(fake_api: Path):
+        Path(fake_api, "exit").write_text("failed")
+        assert run_backend_init() == 1
+
+    @staticmethod
+    def test_usage_error(fake_api: Path):
+        assert run_backend_init(["init"]) == 2
+
+
+class TestBackendInit:
+    @staticmethod
+    def test_in_process(fake_api: Path, loggers: ErrorLoggers):
+        BackendInit(fake_api, loggers).run()
+
+        loggers.stdout.info.assert_any_call("Creating backend")
+        loggers.stderr.error.assert_called_once_with("warning")
+
+    @staticmethod
+    def test_failed(fake_api: Path, loggers: ErrorLoggers):
+        Path(fake_api, "fail").touch()
+
+        with pytest.raises(typer.Exit) as excinfo:
+            BackendInit(fake_api, loggers).run()
+
+        assert excinfo.value.exit_code == CommonErrorCodes.BACKEND_INIT_FAILED
+
+    @staticmethod
+    def test_isolated(fake_api: Path, loggers: ErrorLoggers):
+        backend = BackendInit(fake_api, loggers, isolated=True)
+        backend.run()
+
+        assert Path(fake_api, "backend").is_dir()
+        loggers.stdout.info.assert_any_call("Creating backend")
+        assert backend._executor is None
+
+    @staticmethod
+    def test_shared_executor(fake_api: Path, loggers: ErrorLoggers):
+        executor = worker_pool()
+
+        try:
+            BackendInit(fake_api, loggers, executor=executor).run()
+            assert Path(fake_api, "backend").is_dir()
+            assert executor.submit(int, "1").result() == 1
+        finally:
+            executor.shutdown()
@@ -0,0 +1,137 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from zentra_sdk.cli.commands.batch import BatchSetup, BatchSpec, write_env
+from zentra_sdk.cli.commands.setup import SetupTasks
+from zentra_sdk.cli.constants import CommonErrorCodes, SetupSuccessCodes
+
+SPEC = """
+workers = 2
+offline = true
+
+[[projects]]
+path = "one"
+
+[[projects]]
+path = "two"
+env = { NEXT_PUBLIC_API_URL = "http://localhost:9000" }
+"""
+
+
+@pytest.fixture
+def spec_file(tmp_path) -> Path:
+    path = Path(tmp_path, "projects.toml")
+    path.write_text(SPEC)
+    return path
+
+
+def fake_frontend(self: SetupTasks) -> None:
+    self.paths.FRONTEND_PATH.mkdir(parents=True)
+    Path(self.paths.FRONTEND_PATH, "package.json").write_text("{}")
+
+
+def fake_backend(self) -> None:
+    Path(self.root, "backend").mkdir()
+    self.close()
+
+
+class TestBatchSpec:
+    @staticmethod
+    def test_toml(spec_file: Path):
+        spec = BatchSpec.load(spec_file)
+
+        assert spec.workers == 2
+        assert spec.offline
+        assert [p.path for p in spec.projects] == [
+            Path(spec_file.parent, "one"),
+            Path(spec_file.parent, "two"),
+        ]
+        assert spec.projects[1].env == {"NEXT_PUBLIC_API_URL": "http://localhost:9000"}
+
+    @staticmethod
+    def test_json(tmp_path):
+        path = Path(tmp_path, "projects.json")
+        path.write_text(json.dumps({"projects": [{"path": "/abs/app"}]}))
+
+        spec = BatchSpec.load(path)
+        assert spec.projects[0].path == Path("/abs/app")
+        assert spec.workers is None
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "content", ["projects = 1", "not toml [", "[[projects]]\nname = 'x'"]
+    )
+    def test_invalid(tmp_path, content: str):
+        path = Path(tmp_path, "projects.toml")
+        path.write_text(content)
+
+        with pytest.raises(typer.Exit) as excinfo:
+            BatchSpec.load(path)
+
+        assert excinfo.value.exit_code == CommonErrorCodes.INVALID_SPEC
+
+    @staticmethod
+    def test_missing(tmp_path):
+        with pytest.raises(typer.Exit) as excinfo:
+            BatchSpec.load(Path(tmp_path, "missing.toml"))
+
+        assert excinfo.value.exit_code == CommonErrorCodes.INVALID_SPEC
+
+
+class TestWriteEnv:
+    @staticmethod
+    def test_replace_and_add(tmp_path):
+        path = Path(tmp_path, ".env.local")
+        path.write_text("# comment\nA=1\nB=2\n")
+
+        write_env(path, {"B": "3", "C": "4"})
+        assert path.read_text() == "# comment\nA=1\nB=3\nC=4\n"
+
+
+class TestBatchSetup:
+    @staticmethod
+    @pytest.fixture
+    def batch(spec_file: Path):
+        with (
+            patch.object(SetupTasks, "_build_frontend", fake_frontend),
+            patch("zentra_sdk.cli.commands.batch.BackendInit.run", fake_backend),
+            patch("zentra_sdk.cli.commands.batch.worker_pool") as pool,
+        ):
+            yield BatchSetup(spec_file, test_logging=True), pool
+
+    @staticmethod
+    def test_creates_projects(batch, spec_file: Path):
+        setup, pool = batch
+
+        with pytest.raises(typer.Exit) as excinfo:
+            setup.build()
+
+        assert excinfo.value.exit_code == SetupSuccessCodes.BATCH_COMPLETE
+        pool.assert_called_once_with(2)
+
+        for name in ["one", "two"]:
+            root = Path(spec_file.parent, name)
+            assert Path(root, "backend").is_dir()
+            assert Path(root, "frontend", "package.json").is_file()
+            assert Path(root, "frontend", ".env.local").is_file()
+
+        env = Path(spec_file.parent, "two", "frontend", ".env.local").read_text()
+        assert "NEXT_PUBLIC_API_URL=http://localhost:9000" in env
+
+    @staticmethod
+    def test_existing_project_fails(batch, spec_file: Path):
+        setup, _ = batch
+        existing = Path(spec_file.parent, "one", "frontend")
+        existing.mkdir(parents=True)
+        Path(existing, "page.tsx").touch()
+
+        with pytest.raises(typer.Exit) as excinfo:
+            setup.build()
+
+        assert excinfo.value.exit_code == CommonErrorCodes.BATCH_FAILED
+        assert not Path(spec_file.parent, "one", "backend").exists()
+        assert Path(spec_file.parent, "two", "backend").is_dir()
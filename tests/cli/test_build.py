@@ -0,0 +1,193 @@
+import os
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import pytest
+import typer
+
+from docker.errors import ImageNotFound
+
+from zentra_sdk.cli.commands.build import Build, BuildTasks, image_tag, package_manager
+from zentra_sdk.cli.constants import (
+    BuildErrorCodes,
+    BuildSuccessCodes,
+    CommonErrorCodes,
+    ProjectPaths,
+)
+
+
+@pytest.fixture
+def mock_docker():
+    with patch("docker.from_env") as mock:
+        yield mock
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    (tmp_path / "zentra.root").touch()
+    (tmp_path / "backend").mkdir()
+    (tmp_path / "frontend").mkdir()
+
+    original_cwd = os.getcwd()
+    os.chdir(tmp_path)
+    yield tmp_path
+    os.chdir(original_cwd)
+
+
+@pytest.mark.parametrize(
+    "lockfile, expected",
+    [
+        ("bun.lockb", "bun"),
+        ("pnpm-lock.yaml", "pnpm"),
+        ("yarn.lock", "yarn"),
+        (None, "npm"),
+    ],
+)
+def test_package_manager(tmp_path, lockfile, expected):
+    if lockfile:
+        (tmp_path / lockfile).touch()
+
+    assert package_manager(tmp_path) == expected
+
+
+def test_image_tag():
+    assert image_tag(Path("/projects/My Project"), "backend") == (
+        "my-project-backend:latest"
+    )
+
+
+class TestBuild:
+    @staticmethod
+    def test_project_not_found(tmp_path):
+        original_cwd = os.getcwd()
+        os.chdir(tmp_path)
+
+        try:
+            with pytest.raises(typer.Exit) as excinfo:
+                Build()
+        finally:
+            os.chdir(original_cwd)
+
+        assert excinfo.value.exit_code == CommonErrorCodes.PROJECT_NOT_FOUND
+
+    @staticmethod
+    def test_finds_root(mock_docker, project: Path):
+        os.chdir(project / "frontend")
+        assert Build().paths.ROOT == project
+
+    @staticmethod
+    def test_build(mock_docker, project: Path):
+        builder = Build()
+        with patch.object(BuildTasks, "_build_backend"), patch.object(
+            BuildTasks, "_build_frontend"
+        ):
+            with pytest.raises(typer.Exit) as excinfo:
+                builder.build()
+
+        assert excinfo.value.exit_code == BuildSuccessCodes.COMPLETE
+
+    @staticmethod
+    def test_records_manifest(mock_docker, project: Path):
+        builder = Build()
+        with patch.object(BuildTasks, "_build_backend"), patch.object(
+            BuildTasks, "_build_frontend"
+        ):
+            with pytest.raises(typer.Exit):
+                builder.build()
+
+        assert set(builder.manifest.load()) == {"backend", "frontend"}
+
+    @staticmethod
+    def test_skips_unchanged(mock_docker, project: Path):
+        (project / "frontend" / ".next").mkdir()
+        builder = Build()
+        builder.manifest.save(builder.hash_inputs())
+
+        with patch.object(BuildTasks, "_build_backend") as backend, patch.object(
+            BuildTasks, "_build_frontend"
+        ) as frontend:
+            with pytest.raises(typer.Exit):
+                builder.build()
+
+        backend.assert_not_called()
+        frontend.assert_not_called()
+
+    @staticmethod
+    def test_rebuilds_changed(mock_docker, project: Path):
+        (project / "frontend" / ".next").mkdir()
+        builder = Build()
+        builder.manifest.save(builder.hash_inputs())
+        (project / "frontend" / "page.tsx").write_text("export default {}")
+
+        assert builder.unchanged(builder.hash_inputs()) == {"backend"}
+
+    @staticmethod
+    def test_rebuilds_missing_artifact(mock_docker, project: Path):
+        mock_docker.return_value.images.get.side_effect = ImageNotFound("missing")
+        builder = Build()
+        builder.manifest.save(builder.hash_inputs())
+
+        assert builder.unchanged(builder.hash_inputs()) == set()
+
+    @staticmethod
+    def test_force(mock_docker, project: Path):
+        (project / "frontend" / ".next").mkdir()
+        builder = Build(force=True)
+        builder.manifest.save(builder.hash_inputs())
+
+        assert builder.unchanged(builder.hash_inputs()) == set()
+
+
+class TestBuildTasks:
+    @pytest.fixture
+    def build_tasks(self, project: Path) -> BuildTasks:
+        return BuildTasks(ProjectPaths(project), test_logging=True)
+
+    @staticmethod
+    def test_backend_no_dockerfile(build_tasks: BuildTasks):
+        with pytest.raises(typer.Exit) as excinfo:
+            build_tasks._build_backend()
+
+        assert excinfo.value.exit_code == BuildErrorCodes.BACKEND_FAILED
+
+    @staticmethod
+    def test_backend(mock_docker, build_tasks: BuildTasks):
+        (build_tasks.paths.BACKEND_PATH / "Dockerfile").touch()
+        api = mock_docker.return_value.api
+        api.build.return_value = iter([{"stream": "Step 1/2\n"}, {"stream": "\n"}])
+        build_tasks.backend_output = MagicMock()
+
+        build_tasks._build_backend()
+
+        build_tasks.backend_output.write.assert_called_once_with("Step 1/2")
+        assert api.build.call_args.kwargs["tag"].endswith("-backend:latest")
+
+    @staticmethod
+    def test_backend_error(mock_docker, build_tasks: BuildTasks):
+        (build_tasks.paths.BACKEND_PATH / "Dockerfile").touch()
+        mock_docker.return_value.api.build.return_value = iter([{"error": "failed"}])
+
+        with pytest.raises(typer.Exit) as excinfo:
+            build_tasks._build_backend()
+
+        assert excinfo.value.exit_code == BuildErrorCodes.BACKEND_FAILED
+
+    @staticmethod
+    def test_frontend_installs_first(build_tasks: BuildTasks):
+        with patch(
+            "zentra_sdk.cli.commands.build.run_streamed", return_value=0
+        ) as mock_run:
+            build_tasks._build_frontend()
+
+        commands = [call.args[0] for call in mock_run.call_args_list]
+        assert commands == [["npm", "install"], ["npm", "run", "build"]]
+
+    @staticmethod
+    def test_frontend_failed(build_tasks: BuildTasks):
+        (build_tasks.paths.FRONTEND_PATH / "node_modules").mkdir()
+
+        with patch("zentra_sdk.cli.commands.build.run_streamed", return_value=1):
+            with pytest.raises(typer.Exit) as excinfo:
+                build_tasks._build_frontend()
+
+        assert excinfo.value.exit_code == BuildErrorCodes.FRONTEND_FAILED
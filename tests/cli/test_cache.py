@@ -0,0 +1,81 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from zentra_sdk.cli.builder.cache import TemplateCache, dir_size
+
+
+@pytest.fixture
+def template(tmp_path) -> Path:
+    path = tmp_path / "project" / "frontend"
+    path.mkdir(parents=True)
+    (path / "package.json").write_text("{}" * 100)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path) -> TemplateCache:
+    return TemplateCache(root=tmp_path / "cache", max_bytes=1024)
+
+
+class TestTemplateCache:
+    @staticmethod
+    def test_miss(cache: TemplateCache, tmp_path):
+        assert cache.get("sha256:missing") is None
+        assert not cache.restore("sha256:missing", tmp_path)
+
+    @staticmethod
+    def test_store_and_restore(cache: TemplateCache, template: Path, tmp_path):
+        cache.store("sha256:abc", template, image="test_image")
+
+        dest = tmp_path / "new_project"
+        assert cache.restore("sha256:abc", dest)
+        assert (dest / "frontend" / "package.json").read_text() == "{}" * 100
+
+    @staticmethod
+    def test_entries(cache: TemplateCache, template: Path):
+        cache.store("sha256:abc", template, image="test_image")
+
+        entries = cache.entries()
+        assert len(entries) == 1
+        assert entries[0].image == "test_image"
+        assert entries[0].size == dir_size(cache.entry_path("sha256:abc"))
+
+    @staticmethod
+    def test_lru_eviction(template: Path, tmp_path):
+        cache = TemplateCache(root=tmp_path / "cache", max_bytes=450)
+        cache.store("sha256:old", template, image="test_image")
+        cache.store("sha256:used", template, image="test_image")
+
+        time.sleep(0.01)
+        cache.get("sha256:old")
+        cache.store("sha256:new", template, image="test_image")
+
+        digests = {entry.digest for entry in cache.entries()}
+        assert digests == {"sha256:old", "sha256:new"}
+        assert not cache.entry_path("sha256:used").exists()
+
+    @staticmethod
+    def test_prune_all(cache: TemplateCache, template: Path):
+        cache.store("sha256:abc", template, image="test_image")
+
+        removed = cache.prune(all=True)
+        assert [entry.digest for entry in removed] == ["sha256:abc"]
+        assert cache.entries() == []
+
+    @staticmethod
+    def test_concurrent_stores_keep_entries(template: Path, tmp_path):
+        digests = [f"sha256:{i}" for i in range(8)]
+
+        def store(digest: str) -> None:
+            # A cache per call, like separate processes sharing the directory
+            cache = TemplateCache(root=tmp_path / "cache", max_bytes=1024**2)
+            cache.store(digest, template, image="test_image")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(store, digests))
+
+        cache = TemplateCache(root=tmp_path / "cache")
+        assert {entry.digest for entry in cache.entries()} == set(digests)
@@ -0,0 +1,64 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+from docker.constants import DEFAULT_TIMEOUT_SECONDS
+from docker.errors import DockerException
+from requests.exceptions import ReadTimeout
+
+from zentra_sdk.cli.builder.client import DockerConnection
+
+
+@pytest.fixture
+def mock_docker():
+    with patch("docker.from_env") as mock:
+        yield mock
+
+
+class TestDockerConnection:
+    @pytest.fixture
+    def connection(self) -> DockerConnection:
+        return DockerConnection(probe_timeout=0.5)
+
+    @staticmethod
+    def test_client_shared(connection: DockerConnection, mock_docker):
+        assert connection.client is connection.client
+        mock_docker.assert_called_once_with(timeout=0.5)
+
+    @staticmethod
+    def test_client_default_timeout(connection: DockerConnection, mock_docker):
+        assert connection.client.api.timeout == DEFAULT_TIMEOUT_SECONDS
+
+    @staticmethod
+    def test_available_cached(connection: DockerConnection, mock_docker):
+        assert connection.available()
+        assert connection.available()
+        mock_docker.return_value.ping.assert_called_once()
+
+    @staticmethod
+    def test_unavailable(connection: DockerConnection, mock_docker):
+        mock_docker.side_effect = DockerException
+        assert not connection.available()
+
+    @staticmethod
+    def test_ping_timeout(connection: DockerConnection, mock_docker):
+        mock_docker.return_value.ping.side_effect = ReadTimeout
+        assert not connection.available()
+
+    @staticmethod
+    def test_probe_uses_short_timeout(connection: DockerConnection, mock_docker):
+        client = MagicMock()
+        client.ping.side_effect = lambda: timeouts.append(client.api.timeout)
+        mock_docker.return_value = client
+        timeouts = []
+
+        connection.available()
+        assert timeouts == [0.5]
+        assert client.api.timeout == DEFAULT_TIMEOUT_SECONDS
+
+    @staticmethod
+    def test_reset(connection: DockerConnection, mock_docker):
+        client = connection.client
+        connection.reset()
+
+        client.close.assert_called_once()
+        assert connection._available is None
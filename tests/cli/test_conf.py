@@ -1,7 +1,11 @@
 import os
+from unittest.mock import patch
+
 import pytest
 
 from zentra_sdk.cli.conf.checks import (
+    ROOT_ENV,
+    RootResolver,
     check_file_exists,
     check_folder_exists,
     zentra_root_path,
@@ -77,3 +81,59 @@ class TestZentraRootPath:
         os.chdir(subdir)
 
         assert zentra_root_path() is None
+
+
+class TestRootResolver:
+    @pytest.fixture
+    def project(self, tmp_path):
+        subdir = tmp_path / "project" / "frontend" / "src"
+        subdir.mkdir(parents=True)
+        (tmp_path / "project" / "zentra.root").touch()
+        return tmp_path / "project"
+
+    @staticmethod
+    def test_memoised(project):
+        resolver = RootResolver()
+        start = project / "frontend" / "src"
+        marker = resolver.resolve(start)
+
+        with patch.object(resolver, "search") as mock_search:
+            assert resolver.resolve(start) == marker
+
+        mock_search.assert_not_called()
+
+    @staticmethod
+    def test_revalidates(project):
+        resolver = RootResolver()
+        start = project / "frontend"
+        resolver.resolve(start).unlink()
+
+        assert resolver.resolve(start) is None
+
+    @staticmethod
+    def test_override(project, tmp_path, monkeypatch):
+        monkeypatch.setenv(ROOT_ENV, str(project))
+        assert RootResolver().resolve(tmp_path) == project / "zentra.root"
+
+    @staticmethod
+    def test_override_missing(tmp_path, monkeypatch):
+        monkeypatch.setenv(ROOT_ENV, str(tmp_path))
+        assert RootResolver().resolve(tmp_path) is None
+
+    @staticmethod
+    def test_stops_at_git_root(project):
+        repo = project / "frontend"
+        (repo / ".git").mkdir()
+
+        assert RootResolver().resolve(repo / "src") is None
+
+    @staticmethod
+    def test_stops_at_device_change(project):
+        resolver = RootResolver()
+        start = str(project / "frontend" / "src")
+
+        def device(path: str) -> int:
+            return 1 if path == start else 2
+
+        with patch.object(resolver, "_device", side_effect=device):
+            assert resolver.resolve(start) is None
@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import pytest
+import typer
+
+from zentra_sdk.cli.conf.config import frontend_details, settings, template_config
+from zentra_sdk.cli.constants import (
+    DOCKER_FRONTEND_DETAILS,
+    TEMPLATE_CACHE_MAX_BYTES,
+    CommonErrorCodes,
+    UserPaths,
+)
+
+CONFIG = """
+[template]
+registry = "registry.example.com"
+tag = "v1"
+digest = "sha256:abc"
+mirrors = ["http://localhost:5000", "mirror.internal:5000"]
+mirror_timeout = 2
+"""
+
+
+@pytest.fixture
+def config_file() -> Path:
+    path = UserPaths().CONFIG_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(CONFIG)
+    return path
+
+
+class TestFrontendDetails:
+    @staticmethod
+    def test_defaults():
+        assert frontend_details() == DOCKER_FRONTEND_DETAILS
+
+    @staticmethod
+    def test_config_file(config_file: Path):
+        details = frontend_details()
+
+        assert details["image_name"] == DOCKER_FRONTEND_DETAILS["image_name"]
+        assert details["registry"] == "registry.example.com"
+        assert details["tag"] == "v1"
+        assert details["image_digest"] == "sha256:abc"
+        assert details["mirrors"] == ["http://localhost:5000", "mirror.internal:5000"]
+        assert details["mirror_timeout"] == 2
+
+    @staticmethod
+    def test_env_overrides(config_file: Path, monkeypatch):
+        monkeypatch.setenv("ZENTRA_TEMPLATE_MIRRORS", "a:5000, b:5000")
+        monkeypatch.setenv("ZENTRA_TEMPLATE_TAG", "v2")
+        monkeypatch.setenv("ZENTRA_KEEP_IMAGE", "false")
+
+        details = frontend_details()
+        assert details["mirrors"] == ["a:5000", "b:5000"]
+        assert details["tag"] == "v2"
+        assert details["fallback_tag"] is None
+        assert details["keep_image"] is False
+        assert details["registry"] == "registry.example.com"
+
+
+class TestInvalidConfig:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "not toml [",
+            "[template]\nmirror_timeout = 'slow'",
+            "[template]\ndigest = 'abc'",
+        ],
+    )
+    def test_file(config_file: Path, content: str):
+        config_file.write_text(content)
+
+        with pytest.raises(typer.Exit) as excinfo:
+            template_config()
+
+        assert excinfo.value.exit_code == CommonErrorCodes.INVALID_CONFIG
+
+
+class TestSettings:
+    @staticmethod
+    def test_defaults():
+        assert settings().cache_max_bytes == TEMPLATE_CACHE_MAX_BYTES
+
+    @staticmethod
+    def test_env(monkeypatch):
+        monkeypatch.setenv("ZENTRA_CACHE_MAX_BYTES", "1024")
+        monkeypatch.setenv("ZENTRA_DOCKER_TIMEOUT", "0.5")
+
+        assert settings().cache_max_bytes == 1024
+        assert settings().docker_timeout == 0.5
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "var, value",
+        [
+            ("ZENTRA_CACHE_MAX_BYTES", "1G"),
+            ("ZENTRA_DOCKER_TIMEOUT", "slow"),
+            ("ZENTRA_LOG_MAX_BYTES", "0"),
+            ("ZENTRA_LOG_BACKUP_COUNT", "-1"),
+        ],
+    )
+    def test_invalid(monkeypatch, var: str, value: str):
+        monkeypatch.setenv(var, value)
+
+        with pytest.raises(typer.Exit) as excinfo:
+            settings()
+
+        assert excinfo.value.exit_code == CommonErrorCodes.INVALID_CONFIG
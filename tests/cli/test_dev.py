@@ -0,0 +1,68 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from zentra_sdk.cli.commands.dev import Dev, read_env
+from zentra_sdk.cli.constants import CommonErrorCodes, DevSuccessCodes
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    (tmp_path / "zentra.root").touch()
+    (tmp_path / "backend").mkdir()
+    (tmp_path / "frontend").mkdir()
+    (tmp_path / "frontend" / "bun.lockb").touch()
+
+    original_cwd = os.getcwd()
+    os.chdir(tmp_path)
+    yield tmp_path
+    os.chdir(original_cwd)
+
+
+def test_read_env(tmp_path):
+    path = tmp_path / ".env.local"
+    path.write_text("# comment\n\nA=1\nB = 'two=2'\n")
+
+    assert read_env(path) == {"A": "1", "B": "two=2"}
+    assert read_env(tmp_path / "missing") == {}
+
+
+class TestDev:
+    @staticmethod
+    def test_project_not_found(tmp_path, monkeypatch):
+        monkeypatch.setenv("ZENTRA_ROOT", str(tmp_path))
+
+        with pytest.raises(typer.Exit) as excinfo:
+            Dev(test_logging=True)
+
+        assert excinfo.value.exit_code == CommonErrorCodes.PROJECT_NOT_FOUND
+
+    @staticmethod
+    def test_services(project: Path):
+        (project / "frontend" / ".env.local").write_text(
+            "BACKEND_CONNECTION_URL=http://localhost:9000/\n"
+        )
+        backend, frontend = Dev(test_logging=True).services()
+
+        assert backend.cmd[-2:] == ["--port", "9000"]
+        assert backend.cwd == project / "backend"
+        assert frontend.cmd == ["bun", "run", "dev"]
+        assert frontend.cwd == project / "frontend"
+
+    @staticmethod
+    def test_default_port(project: Path):
+        backend, _ = Dev(test_logging=True).services()
+        assert backend.cmd[-1] == "8080"
+
+    @staticmethod
+    def test_ctrl_c_stops(project: Path):
+        with patch(
+            "zentra_sdk.cli.commands.dev.Supervisor.run", side_effect=KeyboardInterrupt
+        ):
+            with pytest.raises(typer.Exit) as excinfo:
+                Dev(test_logging=True).run()
+
+        assert excinfo.value.exit_code == DevSuccessCodes.STOPPED
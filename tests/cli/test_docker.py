@@ -1,8 +1,12 @@
+import io
+import tarfile
+
 import pytest
-from unittest import mock
+from docker.errors import DockerException, ImageNotFound, NotFound
 from unittest.mock import patch, MagicMock
 
-from zentra_sdk.cli.builder.docker import DockerBuilder
+from zentra_sdk.cli.builder.docker import DockerBuilder, PullStats, project_run_id
+from zentra_sdk.cli.builder.tasks import TaskCancelled, task_progress
 
 
 class TestDockerBuilder:
@@ -20,56 +24,399 @@ class TestDockerBuilder:
         )
 
     @pytest.fixture
-    def mock_open(self):
-        with patch("builtins.open", mock.mock_open()) as mock_open:
-            yield mock_open
+    def archive_chunks(self) -> list[bytes]:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            data = b"content" * 1000
+            info = tarfile.TarInfo("frontend/test.txt")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
 
-    @pytest.fixture
-    def mock_tarfile(self):
-        with patch("tarfile.open", autospec=True) as mock_tarfile:
-            mock_tarfile_instance = mock_tarfile.return_value
-            mock_tarfile_instance.__enter__.return_value = mock_tarfile_instance
-            mock_tarfile_instance.extractall = MagicMock()
-            yield mock_tarfile_instance
+        archive = buffer.getvalue()
+        return [archive[i : i + 512] for i in range(0, len(archive), 512)]
+
+    @staticmethod
+    def test_digest(docker_builder: DockerBuilder, mock_docker_client):
+        mock_docker_client.images.get_registry_data.return_value.id = "sha256:abc"
+        assert docker_builder.digest() == "sha256:abc"
+
+    @staticmethod
+    def test_digest_unavailable(docker_builder: DockerBuilder, mock_docker_client):
+        mock_docker_client.images.get_registry_data.side_effect = DockerException
+        assert docker_builder.digest() is None
 
     @pytest.fixture
-    def mock_os_remove(self):
-        with patch("os.remove") as mock_remove:
-            yield mock_remove
+    def pull_events(self) -> list[dict]:
+        return [
+            {"status": "Pulling from test_image", "id": "latest"},
+            {"status": "Pulling fs layer", "id": "layer1"},
+            {"status": "Already exists", "id": "layer2"},
+            {
+                "status": "Downloading",
+                "id": "layer1",
+                "progressDetail": {"current": 512, "total": 1024},
+            },
+            {
+                "status": "Downloading",
+                "id": "layer1",
+                "progressDetail": {"current": 1024, "total": 1024},
+            },
+            {"status": "Download complete", "id": "layer1"},
+            {
+                "status": "Extracting",
+                "id": "layer1",
+                "progressDetail": {"current": 1024, "total": 1024},
+            },
+            {"status": "Pull complete", "id": "layer1"},
+            {"status": "Digest: sha256:abc"},
+        ]
+
+    @staticmethod
+    def test_pull(docker_builder: DockerBuilder, mock_docker_client, pull_events):
+        mock_docker_client.api.pull.return_value = iter(pull_events)
+        progress = task_progress()
+
+        stats = docker_builder.pull(progress)
+
+        mock_docker_client.api.pull.assert_called_once_with(
+            "test_image", tag="latest", stream=True, decode=True
+        )
+        assert stats.layers == 2
+        assert stats.bytes == 1024
+        assert len(progress.tasks) == 2
+        assert all(task.finished for task in progress.tasks)
 
     @staticmethod
-    def test_pull(docker_builder: DockerBuilder, mock_docker_client):
-        docker_builder.pull()
-        mock_docker_client.images.pull.assert_called_once_with("test_image:latest")
+    def test_pull_error(docker_builder: DockerBuilder, mock_docker_client):
+        mock_docker_client.api.pull.return_value = iter([{"error": "not found"}])
+
+        with pytest.raises(DockerException):
+            docker_builder.pull()
 
     @staticmethod
-    def test_run(docker_builder: DockerBuilder, mock_docker_client):
+    def test_pull_mirror_fallback(mock_docker_client, pull_events, registry_server):
+        host, port = registry_server.server_address
+        builder = DockerBuilder(
+            image_name="test_image",
+            container_name="test_container",
+            tag="v1",
+            mirrors=["http://127.0.0.1:1", f"http://{host}:{port}"],
+            mirror_timeout=1,
+        )
+        mock_docker_client.api.pull.side_effect = [
+            iter([{"error": "mirror broken"}]),
+            iter(pull_events),
+        ]
+
+        stats = builder.pull(task_progress())
+
+        pulls = [c.args[0] for c in mock_docker_client.api.pull.call_args_list]
+        assert pulls == [f"{host}:{port}/test_image", "test_image"]
+        assert stats.layers == 2
+        mock_docker_client.api.tag.assert_not_called()
+
+    @staticmethod
+    def test_pull_mirror_retags(mock_docker_client, pull_events, registry_server):
+        host, port = registry_server.server_address
+        builder = DockerBuilder(
+            image_name="test_image",
+            container_name="test_container",
+            registry="registry.example.com",
+            mirrors=[f"http://{host}:{port}"],
+        )
+        mock_docker_client.api.pull.return_value = iter(pull_events)
+
+        builder.pull(task_progress())
+
+        mirror_image = f"{host}:{port}/test_image:latest"
+        mock_docker_client.api.tag.assert_called_once_with(
+            mirror_image, "registry.example.com/test_image", "latest"
+        )
+        mock_docker_client.images.remove.assert_called_once_with(mirror_image)
+        assert builder.image == "registry.example.com/test_image:latest"
+
+    @staticmethod
+    def test_pull_all_sources_fail(docker_builder: DockerBuilder, mock_docker_client):
+        docker_builder.mirrors = ["http://127.0.0.1:1"]
+        mock_docker_client.api.pull.return_value = iter([{"error": "not found"}])
+
+        with pytest.raises(DockerException):
+            docker_builder.pull()
+
+    @staticmethod
+    def test_pinned_digest(mock_docker_client, pull_events):
+        builder = DockerBuilder(
+            image_name="test_image",
+            container_name="test_container",
+            image_digest="sha256:abc",
+        )
+        mock_docker_client.api.pull.return_value = iter(pull_events)
+
+        assert builder.digest() == "sha256:abc"
+        builder.pull(task_progress())
+
+        mock_docker_client.images.get_registry_data.assert_not_called()
+        mock_docker_client.api.pull.assert_called_once_with(
+            "test_image", tag="sha256:abc", stream=True, decode=True
+        )
+        mock_docker_client.api.tag.assert_called_once_with(
+            "test_image@sha256:abc", "test_image", "latest"
+        )
+        mock_docker_client.images.remove.assert_not_called()
+
+    @staticmethod
+    def test_use_skips_current_image(
+        docker_builder: DockerBuilder, mock_docker_client, tmp_path
+    ):
+        mock_docker_client.images.get_registry_data.return_value.id = "sha256:abc"
+        mock_docker_client.images.get.return_value.attrs = {
+            "RepoDigests": ["test_image@sha256:abc"]
+        }
+        mock_container = mock_docker_client.containers.create.return_value
+
+        with patch.object(DockerBuilder, "copy"):
+            stats = docker_builder.use("/frontend", dest=tmp_path)
+
+        assert stats.up_to_date
+        assert "up to date" in stats.summary()
+        mock_docker_client.api.pull.assert_not_called()
+        mock_docker_client.images.get_registry_data.assert_called_once()
+        mock_container.remove.assert_called_once_with(force=True)
+
+    @staticmethod
+    def test_up_to_date_pinned(mock_docker_client):
+        builder = DockerBuilder(
+            image_name="test_image",
+            container_name="test_container",
+            image_digest="sha256:abc",
+        )
+        mock_docker_client.images.get.return_value.attrs = {
+            "RepoDigests": ["mirror:5000/test_image@sha256:abc"]
+        }
+
+        assert builder.up_to_date()
+        mock_docker_client.images.get.assert_called_once_with("test_image:latest")
+        mock_docker_client.images.get_registry_data.assert_not_called()
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "error, digests",
+        [(None, ["test_image@sha256:old"]), (ImageNotFound("missing"), [])],
+    )
+    def test_not_up_to_date(
+        docker_builder: DockerBuilder, mock_docker_client, error, digests
+    ):
+        mock_docker_client.images.get_registry_data.return_value.id = "sha256:new"
+        mock_docker_client.images.get.side_effect = error
+        mock_docker_client.images.get.return_value.attrs = {"RepoDigests": digests}
+
+        assert not docker_builder.up_to_date()
+
+    @staticmethod
+    def test_digest_looked_up_once(docker_builder: DockerBuilder, mock_docker_client):
+        mock_docker_client.images.get_registry_data.return_value.id = "sha256:abc"
+
+        assert docker_builder.digest() == docker_builder.digest() == "sha256:abc"
+        mock_docker_client.images.get_registry_data.assert_called_once()
+
+    @staticmethod
+    def test_fallback_tag(mock_docker_client):
+        builder = DockerBuilder(
+            image_name="test_image",
+            container_name="test_container",
+            tag="template",
+            fallback_tag="latest",
+        )
+        mock_docker_client.images.get_registry_data.side_effect = NotFound("missing")
+        mock_docker_client.images.get.side_effect = ImageNotFound("missing")
+
+        builder.resolve_tag()
+
+        assert builder.image == "test_image:latest"
+
+    @staticmethod
+    def test_fallback_tag_unused(mock_docker_client):
+        builder = DockerBuilder(
+            image_name="test_image",
+            container_name="test_container",
+            tag="template",
+            fallback_tag="latest",
+        )
+        mock_docker_client.images.get_registry_data.side_effect = NotFound("missing")
+
+        # A local copy is used even when the registry can't be reached
+        builder.resolve_tag()
+
+        assert builder.image == "test_image:template"
+
+    @staticmethod
+    def test_keep_tags(mock_docker_client):
+        def builder(tag: str, **kwargs) -> DockerBuilder:
+            return DockerBuilder(
+                image_name="test_image",
+                container_name="test_container",
+                tag=tag,
+                keep_tags=["template"],
+                **kwargs,
+            )
+
+        assert builder("template").keeps_image
+        assert not builder("warm").keeps_image
+        assert builder("warm", keep_image=True).keeps_image
+        assert not builder("template", keep_image=False).keeps_image
+
+    @staticmethod
+    def test_cleanup_keep_image(mock_docker_client):
+        builder = DockerBuilder(
+            image_name="test_image", container_name="test_container", keep_image=True
+        )
+        mock_container = MagicMock()
+        builder.cleanup(mock_container)
+
+        mock_container.remove.assert_called_once_with(force=True)
+        mock_docker_client.images.remove.assert_not_called()
+
+    @staticmethod
+    def test_pull_stats_summary():
+        stats = PullStats(
+            layers=2, bytes=10 * 1024**2, duration=6, download_time=5, extract_time=1
+        )
+
+        assert stats.throughput == 2
+        assert "10.0 MB" in stats.summary()
+
+    @staticmethod
+    def test_create(docker_builder: DockerBuilder, mock_docker_client):
         mock_container = MagicMock()
-        mock_docker_client.containers.run.return_value = mock_container
-        container = docker_builder.run()
+        mock_docker_client.containers.create.return_value = mock_container
+        container = docker_builder.create()
 
         assert container == mock_container
-        mock_docker_client.containers.run.assert_called_once_with(
-            "test_image:latest", name="test_container", detach=True
+        mock_docker_client.containers.create.assert_called_once_with(
+            "test_image:latest",
+            command=["/template"],
+            name=f"test_container-{docker_builder.run_id}",
+            labels={
+                "dev.zentra.container": "test_container",
+                "dev.zentra.run": docker_builder.run_id,
+            },
         )
+        mock_container.start.assert_not_called()
 
     @staticmethod
-    def test_copy(
-        docker_builder: DockerBuilder, mock_open, mock_tarfile, mock_os_remove
-    ):
+    def test_run_ids_unique(mock_docker_client):
+        first, second = (
+            DockerBuilder(image_name="test_image", container_name="test_container")
+            for _ in range(2)
+        )
+        assert first.run_container_name != second.run_container_name
+
+    @staticmethod
+    def test_project_run_id(tmp_path):
+        assert project_run_id(tmp_path) == project_run_id(tmp_path / ".")
+        assert project_run_id(tmp_path / "a") != project_run_id(tmp_path / "b")
+
+    @staticmethod
+    def test_copy(docker_builder: DockerBuilder, archive_chunks, tmp_path):
+        mock_container = MagicMock()
+        mock_container.get_archive.return_value = (iter(archive_chunks), None)
+
+        docker_builder.copy(mock_container, "test_path", dest=tmp_path)
+
+        assert (tmp_path / "frontend" / "test.txt").read_bytes() == b"content" * 1000
+        assert list(tmp_path.iterdir()) == [tmp_path / "frontend"]
+
+    @staticmethod
+    def test_merge(docker_builder: DockerBuilder, archive_chunks, tmp_path):
         mock_container = MagicMock()
-        mock_container.get_archive.return_value = (iter([b"data"]), None)
+        mock_container.get_archive.return_value = (iter(archive_chunks), None)
+        cache = tmp_path / "cache"
+        cache.mkdir()
+        (cache / "existing.txt").write_text("kept")
+
+        docker_builder.merge(mock_container, "/frontend", cache)
+
+        assert (cache / "test.txt").read_bytes() == b"content" * 1000
+        assert (cache / "existing.txt").read_text() == "kept"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["cache"]
+
+    @staticmethod
+    def test_cancel_stops_copy(docker_builder: DockerBuilder, archive_chunks, tmp_path):
+        def chunks():
+            yield archive_chunks[0]
+            docker_builder.cancel()
+            yield from archive_chunks[1:]
+
+        mock_container = MagicMock()
+        mock_container.get_archive.return_value = (chunks(), None)
+
+        with pytest.raises(TaskCancelled):
+            docker_builder.copy(mock_container, "test_path", dest=tmp_path)
+
+    @staticmethod
+    def test_cancel_removes_container(
+        docker_builder: DockerBuilder, mock_docker_client, archive_chunks, tmp_path
+    ):
+        mock_container = mock_docker_client.containers.create.return_value
+        mock_container.get_archive.side_effect = lambda **kwargs: (
+            docker_builder.cancel(),
+            (iter(archive_chunks), None),
+        )[1]
+        mock_container.remove.side_effect = [None, NotFound("removed")]
+
+        with patch.object(DockerBuilder, "pull"):
+            with pytest.raises(TaskCancelled):
+                docker_builder.use("/frontend", dest=tmp_path)
+
+        assert mock_container.remove.call_count == 2
 
-        docker_builder.copy(mock_container, "test_path")
+    @staticmethod
+    def test_tag(mock_docker_client):
+        builder = DockerBuilder(
+            image_name="test_image", container_name="test_container", tag="warm"
+        )
+        builder.create()
+
+        assert (
+            mock_docker_client.containers.create.call_args.args[0] == "test_image:warm"
+        )
+
+    @staticmethod
+    def test_use_cleans_up_on_error(docker_builder: DockerBuilder, mock_docker_client):
+        mock_container = mock_docker_client.containers.create.return_value
+        mock_container.get_archive.side_effect = DockerException
+
+        with patch.object(DockerBuilder, "pull"):
+            with pytest.raises(DockerException):
+                docker_builder.use("/frontend")
+
+        mock_container.remove.assert_called_once_with(force=True)
+
+    @staticmethod
+    def test_remove_stale(docker_builder: DockerBuilder, mock_docker_client):
+        stale = MagicMock()
+        mock_docker_client.containers.list.return_value = [stale]
+
+        docker_builder.remove_stale()
+
+        mock_docker_client.containers.list.assert_called_once_with(
+            all=True, filters={"label": f"dev.zentra.run={docker_builder.run_id}"}
+        )
+        stale.remove.assert_called_once_with(force=True)
+
+    @staticmethod
+    def test_remove_stale_missing(docker_builder: DockerBuilder, mock_docker_client):
+        stale = MagicMock()
+        stale.remove.side_effect = NotFound("missing")
+        mock_docker_client.containers.list.return_value = [stale]
 
-        mock_open.assert_called_once_with("temp.tar", "wb")
-        mock_os_remove.assert_called_once_with("temp.tar")
+        docker_builder.remove_stale()
 
     @staticmethod
     def test_cleanup(docker_builder: DockerBuilder, mock_docker_client):
         mock_container = MagicMock()
         docker_builder.cleanup(mock_container)
 
-        mock_container.stop.assert_called_once()
-        mock_container.remove.assert_called_once()
-        mock_docker_client.images.remove.assert_called_once_with("test_image")
+        mock_container.stop.assert_not_called()
+        mock_container.remove.assert_called_once_with(force=True)
+        mock_docker_client.images.remove.assert_called_once_with("test_image:latest")
@@ -0,0 +1,51 @@
+import pytest
+
+from zentra_sdk.cli.builder.journal import InitJournal
+
+
+class TestInitJournal:
+    @pytest.fixture
+    def journal(self, tmp_path) -> InitJournal:
+        return InitJournal(tmp_path / ".zentra-init.json")
+
+    @staticmethod
+    def test_missing(journal: InitJournal):
+        assert not journal.exists()
+        assert journal.completed() == set()
+
+    @staticmethod
+    def test_record(journal: InitJournal):
+        journal.start()
+        journal.record("build_backend")
+        journal.record("build_frontend")
+
+        assert journal.exists()
+        assert journal.completed() == {"build_backend", "build_frontend"}
+
+    @staticmethod
+    def test_start_keeps_progress(journal: InitJournal):
+        journal.record("build_backend")
+        journal.start()
+
+        assert journal.completed() == {"build_backend"}
+
+    @staticmethod
+    def test_values(journal: InitJournal):
+        journal.start()
+        journal.record("build_frontend", template_version="sha256:abc")
+        journal.record("remove_files", template_version=None)
+
+        assert journal.values() == {"template_version": "sha256:abc"}
+
+    @staticmethod
+    def test_corrupt(journal: InitJournal):
+        journal.path.write_text("{")
+        assert journal.completed() == set()
+        assert journal.values() == {}
+
+    @staticmethod
+    def test_clear(journal: InitJournal):
+        journal.start()
+        journal.clear()
+
+        assert not journal.exists()
@@ -0,0 +1,191 @@
+import gzip
+import hashlib
+import io
+import json
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from zentra_sdk.cli.builder.layers import (
+    ImageArchive,
+    OCILayout,
+    apply_layer,
+    extract_layers,
+)
+from zentra_sdk.cli.builder.snapshot import extract_snapshot
+
+
+def make_layer(files: dict[str, bytes | None]) -> bytes:
+    """Creates a layer tarball. `None` values are added as directories."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            if data is None:
+                info.type = tarfile.DIRTYPE
+                tar.addfile(info)
+            else:
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+
+    return buffer.getvalue()
+
+
+LAYERS = [
+    make_layer(
+        {
+            "etc/": None,
+            "etc/hosts": b"ignored",
+            "frontend/": None,
+            "frontend/package.json": b"{}",
+            "frontend/old.txt": b"old",
+            "frontend/cache/": None,
+            "frontend/cache/a.txt": b"a",
+        }
+    ),
+    make_layer(
+        {
+            "frontend/.wh.old.txt": b"",
+            "frontend/cache/.wh..wh..opq": b"",
+            "frontend/cache/b.txt": b"b",
+            "./frontend/.env": b"env",
+        }
+    ),
+]
+
+
+def write_blob(root: Path, data: bytes) -> str:
+    digest = hashlib.sha256(data).hexdigest()
+    path = root / "blobs" / "sha256" / digest
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return f"sha256:{digest}"
+
+
+@pytest.fixture
+def oci_layout(tmp_path) -> Path:
+    root = tmp_path / "oci"
+    layers = [
+        {
+            "mediaType": "application/vnd.oci.image.layer.v1.tar+gzip",
+            "digest": write_blob(root, gzip.compress(layer)),
+        }
+        for layer in LAYERS
+    ]
+    manifest = write_blob(root, json.dumps({"layers": layers}).encode())
+    index = write_blob(
+        root,
+        json.dumps(
+            {
+                "mediaType": "application/vnd.oci.image.index.v1+json",
+                "manifests": [
+                    {
+                        "mediaType": "application/vnd.oci.image.manifest.v1+json",
+                        "digest": manifest,
+                        "platform": {"os": "linux", "architecture": "amd64"},
+                    }
+                ],
+            }
+        ).encode(),
+    )
+    (root / "index.json").write_text(
+        json.dumps(
+            {
+                "manifests": [
+                    {
+                        "mediaType": "application/vnd.oci.image.index.v1+json",
+                        "digest": index,
+                    }
+                ]
+            }
+        )
+    )
+    return root
+
+
+@pytest.fixture
+def image_archive(tmp_path) -> Path:
+    path = tmp_path / "image.tar"
+    with tarfile.open(path, "w") as tar:
+        names = []
+        for i, layer in enumerate(LAYERS):
+            info = tarfile.TarInfo(f"{i}/layer.tar")
+            info.size = len(layer)
+            tar.addfile(info, io.BytesIO(layer))
+            names.append(info.name)
+
+        manifest = json.dumps([{"Layers": names}]).encode()
+        info = tarfile.TarInfo("manifest.json")
+        info.size = len(manifest)
+        tar.addfile(info, io.BytesIO(manifest))
+
+    return path
+
+
+def assert_frontend(dest: Path) -> None:
+    frontend = dest / "frontend"
+
+    assert (frontend / "package.json").read_bytes() == b"{}"
+    assert (frontend / ".env").read_bytes() == b"env"
+    assert not (frontend / "old.txt").exists()
+    assert sorted(p.name for p in (frontend / "cache").iterdir()) == ["b.txt"]
+    assert not (dest / "etc").exists()
+
+
+class TestExtractLayers:
+    @staticmethod
+    def test_oci_layout(oci_layout: Path, tmp_path):
+        extract_layers(OCILayout(oci_layout), "/frontend", tmp_path / "dest")
+        assert_frontend(tmp_path / "dest")
+
+    @staticmethod
+    def test_image_archive(image_archive: Path, tmp_path):
+        extract_layers(ImageArchive(image_archive), "/frontend", tmp_path / "dest")
+        assert_frontend(tmp_path / "dest")
+
+    @staticmethod
+    def test_extract_snapshot_oci_layout(oci_layout: Path, tmp_path):
+        extract_snapshot(oci_layout, tmp_path / "dest")
+        assert_frontend(tmp_path / "dest")
+
+
+class TestUnsafeLayers:
+    @pytest.fixture
+    def outside(self, tmp_path) -> Path:
+        victim = tmp_path / "outside" / "victim.txt"
+        victim.parent.mkdir()
+        victim.write_text("keep")
+        return victim
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "frontend/../outside/.wh.victim.txt",
+            "frontend/../outside/victim.txt",
+            "frontend/../outside/.wh..wh..opq",
+            "/frontend/package.json",
+        ],
+    )
+    def test_rejects_traversal(outside: Path, tmp_path, name: str):
+        dest = tmp_path / "dest"
+        (dest / "frontend").mkdir(parents=True)
+        layer = make_layer({name: b"x"})
+
+        with pytest.raises(ValueError):
+            apply_layer(io.BytesIO(layer), "frontend", dest)
+
+        assert outside.read_text() == "keep"
+
+    @staticmethod
+    def test_rejects_symlinked_directory(outside: Path, tmp_path):
+        dest = tmp_path / "dest"
+        (dest / "frontend").mkdir(parents=True)
+        (dest / "frontend" / "link").symlink_to(outside.parent)
+        layer = make_layer({"frontend/link/.wh.victim.txt": b""})
+
+        with pytest.raises(ValueError):
+            apply_layer(io.BytesIO(layer), "frontend", dest)
+
+        assert outside.read_text() == "keep"
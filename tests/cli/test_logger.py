@@ -1,10 +1,20 @@
+import gzip
+import json
 import pytest
 import logging
+import threading
+from logging.handlers import QueueHandler
 from unittest import mock
 
 from zentra_sdk.cli.conf.logger import (
+    RUN_ID,
     BaseLogger,
+    BatchFileHandler,
+    ContextFilter,
     DebugLogger,
+    JSONFormatter,
+    LogListener,
+    current_task,
     set_loggers,
     ErrorLoggers,
 )
@@ -117,3 +127,145 @@ class TestSetLoggers:
         assert isinstance(error_loggers, ErrorLoggers)
         assert error_loggers.stdout.logger.name == expected_stdout_name
         assert error_loggers.stderr.logger.name == expected_stderr_name
+
+
+class TestQueuedLogger:
+    @pytest.fixture
+    def listener(self):
+        listener = LogListener(batch_size=8)
+        with mock.patch("zentra_sdk.cli.conf.logger.log_listener", listener):
+            yield listener
+
+        listener.stop()
+
+    @pytest.fixture
+    def queued_logger(self, listener, tmp_path, request) -> DebugLogger:
+        return DebugLogger(
+            logger_name=f"test_queued_{request.node.name}",
+            log_filename="queued.log",
+            log_folder=tmp_path / "logs",
+            active=True,
+            queued=True,
+        )
+
+    @staticmethod
+    def test_lazy_handlers(queued_logger: DebugLogger, tmp_path):
+        assert queued_logger.logger.handlers == []
+        assert not (tmp_path / "logs" / "queued.log").exists()
+
+    @staticmethod
+    def test_only_queue_handler(queued_logger: DebugLogger, listener: LogListener):
+        queued_logger.info("First message")
+
+        handlers = queued_logger.logger.handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], QueueHandler)
+        assert len(listener.handlers[queued_logger.logger.name]) == 1
+
+    @staticmethod
+    def test_writes_batches(queued_logger: DebugLogger, listener: LogListener):
+        for i in range(20):
+            queued_logger.info(f"Message {i}")
+
+        listener.flush()
+        lines = queued_logger.log_filepath.read_text().splitlines()
+
+        assert len(lines) == 20
+        assert lines[-1].endswith("INFO | Message 19")
+
+    @staticmethod
+    def test_threads(queued_logger: DebugLogger, listener: LogListener):
+        def work(n: int):
+            for i in range(50):
+                queued_logger.debug(f"worker {n}: {i}")
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        listener.flush()
+        assert len(queued_logger.log_filepath.read_text().splitlines()) == 200
+
+    @staticmethod
+    def test_stop_flushes(queued_logger: DebugLogger, listener: LogListener):
+        queued_logger.error("Last message")
+        listener.stop()
+
+        assert "Last message" in queued_logger.log_filepath.read_text()
+
+
+class TestStructuredLogs:
+    @staticmethod
+    def make_record(**fields) -> logging.LogRecord:
+        record = logging.LogRecord(
+            "TaskOutputLogger", logging.INFO, __file__, 1, "Hello %s", ("world",), None
+        )
+        record.__dict__.update(fields)
+        return record
+
+    def test_context_filter(self):
+        record = self.make_record()
+        token = current_task.set("build_backend")
+        try:
+            ContextFilter(stream="stdout").filter(record)
+        finally:
+            current_task.reset(token)
+
+        assert record.run_id == RUN_ID
+        assert record.task == "build_backend"
+        assert record.stream == "stdout"
+
+    def test_context_filter_keeps_fields(self):
+        record = self.make_record(task="custom")
+        ContextFilter().filter(record)
+
+        assert record.task == "custom"
+
+    def test_json_formatter(self):
+        record = self.make_record(run_id="abc", task="frontend", exit_code=0)
+        data = json.loads(JSONFormatter().format(record))
+
+        assert data["message"] == "Hello world"
+        assert data["level"] == "INFO"
+        assert data["exit_code"] == 0
+        assert data["task"] == "frontend"
+        assert "duration" not in data
+
+    def test_rotation_compresses(self, tmp_path):
+        path = tmp_path / "task.jsonl"
+        handler = BatchFileHandler(path, maxBytes=200, backupCount=2, delay=True)
+        handler.setFormatter(JSONFormatter())
+
+        for _ in range(10):
+            handler.handle(self.make_record())
+        handler.close()
+
+        rotated = sorted(p.name for p in tmp_path.iterdir())
+        assert rotated == ["task.jsonl", "task.jsonl.1.gz", "task.jsonl.2.gz"]
+
+        with gzip.open(tmp_path / "task.jsonl.1.gz", "rt") as f:
+            assert json.loads(f.readline())["message"] == "Hello world"
+
+    @staticmethod
+    def test_fields(tmp_path):
+        listener = LogListener()
+        with mock.patch("zentra_sdk.cli.conf.logger.log_listener", listener):
+            logger = DebugLogger(
+                "test_structured_fields",
+                log_filename="task.jsonl",
+                log_folder=tmp_path,
+                active=True,
+                queued=True,
+                structured=True,
+                stream="stderr",
+            )
+            logger.error("Failed", exit_code=3, duration=1.5)
+            listener.stop()
+
+        data = json.loads(logger.log_filepath.read_text())
+        assert data["exit_code"] == 3
+        assert data["duration"] == 1.5
+        assert data["stream"] == "stderr"
+        assert data["run_id"] == RUN_ID
@@ -0,0 +1,96 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from zentra_sdk.cli.commands.logs import LogReader
+
+
+def record(time: str, message: str, **fields) -> dict:
+    return {"time": time, "level": "INFO", "message": message, **fields}
+
+
+def write_log(path: Path, records: list[dict], compress: bool = False) -> None:
+    lines = "".join(json.dumps(r) + "\n" for r in records)
+
+    if compress:
+        with gzip.open(path, "wt") as f:
+            f.write(lines)
+    else:
+        path.write_text(lines)
+
+
+@pytest.fixture
+def reader(tmp_path) -> LogReader:
+    write_log(
+        Path(tmp_path, "task_output.jsonl.2.gz"),
+        [record("2024-01-01T00:00:01", "oldest", run_id="aaa111", task="backend")],
+        compress=True,
+    )
+    write_log(
+        Path(tmp_path, "task_output.jsonl.1.gz"),
+        [record("2024-01-01T00:00:03", "older", run_id="aaa111", task="frontend")],
+        compress=True,
+    )
+    write_log(
+        Path(tmp_path, "task_output.jsonl"),
+        [record("2024-01-02T00:00:01", "newest", run_id="bbb222", task="backend")],
+    )
+    write_log(
+        Path(tmp_path, "task_error.jsonl"),
+        [
+            {
+                **record("2024-01-01T00:00:02", "failed", run_id="aaa111"),
+                "level": "ERROR",
+            }
+        ],
+    )
+    return LogReader(tmp_path)
+
+
+class TestLogReader:
+    @staticmethod
+    def test_logs(reader: LogReader):
+        logs = reader.logs()
+
+        assert list(logs) == ["task_error", "task_output"]
+        assert [p.name for p in logs["task_output"]] == [
+            "task_output.jsonl.2.gz",
+            "task_output.jsonl.1.gz",
+            "task_output.jsonl",
+        ]
+
+    @staticmethod
+    def test_missing_folder(tmp_path):
+        assert list(LogReader(Path(tmp_path, "missing")).records()) == []
+
+    @staticmethod
+    def test_time_order(reader: LogReader):
+        messages = [r["message"] for r in reader.records()]
+        assert messages == ["oldest", "failed", "older", "newest"]
+
+    @staticmethod
+    def test_filter_run(reader: LogReader):
+        assert [r["message"] for r in reader.records(run="bbb")] == ["newest"]
+
+    @staticmethod
+    def test_filter_task(reader: LogReader):
+        messages = [r["message"] for r in reader.records(task="backend")]
+        assert messages == ["oldest", "newest"]
+
+    @staticmethod
+    def test_filter_level(reader: LogReader):
+        assert [r["message"] for r in reader.records(level="error")] == ["failed"]
+
+    @staticmethod
+    def test_unknown_level(reader: LogReader):
+        with pytest.raises(ValueError):
+            list(reader.records(level="loud"))
+
+    @staticmethod
+    def test_skips_invalid_lines(tmp_path):
+        Path(tmp_path, "task_output.jsonl").write_text(
+            'not json\n["list"]\n{"time": "1"}\n'
+        )
+        assert list(LogReader(tmp_path).records()) == [{"time": "1"}]
@@ -1,10 +1,22 @@
+import json
+from pathlib import Path
 from unittest.mock import patch
 import pytest
 
 import typer
 from typer.testing import CliRunner
 
+from zentra_sdk.cli.builder.client import docker_connection
+from zentra_sdk.cli.commands.batch import BatchSetup
+from zentra_sdk.cli.commands.build import Build
 from zentra_sdk.cli.commands.setup import Setup
+from zentra_sdk.cli.commands.update import Update
+from zentra_sdk.cli.constants import (
+    BuildSuccessCodes,
+    CommonErrorCodes,
+    UpdateErrorCodes,
+    UpdateSuccessCodes,
+)
 from zentra_sdk.cli.main import app
 
 runner = CliRunner()
@@ -30,3 +42,182 @@ class TestInit:
             result = runner.invoke(app, ["init"])
 
             assert result.exit_code == 0
+
+
+class TestInitFromSpec:
+    @staticmethod
+    def test_returns_after_batch(tmp_path):
+        spec = Path(tmp_path, "projects.toml")
+
+        with (
+            patch.object(BatchSetup, "__init__", return_value=None),
+            patch.object(BatchSetup, "build", return_value=[]) as mock_batch,
+            patch.object(Setup, "build") as mock_setup,
+        ):
+            result = runner.invoke(app, ["init", "--from-spec", str(spec)])
+
+        assert result.exit_code == 0
+        mock_batch.assert_called_once()
+        mock_setup.assert_not_called()
+
+    @staticmethod
+    def test_failure_exit_code(tmp_path):
+        spec = Path(tmp_path, "projects.toml")
+        failed = typer.Exit(code=CommonErrorCodes.BATCH_FAILED)
+
+        with (
+            patch.object(BatchSetup, "__init__", return_value=None),
+            patch.object(BatchSetup, "build", side_effect=failed),
+        ):
+            result = runner.invoke(app, ["init", "--from-spec", str(spec)])
+
+        assert result.exit_code == CommonErrorCodes.BATCH_FAILED.value
+
+    @staticmethod
+    def test_rejects_single_project_flags(tmp_path):
+        spec = Path(tmp_path, "projects.toml")
+
+        with patch.object(BatchSetup, "build") as mock_batch:
+            result = runner.invoke(
+                app, ["init", "--from-spec", str(spec), "--warm", "--isolated"]
+            )
+
+        assert result.exit_code == 2
+        assert "--isolated, --warm" in result.output
+        mock_batch.assert_not_called()
+
+
+class TestBuild:
+    @staticmethod
+    def test_project_not_found(tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(app, ["build"])
+
+        assert result.exit_code == CommonErrorCodes.PROJECT_NOT_FOUND.value
+        assert "Project not found!" in result.stdout
+
+    @staticmethod
+    def test_success():
+        with (
+            patch.object(Build, "__init__", return_value=None),
+            patch.object(
+                Build, "build", side_effect=typer.Exit(code=BuildSuccessCodes.COMPLETE)
+            ),
+        ):
+            result = runner.invoke(app, ["build"])
+
+        assert result.exit_code == 0
+
+
+class TestUpdate:
+    @staticmethod
+    def test_conflicts_exit_code():
+        conflicts = typer.Exit(code=UpdateErrorCodes.CONFLICTS)
+
+        with (
+            patch.object(Update, "__init__", return_value=None),
+            patch.object(Update, "update", side_effect=conflicts),
+        ):
+            result = runner.invoke(app, ["update"])
+
+        assert result.exit_code == UpdateErrorCodes.CONFLICTS.value
+
+    @staticmethod
+    def test_up_to_date():
+        up_to_date = typer.Exit(code=UpdateSuccessCodes.UP_TO_DATE)
+
+        with (
+            patch.object(Update, "__init__", return_value=None),
+            patch.object(Update, "update", side_effect=up_to_date),
+        ):
+            result = runner.invoke(app, ["update"])
+
+        assert result.exit_code == 0
+
+
+class TestDev:
+    @staticmethod
+    def test_project_not_found(tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(app, ["dev"])
+
+        assert result.exit_code == CommonErrorCodes.PROJECT_NOT_FOUND.value
+
+
+class TestTemplateExport:
+    @staticmethod
+    def test_docker_not_installed():
+        with patch.object(docker_connection, "available", return_value=False):
+            result = runner.invoke(app, ["template", "export"])
+
+        assert result.exit_code == CommonErrorCodes.DOCKER_NOT_INSTALLED.value
+
+
+class TestProfile:
+    @staticmethod
+    def test_saves_trace(tmp_path):
+        path = Path(tmp_path, "trace.json")
+        result = runner.invoke(app, ["--profile", str(path), "cache", "ls"])
+
+        assert result.exit_code == 0
+        assert "Profile saved" in result.stdout
+
+        events = json.loads(path.read_text())["traceEvents"]
+        assert "zentra cache" in [event["name"] for event in events]
+
+
+class TestLogs:
+    @staticmethod
+    def test_filters(tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
+        logs = Path(tmp_path, "zentra", "logs")
+        logs.mkdir(parents=True)
+        Path(logs, "task_output.jsonl").write_text(
+            json.dumps({"time": "1", "level": "INFO", "message": "first", "task": "a"})
+            + "\n"
+            + json.dumps(
+                {"time": "2", "level": "INFO", "message": "second", "task": "b"}
+            )
+            + "\n"
+        )
+
+        result = runner.invoke(app, ["logs", "--task", "b"])
+
+        assert result.exit_code == 0
+        assert "second" in result.stdout
+        assert "first" not in result.stdout
+
+    @staticmethod
+    def test_unknown_level(tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
+        result = runner.invoke(app, ["logs", "--level", "loud"])
+
+        assert result.exit_code != 0
+
+
+class TestCache:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    @staticmethod
+    def test_ls():
+        result = runner.invoke(app, ["cache", "ls"])
+
+        assert result.exit_code == 0
+        assert "Template Cache" in result.stdout
+
+    @staticmethod
+    def test_invalid_budget(monkeypatch):
+        monkeypatch.setenv("ZENTRA_CACHE_MAX_BYTES", "1G")
+        result = runner.invoke(app, ["cache", "ls"])
+
+        assert result.exit_code == CommonErrorCodes.INVALID_CONFIG.value
+        assert "Invalid config!" in result.stdout
+
+    @staticmethod
+    def test_prune():
+        result = runner.invoke(app, ["cache", "prune", "--all"])
+
+        assert result.exit_code == 0
+        assert "Removed 0 template(s)" in result.stdout
@@ -0,0 +1,113 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from zentra_sdk.cli.builder.manifest import (
+    BuildManifest,
+    ComponentRecord,
+    file_hash,
+    hash_component,
+    input_files,
+)
+
+
+def make_tree(root: Path) -> Path:
+    Path(root, "src").mkdir(parents=True)
+    Path(root, "src", "main.py").write_text("print('hello')")
+    Path(root, "package-lock.json").write_text("{}")
+    Path(root, ".env.example").write_text("KEY=")
+
+    for ignored in ["node_modules", ".next", "__pycache__"]:
+        Path(root, ignored).mkdir()
+        Path(root, ignored, "file.txt").write_text("ignored")
+
+    return root
+
+
+class TestInputFiles:
+    @staticmethod
+    def test_skips_ignored_dirs(tmp_path):
+        assert input_files(make_tree(tmp_path)) == [
+            ".env.example",
+            "package-lock.json",
+            "src/main.py",
+        ]
+
+
+class TestHashComponent:
+    @staticmethod
+    def test_same_digest(tmp_path):
+        root = make_tree(tmp_path)
+        assert hash_component(root).digest == hash_component(root).digest
+
+    @staticmethod
+    def test_ignored_changes(tmp_path):
+        root = make_tree(tmp_path)
+        before = hash_component(root)
+        Path(root, "node_modules", "file.txt").write_text("changed")
+
+        assert hash_component(root).digest == before.digest
+
+    @staticmethod
+    def test_content_change(tmp_path):
+        root = make_tree(tmp_path)
+        before = hash_component(root)
+        Path(root, "src", "main.py").write_text("print('changed')")
+
+        assert hash_component(root, before).digest != before.digest
+
+    @staticmethod
+    def test_rename_changes_digest(tmp_path):
+        root = make_tree(tmp_path)
+        before = hash_component(root)
+        os.rename(Path(root, "src", "main.py"), Path(root, "src", "app.py"))
+
+        assert hash_component(root, before).digest != before.digest
+
+    @staticmethod
+    def test_reuses_unchanged_hashes(tmp_path):
+        root = make_tree(tmp_path)
+        before = hash_component(root)
+
+        with patch("zentra_sdk.cli.builder.manifest.file_hash") as mock_hash:
+            after = hash_component(root, before)
+
+        mock_hash.assert_not_called()
+        assert after == before
+
+    @staticmethod
+    def test_rehashes_changed_stat(tmp_path):
+        root = make_tree(tmp_path)
+        before = hash_component(root)
+        Path(root, "src", "main.py").write_text("print('hello!')")
+
+        with patch(
+            "zentra_sdk.cli.builder.manifest.file_hash", side_effect=file_hash
+        ) as mock_hash:
+            hash_component(root, before)
+
+        assert mock_hash.call_count == 1
+
+
+class TestBuildManifest:
+    @staticmethod
+    def test_missing(tmp_path):
+        assert BuildManifest(Path(tmp_path, "zentra.build.json")).load() == {}
+
+    @staticmethod
+    def test_corrupt(tmp_path):
+        path = Path(tmp_path, "zentra.build.json")
+        path.write_text("{not json")
+        assert BuildManifest(path).load() == {}
+
+    @staticmethod
+    def test_record(tmp_path):
+        manifest = BuildManifest(Path(tmp_path, "zentra.build.json"))
+        backend = ComponentRecord(digest="abc")
+        frontend = hash_component(make_tree(Path(tmp_path, "frontend")))
+
+        manifest.record("backend", backend)
+        manifest.record("frontend", frontend)
+
+        assert manifest.load() == {"backend": backend, "frontend": frontend}
+        assert list(tmp_path.glob("*.tmp")) == []
@@ -0,0 +1,116 @@
+from pathlib import Path
+
+import pytest
+
+from zentra_sdk.cli.builder.manifest import file_hash
+from zentra_sdk.cli.builder.merge import (
+    TemplateManifest,
+    UpdatePlan,
+    apply_update,
+    merged_manifest,
+    plan_update,
+)
+
+
+def write_tree(root: Path, files: dict[str, str]) -> TemplateManifest:
+    for name, content in files.items():
+        path = Path(root, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    return TemplateManifest.scan(root, list(files), template="v")
+
+
+@pytest.fixture
+def trees(tmp_path):
+    def make(base: dict, new: dict, ours: dict):
+        base_manifest = write_tree(Path(tmp_path, "base"), base)
+        new_manifest = write_tree(Path(tmp_path, "new"), new)
+        write_tree(Path(tmp_path, "project"), ours)
+        return base_manifest, new_manifest, Path(tmp_path, "project")
+
+    return make
+
+
+class TestTemplateManifest:
+    @staticmethod
+    def test_save_load(tmp_path):
+        manifest = write_tree(tmp_path, {"a.txt": "a", "frontend/b.txt": "b"})
+        manifest.save(Path(tmp_path, "zentra.template.json"))
+
+        loaded = TemplateManifest.load(Path(tmp_path, "zentra.template.json"))
+        assert loaded == manifest
+        assert loaded.files["a.txt"] == file_hash(Path(tmp_path, "a.txt"))
+
+    @staticmethod
+    def test_load_invalid(tmp_path):
+        path = Path(tmp_path, "zentra.template.json")
+        assert TemplateManifest.load(path) is None
+
+        path.write_text("not json")
+        assert TemplateManifest.load(path) is None
+
+
+class TestPlanUpdate:
+    @staticmethod
+    def test_user_unchanged_is_updated(trees):
+        base, new, root = trees({"a": "1"}, {"a": "2"}, {"a": "1"})
+        assert plan_update(root, base, new) == UpdatePlan(updated=["a"])
+
+    @staticmethod
+    def test_template_unchanged_keeps_user_edit(trees):
+        base, new, root = trees({"a": "1"}, {"a": "1"}, {"a": "mine"})
+        assert plan_update(root, base, new) == UpdatePlan()
+
+    @staticmethod
+    def test_both_changed_is_conflict(trees):
+        base, new, root = trees({"a": "1"}, {"a": "2"}, {"a": "mine"})
+        assert plan_update(root, base, new) == UpdatePlan(conflicts=["a"])
+
+    @staticmethod
+    def test_same_change_is_skipped(trees):
+        base, new, root = trees({"a": "1"}, {"a": "2"}, {"a": "2"})
+        assert plan_update(root, base, new) == UpdatePlan()
+
+    @staticmethod
+    def test_new_files(trees):
+        base, new, root = trees({}, {"a": "1", "b": "1"}, {"b": "mine"})
+        assert plan_update(root, base, new) == UpdatePlan(added=["a"], conflicts=["b"])
+
+    @staticmethod
+    def test_removed_files(trees):
+        base, new, root = trees(
+            {"a": "1", "b": "1", "c": "1"}, {}, {"a": "1", "b": "mine"}
+        )
+        assert plan_update(root, base, new) == UpdatePlan(
+            removed=["a"], conflicts=["b"]
+        )
+
+    @staticmethod
+    def test_user_deleted_changed_file(trees):
+        base, new, root = trees({"a": "1"}, {"a": "2"}, {})
+        assert plan_update(root, base, new) == UpdatePlan(conflicts=["a"])
+
+
+class TestApplyUpdate:
+    @staticmethod
+    def test_apply(trees):
+        base, new, root = trees(
+            {"a": "1", "gone": "1", "c": "1"},
+            {"a": "2", "dir/new": "n", "c": "2"},
+            {"a": "1", "gone": "1", "c": "mine"},
+        )
+        plan = plan_update(root, base, new)
+        apply_update(plan, Path(root.parent, "new"), root)
+
+        assert Path(root, "a").read_text() == "2"
+        assert Path(root, "dir", "new").read_text() == "n"
+        assert Path(root, "c").read_text() == "mine"
+        assert not Path(root, "gone").exists()
+
+        merged = merged_manifest(plan, base, new)
+        assert merged.files == {
+            "a": new.files["a"],
+            "c": base.files["c"],
+            "dir/new": new.files["dir/new"],
+        }
@@ -0,0 +1,51 @@
+import sys
+from unittest.mock import MagicMock
+
+from rich.console import Console
+
+from zentra_sdk.cli.builder.process import PrefixedOutput, run_streamed
+
+
+class TestPrefixedOutput:
+    @staticmethod
+    def test_write():
+        console = Console(record=True, width=80)
+        logger = MagicMock()
+        output = PrefixedOutput("backend", "yellow", console, logger)
+
+        output.write("[not markup]\n")
+
+        assert " backend | [not markup]" in console.export_text()
+        logger.info.assert_called_once_with("backend | [not markup]")
+
+
+class TestRunStreamed:
+    @staticmethod
+    def test_streams_lines(tmp_path):
+        output = MagicMock()
+        code = run_streamed(
+            [
+                sys.executable,
+                "-c",
+                "import sys; print('out'); print('err', file=sys.stderr)",
+            ],
+            tmp_path,
+            output,
+        )
+
+        assert code == 0
+        lines = sorted(call.args[0].strip() for call in output.write.call_args_list)
+        assert lines == ["err", "out"]
+
+    @staticmethod
+    def test_exit_code(tmp_path):
+        code = run_streamed(
+            [sys.executable, "-c", "raise SystemExit(3)"], tmp_path, MagicMock()
+        )
+        assert code == 3
+
+    @staticmethod
+    def test_missing_command(tmp_path):
+        output = MagicMock()
+        assert run_streamed(["zentra-missing-command"], tmp_path, output) == 127
+        output.write.assert_called_once()
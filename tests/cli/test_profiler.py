@@ -0,0 +1,71 @@
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from zentra_sdk.cli.conf.profiler import NULL_SPAN, Profiler
+
+
+@pytest.fixture
+def profiler(tmp_path) -> Profiler:
+    profiler = Profiler()
+    profiler.start(Path(tmp_path, "trace.json"))
+    return profiler
+
+
+class TestProfiler:
+    @staticmethod
+    def test_disabled():
+        profiler = Profiler()
+
+        with profiler.span("work") as span:
+            pass
+
+        assert span is NULL_SPAN
+        assert profiler.events == []
+        assert profiler.save() is None
+
+    @staticmethod
+    def test_nested_spans(profiler: Profiler):
+        with profiler.span("outer"):
+            with profiler.span("inner", category="docker", image="test"):
+                pass
+
+        inner, outer = profiler.events
+        assert (inner["name"], outer["name"]) == ("inner", "outer")
+        assert inner["args"] == {"image": "test"}
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    @staticmethod
+    def test_records_errors(profiler: Profiler):
+        with pytest.raises(ValueError):
+            with profiler.span("fails"):
+                raise ValueError("failed")
+
+        assert profiler.events[0]["args"] == {"error": "ValueError"}
+
+    @staticmethod
+    def test_threads(profiler: Profiler):
+        def work():
+            with profiler.span("worker"):
+                pass
+
+        thread = threading.Thread(target=work, name="worker-thread")
+        thread.start()
+        thread.join()
+
+        assert profiler.threads[thread.ident] == "worker-thread"
+
+    @staticmethod
+    def test_save(profiler: Profiler):
+        with profiler.span("work"):
+            pass
+
+        path = profiler.save()
+        trace = json.loads(path.read_text())
+        phases = [event["ph"] for event in trace["traceEvents"]]
+
+        assert phases == ["M", "X"]
+        assert not profiler.enabled
@@ -0,0 +1,59 @@
+import socket
+
+import pytest
+
+from zentra_sdk.cli.builder.registry import (
+    probe_registry,
+    registry_host,
+    registry_url,
+)
+
+
+def address(server) -> str:
+    host, port = server.server_address
+    return f"http://{host}:{port}"
+
+
+def closed_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.mark.parametrize(
+    "registry, host",
+    [
+        ("mirror.internal:5000", "mirror.internal:5000"),
+        ("http://localhost:5000/", "localhost:5000"),
+        ("https://registry.example.com", "registry.example.com"),
+    ],
+)
+def test_registry_host(registry: str, host: str):
+    assert registry_host(registry) == host
+
+
+def test_registry_url():
+    assert registry_url("mirror:5000", "a/manifests/b") == (
+        "https://mirror:5000/v2/a/manifests/b"
+    )
+    assert registry_url("http://localhost:5000") == "http://localhost:5000/v2/"
+
+
+class TestProbeRegistry:
+    @staticmethod
+    def test_reachable(registry_server):
+        assert probe_registry(address(registry_server), timeout=1)
+
+    @staticmethod
+    def test_needs_credentials(registry_server):
+        registry_server.status = 401
+        assert probe_registry(address(registry_server), timeout=1)
+
+    @staticmethod
+    def test_error(registry_server):
+        registry_server.status = 503
+        assert not probe_registry(address(registry_server), timeout=1)
+
+    @staticmethod
+    def test_unreachable():
+        assert not probe_registry(f"http://127.0.0.1:{closed_port()}", timeout=1)
@@ -5,9 +5,15 @@ from unittest.mock import patch, MagicMock
 import typer
 from docker.errors import DockerException
 
+from zentra_sdk.cli.builder.tasks import Task
 from zentra_sdk.cli.commands.setup import Setup, SetupTasks
+from zentra_sdk.cli.builder.client import docker_connection
+from zentra_sdk.cli.builder.journal import InitJournal
+from zentra_sdk.cli.builder.snapshot import SnapshotStore
 from zentra_sdk.cli.constants import (
     FRONTEND_FILES_TO_REMOVE,
+    FRONTEND_WARM_FILES,
+    CommonErrorCodes,
     ProjectPaths,
     SetupSuccessCodes,
 )
@@ -52,21 +58,37 @@ class TestSetup:
 
         @staticmethod
         def test_false(mock_docker, setup: Setup):
+            docker_connection.reset()
             mock_docker.side_effect = DockerException
             assert not setup.docker_installed()
 
+        @staticmethod
+        def test_cached(mock_docker, setup: Setup):
+            mock_docker.side_effect = DockerException
+            assert setup.docker_installed()
+
         @staticmethod
         def test_raise(mock_docker, tmp_path):
             mock_docker.side_effect = DockerException
             with pytest.raises(typer.Exit):
                 Setup(root=tmp_path)
 
+        @staticmethod
+        def test_offline_skips_check(mock_docker, tmp_path):
+            mock_docker.side_effect = DockerException
+            setup = Setup(root=tmp_path, offline=True)
+
+            assert setup.setup_tasks.docker_frontend is None
+
     class TestBuild:
         @mock.patch.object(Setup, "project_exists", return_value=False)
         @mock.patch.object(
             SetupTasks,
             "get_tasks",
-            return_value=[mock.Mock(), mock.Mock()],
+            return_value=[
+                Task(name="first", func=mock.Mock()),
+                Task(name="second", func=mock.Mock(), depends_on=["first"]),
+            ],
         )
         def test_tasks_executed(
             self, mock_exists, mock_tasks: SetupTasks, setup: Setup
@@ -75,7 +97,7 @@ class TestSetup:
                 setup.build()
 
             for task in mock_tasks.get_tasks():
-                task.assert_called_once()
+                task.func.assert_called_once()
 
         @mock.patch.object(Setup, "project_exists", return_value=False)
         @mock.patch.object(SetupTasks, "get_tasks", return_value=[])
@@ -92,26 +114,76 @@ class TestSetup:
 
             assert excinfo.value.exit_code == SetupSuccessCodes.ALREADY_CONFIGURED
 
+        @mock.patch.object(Setup, "project_exists", return_value=True)
+        def test_resumes_from_journal(self, mock_exists, setup: Setup):
+            done, remaining = mock.Mock(), mock.Mock()
+            journal = InitJournal(setup.paths.INIT_JOURNAL)
+            journal.record("first")
+
+            tasks = [
+                Task(name="first", func=done),
+                Task(name="second", func=remaining, depends_on=["first"]),
+            ]
+            with mock.patch.object(SetupTasks, "get_tasks", return_value=tasks):
+                with pytest.raises(typer.Exit) as excinfo:
+                    setup.build()
+
+            assert excinfo.value.exit_code == SetupSuccessCodes.COMPLETE
+            done.assert_not_called()
+            remaining.assert_called_once()
+            assert not journal.exists()
+
+        @mock.patch.object(Setup, "project_exists", return_value=True)
+        def test_resume_keeps_template_version(self, mock_exists, setup: Setup):
+            journal = InitJournal(setup.paths.INIT_JOURNAL)
+            journal.record("build_frontend", template_version="sha256:abc")
+            recorded = []
+
+            tasks = [
+                Task(name="build_frontend", func=mock.Mock()),
+                Task(
+                    name="record_template",
+                    func=lambda: recorded.append(setup.setup_tasks.template_version),
+                    depends_on=["build_frontend"],
+                ),
+            ]
+            with mock.patch.object(SetupTasks, "get_tasks", return_value=tasks):
+                with pytest.raises(typer.Exit):
+                    setup.build()
+
+            assert recorded == ["sha256:abc"]
+
+        def test_failure_keeps_journal(self, setup: Setup):
+            tasks = [
+                Task(name="first", func=mock.Mock()),
+                Task(
+                    name="second",
+                    func=mock.Mock(side_effect=RuntimeError),
+                    depends_on=["first"],
+                ),
+            ]
+            with mock.patch.object(SetupTasks, "get_tasks", return_value=tasks):
+                with pytest.raises(RuntimeError):
+                    setup.build()
+
+            journal = InitJournal(setup.paths.INIT_JOURNAL)
+            assert journal.completed() == {"first"}
+
 
 class TestSetupTasks:
     @pytest.fixture
     def setup_tasks(self, tmp_path) -> SetupTasks:
         return SetupTasks(paths=ProjectPaths(tmp_path), test_logging=True)
 
-    @pytest.fixture
-    def mock_subprocess(self):
-        with patch("subprocess.run") as mock_run:
-            yield mock_run
-
     @pytest.fixture
     def mock_os_remove(self):
         with patch("os.remove") as mock_remove:
             yield mock_remove
 
     @pytest.fixture
-    def mock_shutil_copytree(self):
-        with patch("shutil.copytree") as mock_copytree:
-            yield mock_copytree
+    def mock_sync_tree(self):
+        with patch("zentra_sdk.cli.commands.setup.sync_tree") as mock_sync:
+            yield mock_sync
 
     @pytest.fixture
     def mock_os_rename(self):
@@ -119,12 +191,58 @@ class TestSetupTasks:
             yield mock_rename
 
     @staticmethod
-    def test_build_backend(setup_tasks: SetupTasks, mock_subprocess: MagicMock):
-        setup_tasks._build_backend()
-        mock_subprocess.assert_called_once_with(
-            ["zentra-api", "init", "backend", "--hide-output"]
+    def test_build_backend(setup_tasks: SetupTasks):
+        with patch.object(setup_tasks.backend, "run") as mock_run:
+            setup_tasks._build_backend()
+
+        mock_run.assert_called_once()
+
+    @staticmethod
+    def test_build_frontend_offline(tmp_path):
+        template = tmp_path / "template" / "frontend"
+        template.mkdir(parents=True)
+        (template / "package.json").write_text("{}")
+
+        setup_tasks = SetupTasks(
+            paths=ProjectPaths(tmp_path / "project"), test_logging=True, offline=True
+        )
+        setup_tasks.snapshots = SnapshotStore(root=tmp_path / "snapshots")
+        setup_tasks.snapshots.export(template, "1")
+
+        setup_tasks._build_frontend()
+        assert (setup_tasks.paths.FRONTEND_PATH / "package.json").read_text() == "{}"
+
+    @staticmethod
+    def test_build_frontend_offline_missing(tmp_path):
+        setup_tasks = SetupTasks(
+            paths=ProjectPaths(tmp_path), test_logging=True, offline=True
+        )
+        setup_tasks.snapshots = SnapshotStore(
+            root=tmp_path / "snapshots", bundled=tmp_path / "bundled"
         )
 
+        with pytest.raises(typer.Exit) as excinfo:
+            setup_tasks._build_frontend()
+
+        assert excinfo.value.exit_code == CommonErrorCodes.SNAPSHOT_NOT_FOUND
+
+    @staticmethod
+    def test_rollback(setup_tasks: SetupTasks):
+        for path in (setup_tasks.paths.BACKEND_PATH, setup_tasks.paths.FRONTEND_PATH):
+            path.mkdir(parents=True)
+            (path / "partial.txt").touch()
+
+        setup_tasks._rollback_backend()
+        setup_tasks._rollback_frontend()
+
+        assert not setup_tasks.paths.BACKEND_PATH.exists()
+        assert not setup_tasks.paths.FRONTEND_PATH.exists()
+
+    @staticmethod
+    def test_remove_files_missing(setup_tasks: SetupTasks):
+        setup_tasks.paths.FRONTEND_PATH.mkdir(parents=True)
+        setup_tasks._remove_files()
+
     @staticmethod
     def test_remove_files(setup_tasks: SetupTasks, mock_os_remove: MagicMock):
         files_to_remove = FRONTEND_FILES_TO_REMOVE
@@ -139,10 +257,60 @@ class TestSetupTasks:
 
         assert mock_os_remove.call_count == len(files_to_remove)
 
+    @staticmethod
+    def test_remove_files_warm(tmp_path):
+        setup_tasks = SetupTasks(ProjectPaths(tmp_path), test_logging=True, warm=True)
+        setup_tasks.paths.FRONTEND_PATH.mkdir(parents=True)
+        for file_name in FRONTEND_FILES_TO_REMOVE:
+            (setup_tasks.paths.FRONTEND_PATH / file_name).touch()
+
+        setup_tasks._remove_files()
+
+        remaining = [p.name for p in setup_tasks.paths.FRONTEND_PATH.iterdir()]
+        assert remaining == ["bun.lockb"]
+
+    @staticmethod
+    def test_template_files_skip_warm_files(tmp_path):
+        setup_tasks = SetupTasks(ProjectPaths(tmp_path), test_logging=True, warm=True)
+        setup_tasks.paths.FRONTEND_PATH.mkdir(parents=True)
+        for file_name in ["package.json", *FRONTEND_WARM_FILES]:
+            (setup_tasks.paths.FRONTEND_PATH / file_name).touch()
+
+        files = setup_tasks.template_files()
+
+        assert "frontend/package.json" in files
+        assert "frontend/bun.lockb" not in files
+
+    @staticmethod
+    def test_build_frontend_warm(tmp_path, monkeypatch):
+        monkeypatch.setenv("BUN_INSTALL_CACHE_DIR", str(tmp_path / "bun"))
+        setup_tasks = SetupTasks(ProjectPaths(tmp_path), test_logging=True, warm=True)
+        builder = setup_tasks.docker_frontend
+
+        with (
+            patch.object(type(builder), "digest", return_value=None),
+            patch.object(type(builder), "use") as mock_use,
+        ):
+            setup_tasks._build_frontend()
+
+        assert builder.tag == "warm"
+        assert mock_use.call_args.kwargs["extra"] == {"/bun-cache": tmp_path / "bun"}
+
+    @staticmethod
+    def test_frontend_builder_data_only(setup_tasks: SetupTasks):
+        assert setup_tasks.docker_frontend.image == "achronus/nextjs-core:template"
+
+    @staticmethod
+    def test_warm_ignored_offline(tmp_path):
+        setup_tasks = SetupTasks(
+            ProjectPaths(tmp_path), test_logging=True, offline=True, warm=True
+        )
+        assert not setup_tasks.warm
+
     @staticmethod
     def test_move_files(
         setup_tasks: SetupTasks,
-        mock_shutil_copytree: MagicMock,
+        mock_sync_tree: MagicMock,
         mock_os_rename: MagicMock,
     ):
         (setup_tasks.package_paths.FRONTEND).mkdir(parents=True, exist_ok=True)
@@ -156,13 +324,12 @@ class TestSetupTasks:
 
         setup_tasks._move_files()
 
-        mock_shutil_copytree.assert_any_call(
+        mock_sync_tree.assert_any_call(
             setup_tasks.package_paths.FRONTEND,
             setup_tasks.paths.FRONTEND_PATH,
-            dirs_exist_ok=True,
         )
-        mock_shutil_copytree.assert_any_call(
-            setup_tasks.package_paths.ROOT, setup_tasks.paths.ROOT, dirs_exist_ok=True
+        mock_sync_tree.assert_any_call(
+            setup_tasks.package_paths.ROOT, setup_tasks.paths.ROOT
         )
         mock_os_rename.assert_called_once_with(
             env_local_template, setup_tasks.paths.ENV_LOCAL
@@ -177,6 +344,17 @@ class TestSetupTasks:
             setup_tasks._build_frontend,
             setup_tasks._remove_files,
             setup_tasks._move_files,
+            setup_tasks._record_template,
         ]
-        assert tasks == target
+        assert [task.func for task in tasks] == target
         assert len(tasks) == len(target)
+
+    @staticmethod
+    def test_get_tasks_dependencies(setup_tasks: SetupTasks):
+        tasks = {task.name: task for task in setup_tasks.get_tasks()}
+
+        assert tasks["build_backend"].depends_on == []
+        assert tasks["build_frontend"].depends_on == []
+        assert tasks["remove_files"].depends_on == ["build_frontend"]
+        assert tasks["move_files"].depends_on == ["remove_files"]
+        assert tasks["record_template"].depends_on == ["move_files"]
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+from zentra_sdk.cli.builder.snapshot import (
+    SnapshotStore,
+    extract_snapshot,
+    snapshot_name,
+)
+
+
+@pytest.fixture
+def template(tmp_path) -> Path:
+    path = tmp_path / "template" / "frontend"
+    path.mkdir(parents=True)
+    (path / "package.json").write_text("{}")
+    return path
+
+
+@pytest.fixture
+def store(tmp_path) -> SnapshotStore:
+    return SnapshotStore(root=tmp_path / "user", bundled=tmp_path / "bundled")
+
+
+class TestSnapshotStore:
+    @staticmethod
+    def test_find_none(store: SnapshotStore):
+        assert store.find() is None
+
+    @staticmethod
+    def test_find_missing_path(store: SnapshotStore, tmp_path):
+        assert store.find(tmp_path / "missing.tar.gz") is None
+
+    @staticmethod
+    def test_export_and_find_latest(store: SnapshotStore, template: Path):
+        store.export(template, "20240101T000000")
+        latest = store.export(template, "20240201T000000")
+
+        assert latest.name == snapshot_name("20240201T000000")
+        assert store.find() == latest
+
+    @staticmethod
+    def test_find_bundled(store: SnapshotStore, template: Path):
+        bundled = store.export(template, "1", output=store.bundled / snapshot_name("1"))
+        assert store.find() == bundled
+
+    @staticmethod
+    def test_extract(store: SnapshotStore, template: Path, tmp_path):
+        snapshot = store.export(template, "1")
+
+        extract_snapshot(snapshot, tmp_path / "project")
+        assert (tmp_path / "project" / "frontend" / "package.json").read_text() == "{}"
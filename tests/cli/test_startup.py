@@ -0,0 +1,73 @@
+import os
+import re
+import subprocess
+import sys
+
+# Maximum import time of the `zentra` entry point on top of `typer` itself
+CLI_IMPORT_BUDGET_MS = 50
+
+HEAVY_MODULES = [
+    "docker",
+    "pydantic",
+    "rich.progress",
+    "zentra_sdk.cli.commands.setup",
+    "zentra_sdk.cli.conf.logger",
+]
+
+HELP_SCRIPT = """
+import sys
+import typer
+from zentra_sdk.cli.main import app
+
+typer.main.get_command(app).main(["--help"], standalone_mode=False)
+print("LOADED:" + ",".join(sorted(sys.modules)))
+"""
+
+
+def cumulative_import_us(stderr: str, module: str) -> int:
+    """Gets the cumulative import time of a module from `-X importtime` output."""
+    pattern = rf"import time:\s+\d+ \|\s+(\d+) \|\s*{re.escape(module)}$"
+    return int(re.search(pattern, stderr, re.MULTILINE).group(1))
+
+
+def test_help_skips_heavy_imports():
+    result = subprocess.run(
+        [sys.executable, "-c", HELP_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = set(result.stdout.split("LOADED:")[-1].strip().split(","))
+
+    assert "Usage" in result.stdout
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+def test_help_with_invalid_settings():
+    env = {
+        **os.environ,
+        "ZENTRA_CACHE_MAX_BYTES": "1G",
+        "ZENTRA_DOCKER_TIMEOUT": "slow",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", HELP_SCRIPT],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+    assert result.returncode == 0
+    assert "Usage" in result.stdout
+
+
+def test_import_budget():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import zentra_sdk.cli.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = cumulative_import_us(result.stderr, "zentra_sdk.cli.main")
+    typer_time = cumulative_import_us(result.stderr, "typer")
+
+    assert (total - typer_time) / 1000 < CLI_IMPORT_BUDGET_MS
@@ -0,0 +1,105 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from zentra_sdk.cli.builder.supervisor import Service, Supervisor
+
+
+def python_service(tmp_path: Path, code: str, name: str = "test") -> Service:
+    return Service(
+        name=name,
+        cmd=[sys.executable, "-c", code],
+        cwd=tmp_path,
+        output=MagicMock(),
+    )
+
+
+def lines(service: Service) -> list[str]:
+    return [call.args[0].strip() for call in service.output.write.call_args_list]
+
+
+@pytest.fixture
+def supervisor():
+    def make(services: list[Service], **kwargs) -> Supervisor:
+        return Supervisor(
+            services, backoff=0.01, max_backoff=0.04, stop_timeout=2, **kwargs
+        )
+
+    return make
+
+
+class TestSupervisor:
+    @staticmethod
+    def test_streams_both_outputs(tmp_path, supervisor):
+        service = python_service(
+            tmp_path, "import sys; print('out'); print('err', file=sys.stderr)"
+        )
+        asyncio.run(supervisor([service]).run())
+
+        assert sorted(lines(service)) == ["Exited", "err", "out"]
+
+    @staticmethod
+    def test_restarts_with_backoff(tmp_path, supervisor):
+        counter = Path(tmp_path, "runs")
+        service = python_service(
+            tmp_path,
+            "from pathlib import Path; p = Path('runs'); "
+            "p.write_text(p.read_text() + 'x' if p.exists() else 'x'); "
+            "raise SystemExit(0 if len(p.read_text()) == 4 else 1)",
+        )
+        sup = supervisor([service])
+        asyncio.run(sup.run())
+
+        assert counter.read_text() == "xxxx"
+        assert sup.restarts["test"] == 3
+        delays = [line for line in lines(service) if "restarting" in line]
+        assert delays == [
+            "Exited with code 1, restarting in 0.0s",
+            "Exited with code 1, restarting in 0.0s",
+            "Exited with code 1, restarting in 0.0s",
+        ]
+        assert not sup.processes
+
+    @staticmethod
+    def test_missing_command(tmp_path, supervisor):
+        service = Service("missing", ["zentra-missing-command"], tmp_path, MagicMock())
+        asyncio.run(supervisor([service]).run())
+
+        assert lines(service) == ["Command not found: zentra-missing-command"]
+
+    @staticmethod
+    def test_cancel_stops_children(tmp_path, supervisor):
+        services = [
+            python_service(tmp_path, "import time; time.sleep(60)", name="a"),
+            python_service(
+                tmp_path,
+                "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+                "print('ready', flush=True); time.sleep(60)",
+                name="b",
+            ),
+        ]
+        sup = supervisor(services, stable_after=60)
+        sup.stop_timeout = 0.5
+
+        async def main():
+            task = asyncio.create_task(sup.run())
+            while len(sup.processes) < 2 or not services[1].output.write.called:
+                await asyncio.sleep(0.01)
+
+            processes = list(sup.processes.values())
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            return processes
+
+        start = time.monotonic()
+        processes = asyncio.run(main())
+
+        assert time.monotonic() - start < 10
+        assert all(p.returncode is not None for p in processes)
+        assert not sup.processes
@@ -0,0 +1,125 @@
+import os
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from zentra_sdk.cli.builder.sync import copy_file, sync_tree
+
+
+@pytest.fixture
+def source(tmp_path) -> Path:
+    source = Path(tmp_path, "source")
+    Path(source, "nested").mkdir(parents=True)
+    Path(source, ".env.local.template").write_text("KEY=value")
+    Path(source, "nested", "config.mjs").write_text("export default {}")
+    return source
+
+
+class TestCopyFile:
+    @staticmethod
+    def test_copies_metadata(source, tmp_path):
+        src = Path(source, "nested", "config.mjs")
+        os.utime(src, ns=(0, 1_000_000_000))
+        dest = Path(tmp_path, "config.mjs")
+
+        copy_file(src, dest)
+
+        assert dest.read_text() == "export default {}"
+        assert dest.stat().st_mtime_ns == 1_000_000_000
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    @staticmethod
+    def test_fallback(source, tmp_path):
+        dest = Path(tmp_path, "config.mjs")
+
+        with patch("zentra_sdk.cli.builder.sync._reflink", return_value=False), patch(
+            "zentra_sdk.cli.builder.sync._copy_range", return_value=False
+        ):
+            copy_file(Path(source, "nested", "config.mjs"), dest)
+
+        assert dest.read_text() == "export default {}"
+
+
+class TestSyncTree:
+    @staticmethod
+    def test_copies(source, tmp_path):
+        dest = Path(tmp_path, "dest")
+        stats = sync_tree(source, dest)
+
+        assert stats.copied == 2
+        assert Path(dest, "nested", "config.mjs").read_text() == "export default {}"
+
+    @staticmethod
+    def test_skips_identical(source, tmp_path):
+        dest = Path(tmp_path, "dest")
+        sync_tree(source, dest)
+
+        with patch("zentra_sdk.cli.builder.sync.copy_file") as mock_copy:
+            stats = sync_tree(source, dest)
+
+        mock_copy.assert_not_called()
+        assert stats.skipped == 2
+
+    @staticmethod
+    def test_skips_same_contents(source, tmp_path):
+        dest = Path(tmp_path, "dest")
+        sync_tree(source, dest)
+        os.utime(Path(dest, ".env.local.template"), ns=(0, 0))
+
+        assert sync_tree(source, dest).skipped == 2
+
+    @staticmethod
+    def test_overwrites_changed(source, tmp_path):
+        dest = Path(tmp_path, "dest")
+        sync_tree(source, dest)
+        Path(dest, ".env.local.template").write_text("KEY=other")
+
+        assert sync_tree(source, dest).copied == 1
+        assert Path(dest, ".env.local.template").read_text() == "KEY=value"
+
+    @staticmethod
+    def test_empty_directories(source, tmp_path):
+        Path(source, "public", "images").mkdir(parents=True)
+        dest = Path(tmp_path, "dest")
+
+        sync_tree(source, dest)
+
+        assert Path(dest, "public", "images").is_dir()
+
+    @staticmethod
+    def test_symlinks(source, tmp_path):
+        Path(source, "link.mjs").symlink_to("nested/config.mjs")
+        Path(source, "linked_dir").symlink_to("nested")
+        dest = Path(tmp_path, "dest")
+
+        assert sync_tree(source, dest).copied == 4
+        assert os.readlink(Path(dest, "link.mjs")) == "nested/config.mjs"
+        assert os.readlink(Path(dest, "linked_dir")) == "nested"
+        assert sync_tree(source, dest).skipped == 4
+
+    @staticmethod
+    def test_parallel(tmp_path):
+        source = Path(tmp_path, "source")
+        source.mkdir()
+        for i in range(100):
+            Path(source, f"file_{i}.txt").write_text(str(i))
+
+        dest = Path(tmp_path, "dest")
+        assert sync_tree(source, dest, max_workers=4).copied == 100
+        assert Path(dest, "file_42.txt").read_text() == "42"
+
+    @staticmethod
+    def test_zip_resources(tmp_path):
+        archive = Path(tmp_path, "package.zip")
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("assets/frontend/next.config.mjs", "export default {}")
+            zf.writestr("assets/frontend/app/page.tsx", "page")
+
+        source = zipfile.Path(archive, "assets/frontend/")
+        dest = Path(tmp_path, "dest")
+
+        assert sync_tree(source, dest).copied == 2
+        assert Path(dest, "app", "page.tsx").read_text() == "page"
+        assert sync_tree(source, dest).skipped == 2
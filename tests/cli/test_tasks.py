@@ -0,0 +1,272 @@
+import threading
+import time
+
+import pytest
+import typer
+from unittest.mock import MagicMock
+
+from zentra_sdk.cli.builder.tasks import (
+    Task,
+    TaskCancelled,
+    TaskScheduler,
+    TransferColumn,
+    task_progress,
+)
+from zentra_sdk.cli.conf.logger import current_task
+from zentra_sdk.cli.constants import BuildErrorCodes
+
+
+class TestTaskScheduler:
+    @staticmethod
+    def test_order():
+        scheduler = TaskScheduler(
+            [
+                Task(name="c", func=MagicMock(), depends_on=["b"]),
+                Task(name="b", func=MagicMock(), depends_on=["a"]),
+                Task(name="a", func=MagicMock()),
+            ]
+        )
+        assert scheduler.order() == ["a", "b", "c"]
+
+    @staticmethod
+    def test_unknown_dependency():
+        with pytest.raises(ValueError):
+            TaskScheduler([Task(name="a", func=MagicMock(), depends_on=["b"])])
+
+    @staticmethod
+    def test_cycle():
+        with pytest.raises(ValueError):
+            TaskScheduler(
+                [
+                    Task(name="a", func=MagicMock(), depends_on=["b"]),
+                    Task(name="b", func=MagicMock(), depends_on=["a"]),
+                ]
+            )
+
+    @staticmethod
+    def test_dependencies_respected():
+        calls = []
+        scheduler = TaskScheduler(
+            [
+                Task(name="first", func=lambda: calls.append("first")),
+                Task(
+                    name="second",
+                    func=lambda: calls.append("second"),
+                    depends_on=["first"],
+                ),
+            ]
+        )
+        scheduler.run(task_progress())
+
+        assert calls == ["first", "second"]
+
+    @staticmethod
+    def test_independent_tasks_run_concurrently():
+        barrier = threading.Barrier(2, timeout=5)
+        scheduler = TaskScheduler(
+            [
+                Task(name="a", func=barrier.wait),
+                Task(name="b", func=barrier.wait),
+            ]
+        )
+
+        start = time.perf_counter()
+        scheduler.run(task_progress())
+        assert time.perf_counter() - start < 5
+
+    @staticmethod
+    def test_error_stops_dependents():
+        dependent = MagicMock()
+        scheduler = TaskScheduler(
+            [
+                Task(name="a", func=MagicMock(side_effect=RuntimeError("failed"))),
+                Task(name="b", func=dependent, depends_on=["a"]),
+            ]
+        )
+
+        with pytest.raises(RuntimeError):
+            scheduler.run(task_progress())
+
+        dependent.assert_not_called()
+
+
+class TestTransferColumn:
+    @staticmethod
+    def test_render():
+        progress = task_progress()
+        plain = progress.add_task("task", total=1)
+        layer = progress.add_task("layer", total=2 * 1024**2, transfer=True)
+        progress.update(layer, completed=1024**2)
+
+        column = TransferColumn()
+        assert column.render(progress.tasks[plain]).plain == ""
+        assert "1.0/2.1 MB" in column.render(progress.tasks[layer]).plain
+
+
+class TestTaskSchedulerRecovery:
+    @staticmethod
+    def test_completed_skipped():
+        skipped, run = MagicMock(), MagicMock()
+        scheduler = TaskScheduler(
+            [
+                Task(name="a", func=skipped),
+                Task(name="b", func=run, depends_on=["a"]),
+            ]
+        )
+        scheduler.run(task_progress(), completed={"a"})
+
+        skipped.assert_not_called()
+        run.assert_called_once()
+
+    @staticmethod
+    def test_on_complete():
+        recorded = []
+        scheduler = TaskScheduler(
+            [
+                Task(name="a", func=MagicMock()),
+                Task(name="b", func=MagicMock(), depends_on=["a"]),
+            ]
+        )
+        scheduler.run(task_progress(), on_complete=recorded.append)
+
+        assert recorded == ["a", "b"]
+
+    @staticmethod
+    def test_rollback_failed_task():
+        rollback, sibling_rollback = MagicMock(), MagicMock()
+        started = threading.Event()
+        recorded = []
+
+        def fails():
+            started.wait(timeout=5)
+            raise RuntimeError("failed")
+
+        def slow():
+            started.set()
+            time.sleep(0.1)
+
+        scheduler = TaskScheduler(
+            [
+                Task(name="fails", func=fails, rollback=rollback),
+                Task(name="slow", func=slow, rollback=sibling_rollback),
+            ]
+        )
+
+        with pytest.raises(RuntimeError):
+            scheduler.run(task_progress(), on_complete=recorded.append)
+
+        rollback.assert_called_once()
+        sibling_rollback.assert_not_called()
+        assert recorded == ["slow"]
+
+    @staticmethod
+    def test_interrupt_cancels_before_rollback(monkeypatch):
+        started, stop = threading.Event(), threading.Event()
+        events = []
+
+        def blocks():
+            started.set()
+            stop.wait(timeout=5)
+            time.sleep(0.05)
+            events.append("stopped")
+            raise TaskCancelled
+
+        def interrupt(*args, **kwargs):
+            started.wait(timeout=5)
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr("zentra_sdk.cli.builder.tasks.wait", interrupt)
+        scheduler = TaskScheduler(
+            [
+                Task(
+                    name="blocks",
+                    func=blocks,
+                    rollback=lambda: events.append("rollback"),
+                    cancel=stop.set,
+                )
+            ]
+        )
+
+        with pytest.raises(KeyboardInterrupt):
+            scheduler.run(task_progress())
+
+        # Rolled back only once the task has stopped
+        assert events == ["stopped", "rollback"]
+
+    @staticmethod
+    def test_interrupt_keeps_finished_tasks(monkeypatch):
+        started = threading.Event()
+        recorded, rollback = [], MagicMock()
+
+        def interrupt(*args, **kwargs):
+            started.wait(timeout=5)
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr("zentra_sdk.cli.builder.tasks.wait", interrupt)
+        scheduler = TaskScheduler(
+            [Task(name="finishes", func=started.set, rollback=rollback)]
+        )
+
+        with pytest.raises(KeyboardInterrupt):
+            scheduler.run(task_progress(), on_complete=recorded.append)
+
+        assert recorded == ["finishes"]
+        rollback.assert_not_called()
+
+    @staticmethod
+    def test_rollback_error_keeps_original():
+        scheduler = TaskScheduler(
+            [
+                Task(
+                    name="a",
+                    func=MagicMock(side_effect=RuntimeError("failed")),
+                    rollback=MagicMock(side_effect=OSError),
+                ),
+            ]
+        )
+
+        with pytest.raises(RuntimeError):
+            scheduler.run(task_progress())
+
+
+class TestTaskTimings:
+    @staticmethod
+    def test_timings():
+        scheduler = TaskScheduler(
+            [
+                Task(name="a", func=lambda: time.sleep(0.05)),
+                Task(name="b", func=MagicMock(side_effect=RuntimeError)),
+            ]
+        )
+
+        with pytest.raises(RuntimeError):
+            scheduler.run(task_progress())
+
+        assert set(scheduler.timings) == {"a", "b"}
+        assert scheduler.timings["a"] >= 0.05
+
+    @staticmethod
+    def test_logs_outcome():
+        logger = MagicMock()
+        seen_task = []
+
+        def record_task():
+            seen_task.append(current_task.get())
+
+        def fail():
+            raise typer.Exit(code=BuildErrorCodes.BACKEND_FAILED)
+
+        scheduler = TaskScheduler(
+            [Task(name="a", func=record_task), Task(name="b", func=fail)],
+            logger=logger,
+        )
+
+        with pytest.raises(typer.Exit):
+            scheduler.run(task_progress())
+
+        assert seen_task == ["a"]
+        assert logger.info.call_args.kwargs["exit_code"] == 0
+        assert (
+            logger.error.call_args.kwargs["exit_code"]
+            == BuildErrorCodes.BACKEND_FAILED.value
+        )
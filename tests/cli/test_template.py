@@ -0,0 +1,54 @@
+import tarfile
+from pathlib import Path
+
+import pytest
+import typer
+from unittest.mock import patch, MagicMock
+
+from docker.errors import DockerException
+
+from zentra_sdk.cli.builder.snapshot import SnapshotStore
+from zentra_sdk.cli.commands.template import TemplateExport
+
+
+@pytest.fixture
+def mock_docker():
+    with patch("docker.from_env") as mock:
+        yield mock
+
+
+class TestTemplateExport:
+    @pytest.fixture
+    def exporter(self, mock_docker, tmp_path) -> TemplateExport:
+        exporter = TemplateExport(store=SnapshotStore(root=tmp_path / "snapshots"))
+        exporter.template_cache = MagicMock()
+        exporter.template_cache.restore.return_value = False
+        return exporter
+
+    @staticmethod
+    def test_no_docker(mock_docker):
+        mock_docker.side_effect = DockerException
+        with pytest.raises(typer.Exit):
+            TemplateExport()
+
+    @staticmethod
+    def test_version():
+        assert TemplateExport.version(None).isalnum()
+        assert TemplateExport.version("sha256:abcdef1234567890").endswith(
+            "-abcdef123456"
+        )
+
+    @staticmethod
+    def test_export(exporter: TemplateExport, tmp_path):
+        def use(path: str, dest: str) -> None:
+            Path(dest, "frontend").mkdir()
+            Path(dest, "frontend", "package.json").write_text("{}")
+
+        exporter.docker_frontend = MagicMock()
+        exporter.docker_frontend.digest.return_value = None
+        exporter.docker_frontend.use.side_effect = use
+
+        output = exporter.export(tmp_path / "snapshot.tar.gz")
+
+        with tarfile.open(output) as tar:
+            assert "frontend/package.json" in tar.getnames()
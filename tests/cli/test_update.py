@@ -0,0 +1,106 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from zentra_sdk.cli.builder.merge import TemplateManifest
+from zentra_sdk.cli.commands.setup import SetupTasks
+from zentra_sdk.cli.commands.update import Update
+from zentra_sdk.cli.constants import (
+    CommonErrorCodes,
+    ProjectPaths,
+    UpdateErrorCodes,
+    UpdateSuccessCodes,
+)
+
+TEMPLATE = {"package.json": '{"version": 1}', "app/page.tsx": "page"}
+
+
+@pytest.fixture
+def template():
+    files = dict(TEMPLATE)
+
+    def fake_frontend(self: SetupTasks) -> None:
+        for name, content in files.items():
+            path = Path(self.paths.FRONTEND_PATH, name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+    with patch.object(SetupTasks, "_build_frontend", fake_frontend):
+        yield files
+
+
+@pytest.fixture
+def project(tmp_path, template) -> Path:
+    tasks = SetupTasks(ProjectPaths(tmp_path), test_logging=True, offline=True)
+    tasks.build_template()
+
+    original_cwd = os.getcwd()
+    os.chdir(tmp_path)
+    yield tmp_path
+    os.chdir(original_cwd)
+
+
+def run_update(**kwargs) -> typer.Exit:
+    with pytest.raises(typer.Exit) as excinfo:
+        Update(offline=True, test_logging=True, **kwargs).update()
+
+    return excinfo.value
+
+
+class TestUpdate:
+    @staticmethod
+    def test_init_records_manifest(project: Path):
+        manifest = TemplateManifest.load(Path(project, "zentra.template.json"))
+
+        assert "frontend/package.json" in manifest.files
+        assert "frontend/.env.local" in manifest.files
+        assert "zentra.root" in manifest.files
+
+    @staticmethod
+    def test_up_to_date(project: Path):
+        assert run_update().exit_code == UpdateSuccessCodes.UP_TO_DATE
+
+    @staticmethod
+    def test_updates_and_conflicts(project: Path, template: dict):
+        Path(project, "frontend", "app", "page.tsx").write_text("my page")
+        template["package.json"] = '{"version": 2}'
+        template["app/page.tsx"] = "new page"
+
+        assert run_update().exit_code == UpdateErrorCodes.CONFLICTS
+
+        frontend = Path(project, "frontend")
+        assert Path(frontend, "package.json").read_text() == '{"version": 2}'
+        assert Path(frontend, "app", "page.tsx").read_text() == "my page"
+
+    @staticmethod
+    def test_dry_run(project: Path, template: dict):
+        template["package.json"] = '{"version": 2}'
+
+        assert run_update(dry_run=True).exit_code == UpdateSuccessCodes.COMPLETE
+        assert Path(project, "frontend", "package.json").read_text() == (
+            '{"version": 1}'
+        )
+        assert run_update().exit_code == UpdateSuccessCodes.COMPLETE
+        assert run_update().exit_code == UpdateSuccessCodes.UP_TO_DATE
+
+    @staticmethod
+    def test_missing_manifest(project: Path):
+        Path(project, "zentra.template.json").unlink()
+
+        with pytest.raises(typer.Exit) as excinfo:
+            Update(offline=True)
+
+        assert excinfo.value.exit_code == UpdateErrorCodes.MANIFEST_NOT_FOUND
+
+    @staticmethod
+    def test_project_not_found(tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ZENTRA_ROOT", str(tmp_path))
+
+        with pytest.raises(typer.Exit) as excinfo:
+            Update(offline=True)
+
+        assert excinfo.value.exit_code == CommonErrorCodes.PROJECT_NOT_FOUND
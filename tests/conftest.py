@@ -1,8 +1,11 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+import threading
 import pytest
 from math import ceil
 
-from zentra_api.utils.package import package_path
+from zentra_sdk.cli.builder.client import docker_connection
+from zentra_sdk.cli.conf.config import SETTINGS_ENV_VARS, TEMPLATE_ENV_VARS
 
 
 @pytest.fixture
@@ -13,15 +16,55 @@ def key_length() -> int:
     return _key_length
 
 
-@pytest.fixture(scope="session", autouse=True)
-def clear_logs_after_tests(request):
-    path = package_path("zentra_sdk", ["logs"])
-    filepath = Path(path, "testing.log")
+@pytest.fixture(autouse=True)
+def reset_docker_connection():
+    docker_connection.reset()
+    yield
+    docker_connection.reset()
 
-    if filepath.exists():
 
-        def clear_log_file():
-            with open(filepath, "w") as file:
-                file.truncate(0)
+@pytest.fixture(autouse=True)
+def isolate_user_config(tmp_path_factory, monkeypatch):
+    """Keeps the user's config, logs, caches and snapshots out of test runs."""
+    home = tmp_path_factory.mktemp("home")
 
-        request.addfinalizer(clear_log_file)
+    for var, name in [
+        ("XDG_CONFIG_HOME", "config"),
+        ("XDG_STATE_HOME", "state"),
+        ("XDG_CACHE_HOME", "cache"),
+        ("XDG_DATA_HOME", "data"),
+        ("BUN_INSTALL_CACHE_DIR", "bun"),
+    ]:
+        monkeypatch.setenv(var, str(Path(home, name)))
+
+    for var in [*TEMPLATE_ENV_VARS.values(), *SETTINGS_ENV_VARS.values()]:
+        monkeypatch.delenv(var, raising=False)
+
+
+class RegistryHandler(BaseHTTPRequestHandler):
+    """Answers the API root like a `registry:2` container, with the status set on the server."""
+
+    def do_GET(self):
+        status = self.server.status if self.path == "/v2/" else 404
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def registry_server():
+    """A local stand-in for a registry, such as a pull-through mirror. Yields its `http://host:port` address."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RegistryHandler)
+    server.status = 200
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,42 @@
+import io
+import tarfile
+from pathlib import Path
+from typing import Iterable
+
+# Maximum bytes requested from the Docker API per archive chunk
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+
+
+class ChunkStream(io.RawIOBase):
+    """A read-only file object over an iterable of byte chunks. Only holds one chunk in memory at a time."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def extract_stream(
+    chunks: Iterable[bytes],
+    dest: Path | str = ".",
+    buffer_size: int = ARCHIVE_CHUNK_SIZE,
+) -> None:
+    """Extracts a tar archive from a stream of byte chunks, writing each member as it arrives."""
+    stream = io.BufferedReader(ChunkStream(chunks), buffer_size=buffer_size)
+
+    with tarfile.open(fileobj=stream, mode="r|*") as tar:
+        tar.extractall(path=dest, filter="data")
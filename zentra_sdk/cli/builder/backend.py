@@ -0,0 +1,227 @@
+import io
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Callable, Iterator
+
+import click
+import typer
+
+from zentra_sdk.cli.conf.logger import ErrorLoggers
+from zentra_sdk.cli.constants import CommonErrorCodes
+
+BACKEND_INIT_ARGS = ["init", "backend", "--hide-output"]
+
+
+class LogWriter:
+    """A text stream that sends each complete line written to it to a logging function."""
+
+    def __init__(self, log: Callable[[str], None]) -> None:
+        self.log = log
+        self._buffer = ""
+
+    def write(self, text: str) -> int:
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+
+        for line in lines:
+            if line.strip():
+                self.log(line.rstrip())
+
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Sends any unfinished line."""
+        if self._buffer.strip():
+            self.log(self._buffer.rstrip())
+
+        self._buffer = ""
+
+
+class OutputRouter:
+    """Stands in for a standard stream, sending the writes of registered threads to their own targets."""
+
+    def __init__(self, original) -> None:
+        self.original = original
+        self.targets: dict[int, LogWriter] = {}
+
+    def _target(self):
+        return self.targets.get(threading.get_ident(), self.original)
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self.original, name)
+
+
+_router_lock = threading.Lock()
+
+
+@contextmanager
+def capture_thread_output(stdout: LogWriter, stderr: LogWriter) -> Iterator[None]:
+    """
+    Captures the standard output and error of the current thread only, so other threads, such as progress displays, keep writing to the terminal.
+    """
+    thread = threading.get_ident()
+    streams = {"stdout": stdout, "stderr": stderr}
+
+    with _router_lock:
+        for name, target in streams.items():
+            stream = getattr(sys, name)
+            if not isinstance(stream, OutputRouter):
+                stream = OutputRouter(stream)
+                setattr(sys, name, stream)
+
+            stream.targets[thread] = target
+
+    try:
+        yield
+    finally:
+        with _router_lock:
+            for name in streams:
+                stream = getattr(sys, name)
+                if isinstance(stream, OutputRouter):
+                    stream.targets.pop(thread, None)
+                    if not stream.targets:
+                        setattr(sys, name, stream.original)
+
+        stdout.close()
+        stderr.close()
+
+
+def backend_command() -> click.Command:
+    """Loads the `zentra-api` command line app."""
+    try:
+        from zentra_api.cli.main import app
+    except ImportError:
+        raise typer.Exit(code=CommonErrorCodes.BACKEND_NOT_INSTALLED)
+
+    return typer.main.get_command(app)
+
+
+def run_backend_init(args: list[str] = BACKEND_INIT_ARGS) -> int:
+    """Runs the `zentra-api` command line app in the current process. Returns its exit code."""
+    command = backend_command()
+
+    try:
+        result = command.main(args, prog_name="zentra-api", standalone_mode=False)
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        return 1
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+
+    return result if isinstance(result, int) else 0
+
+
+def _isolated_init(args: list[str], cwd: str) -> tuple[int, str]:
+    """Runs the backend init inside a worker process. Returns its exit code and output."""
+    os.chdir(cwd)
+    output = io.StringIO()
+
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            code = run_backend_init(args)
+        except typer.Exit as e:
+            code = e.exit_code.value
+
+    return code, output.getvalue()
+
+
+def worker_context() -> multiprocessing.context.BaseContext:
+    """Uses a fork server where available, so workers never inherit the threads of the CLI."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+
+    return multiprocessing.get_context("spawn")
+
+
+def worker_pool(max_workers: int = 1) -> ProcessPoolExecutor:
+    """Creates a pool of worker processes for creating backends, started up front so they're ready when needed."""
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=worker_context())
+
+    for _ in range(max_workers):
+        executor.submit(os.getpid)
+
+    return executor
+
+
+class BackendInit:
+    """
+    Creates the backend with the `zentra_api` package. By default it runs in-process, with its output sent to the task loggers. With `isolated`, it runs in a worker process that is started up front, so it's ready when the task begins.
+
+    A shared `executor` can be given instead, to run many backends in the same worker pool.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        loggers: ErrorLoggers,
+        isolated: bool = False,
+        executor: ProcessPoolExecutor | None = None,
+    ) -> None:
+        self.root = Path(root)
+        self.loggers = loggers
+        self.isolated = isolated or executor is not None
+
+        self._owns_executor = executor is None and self.isolated
+        self._executor = worker_pool() if self._owns_executor else executor
+
+    def _run_in_process(self) -> int:
+        stdout = LogWriter(self.loggers.stdout.info)
+        stderr = LogWriter(self.loggers.stderr.error)
+
+        with capture_thread_output(stdout, stderr):
+            return run_backend_init(BACKEND_INIT_ARGS)
+
+    def _run_isolated(self) -> int:
+        future = self._executor.submit(
+            _isolated_init, BACKEND_INIT_ARGS, str(self.root)
+        )
+        code, output = future.result()
+
+        writer = LogWriter(self.loggers.stdout.info)
+        writer.write(output)
+        writer.close()
+
+        if code == CommonErrorCodes.BACKEND_NOT_INSTALLED.value:
+            raise typer.Exit(code=CommonErrorCodes.BACKEND_NOT_INSTALLED)
+
+        return code
+
+    def run(self) -> None:
+        """Creates the backend, raising an exit code if it fails."""
+        try:
+            code = self._run_isolated() if self.isolated else self._run_in_process()
+        finally:
+            self.close()
+
+        self.loggers.stdout.info(
+            "Command finished: zentra-api init backend", exit_code=code
+        )
+
+        if code != 0 or not Path(self.root, "backend").is_dir():
+            self.loggers.stderr.error("Backend creation failed", exit_code=code)
+            raise typer.Exit(code=CommonErrorCodes.BACKEND_INIT_FAILED)
+
+    def close(self) -> None:
+        """Stops the worker process, if it isn't shared."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+        self._executor = None
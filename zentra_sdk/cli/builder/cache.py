@@ -0,0 +1,210 @@
+import json
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+from pydantic import BaseModel
+
+from zentra_sdk.cli.conf.profiler import profiler
+from zentra_sdk.cli.conf.config import settings
+from zentra_sdk.cli.constants import UserPaths
+
+
+class CacheEntry(BaseModel):
+    """Information about a single cached template."""
+
+    digest: str
+    image: str
+    size: int
+    created: float
+    last_used: float
+
+
+def dir_size(path: Path) -> int:
+    """Returns the total size of the files inside a directory."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            total += os.lstat(os.path.join(dirpath, filename)).st_size
+
+    return total
+
+
+def _lock_file(file: IO) -> None:
+    """Takes an exclusive lock on an open file, waiting for any other process that holds it."""
+    try:
+        import fcntl
+
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    except ImportError:  # pragma: no cover
+        import msvcrt
+
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(file: IO) -> None:
+    try:
+        import fcntl
+
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    except ImportError:  # pragma: no cover
+        import msvcrt
+
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Holds an exclusive lock on a file, shared between processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "a+b") as file:
+        _lock_file(file)
+        try:
+            yield
+        finally:
+            _unlock_file(file)
+
+
+class TemplateCache:
+    """
+    A user-level cache of extracted frontend templates, keyed by the content digest of the image they came from. Least recently used entries are evicted when the cache exceeds its disk budget.
+
+    Every change to the index, and every copy out of the cache, holds a lock shared between processes, so runs at the same time never lose entries or evict a template that's being restored.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.root = root or UserPaths().TEMPLATES
+        self.max_bytes = settings().cache_max_bytes if max_bytes is None else max_bytes
+        self.index_path = Path(self.root, "index.json")
+        self.lock_path = Path(self.root, ".lock")
+
+    def _locked(self):
+        return file_lock(self.lock_path)
+
+    def _load(self) -> dict[str, CacheEntry]:
+        """Reads the cache index."""
+        if not self.index_path.is_file():
+            return {}
+
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+        return {digest: CacheEntry(**entry) for digest, entry in data.items()}
+
+    def _save(self, index: dict[str, CacheEntry]) -> None:
+        """Writes the cache index atomically."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(self.root, f".index-{uuid.uuid4().hex}.json")
+        tmp_path.write_text(
+            json.dumps({digest: entry.model_dump() for digest, entry in index.items()})
+        )
+        os.replace(tmp_path, self.index_path)
+
+    def entry_path(self, digest: str) -> Path:
+        """Returns the directory that holds the template for a digest."""
+        return Path(self.root, digest.replace(":", "-"))
+
+    def entries(self) -> list[CacheEntry]:
+        """Returns the cache entries, most recently used first."""
+        return sorted(self._load().values(), key=lambda e: e.last_used, reverse=True)
+
+    def get(self, digest: str) -> Path | None:
+        """Returns the cached template directory for a digest, if it exists."""
+        with self._locked():
+            return self._get(digest)
+
+    def _get(self, digest: str) -> Path | None:
+        index = self._load()
+        path = self.entry_path(digest)
+
+        if digest not in index or not path.is_dir():
+            return None
+
+        index[digest].last_used = time.time()
+        self._save(index)
+        return path
+
+    def restore(self, digest: str, dest: Path) -> bool:
+        """Copies a cached template into the destination directory. Returns `True` on a cache hit."""
+        with self._locked():
+            path = self._get(digest)
+            if path is None:
+                return False
+
+            with profiler.span("cache.restore", category="files", digest=digest):
+                shutil.copytree(path, dest, dirs_exist_ok=True)
+
+        return True
+
+    def store(self, digest: str, source: Path, image: str) -> None:
+        """Adds a template directory to the cache under the given digest."""
+        path = self.entry_path(digest)
+        if path.is_dir():
+            return
+
+        # Copied before taking the lock, so other runs aren't kept waiting
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(self.root, f".tmp-{uuid.uuid4().hex}")
+        with profiler.span("cache.store", category="files", digest=digest):
+            shutil.copytree(source, Path(tmp_path, source.name))
+
+        with self._locked():
+            try:
+                os.rename(tmp_path, path)
+            except OSError:
+                # Another process stored the same template first
+                shutil.rmtree(tmp_path, ignore_errors=True)
+                return
+
+            now = time.time()
+            index = self._load()
+            index[digest] = CacheEntry(
+                digest=digest,
+                image=image,
+                size=dir_size(path),
+                created=now,
+                last_used=now,
+            )
+            self._prune(index, keep=digest)
+            self._save(index)
+
+    def prune(self, all: bool = False, keep: str | None = None) -> list[CacheEntry]:
+        """Evicts the least recently used entries until the cache fits its budget. Returns the removed entries."""
+        with self._locked():
+            index = self._load()
+            removed = self._prune(index, all=all, keep=keep)
+
+            if removed:
+                self._save(index)
+
+        return removed
+
+    def _prune(
+        self, index: dict[str, CacheEntry], all: bool = False, keep: str | None = None
+    ) -> list[CacheEntry]:
+        """Removes entries from the index and disk, oldest first, until it fits the budget."""
+        removed = []
+        total = sum(entry.size for entry in index.values())
+
+        for entry in sorted(index.values(), key=lambda e: e.last_used):
+            if not all and (total <= self.max_bytes or entry.digest == keep):
+                continue
+
+            shutil.rmtree(self.entry_path(entry.digest), ignore_errors=True)
+            del index[entry.digest]
+            total -= entry.size
+            removed.append(entry)
+
+        return removed
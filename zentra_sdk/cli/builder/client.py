@@ -0,0 +1,72 @@
+import threading
+
+import docker
+from docker.constants import DEFAULT_TIMEOUT_SECONDS
+from docker.errors import DockerException
+from requests.exceptions import RequestException
+
+from zentra_sdk.cli.conf.config import settings
+
+
+class DockerConnection:
+    """A lazily created Docker client, shared by every part of the CLI that uses Docker."""
+
+    def __init__(self, probe_timeout: float | None = None) -> None:
+        self._probe_timeout = probe_timeout
+
+        self._client: docker.DockerClient | None = None
+        self._available: bool | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def probe_timeout(self) -> float:
+        """The probe timeout, read from `ZENTRA_DOCKER_TIMEOUT` unless one was given."""
+        if self._probe_timeout is None:
+            self._probe_timeout = settings().docker_timeout
+
+        return self._probe_timeout
+
+    @property
+    def client(self) -> docker.DockerClient:
+        """The shared client. Connects on first access, failing fast if the daemon doesn't respond."""
+        with self._lock:
+            if self._client is None:
+                client = docker.from_env(timeout=self.probe_timeout)
+                client.api.timeout = DEFAULT_TIMEOUT_SECONDS
+                self._client = client
+
+        return self._client
+
+    def available(self) -> bool:
+        """Checks if the Docker daemon is reachable. The result is cached for the rest of the process."""
+        if self._available is None:
+            self._available = self._probe()
+
+        return self._available
+
+    def _probe(self) -> bool:
+        """Pings the Docker daemon using the short probe timeout."""
+        try:
+            api = self.client.api
+            api.timeout = self.probe_timeout
+
+            try:
+                self.client.ping()
+            finally:
+                api.timeout = DEFAULT_TIMEOUT_SECONDS
+
+            return True
+        except (DockerException, RequestException):
+            return False
+
+    def reset(self) -> None:
+        """Closes the shared client and clears the cached availability."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+
+            self._client = None
+            self._available = None
+
+
+docker_connection = DockerConnection()
@@ -1,60 +1,455 @@
-import os
-import tarfile
+import hashlib
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path, PurePosixPath
+from typing import Iterator
 
 import docker
+from docker.errors import DockerException, ImageNotFound, NotFound
 from docker.models.containers import Container
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr
+from requests.exceptions import RequestException
+from rich.progress import Progress
+
+from zentra_sdk.cli.builder.archive import ARCHIVE_CHUNK_SIZE, extract_stream
+from zentra_sdk.cli.builder.client import docker_connection
+from zentra_sdk.cli.builder.registry import probe_registry, registry_host
+from zentra_sdk.cli.builder.sync import sync_tree
+from zentra_sdk.cli.conf.profiler import profiler
+from zentra_sdk.cli.builder.tasks import TaskCancelled, task_progress
+
+# Data-only images have no command of their own. The container never starts, so any placeholder works
+PLACEHOLDER_COMMAND = ["/template"]
+
+# Labels on created containers, so each run only removes its own leftovers
+CONTAINER_LABEL = "dev.zentra.container"
+RUN_LABEL = "dev.zentra.run"
+
+LAYER_STATUSES = {
+    "Pulling fs layer",
+    "Waiting",
+    "Downloading",
+    "Verifying Checksum",
+    "Download complete",
+    "Extracting",
+    "Pull complete",
+    "Already exists",
+}
+
+
+class PullStats(BaseModel):
+    """Transfer statistics for a single image pull."""
+
+    layers: int = 0
+    bytes: int = 0
+    up_to_date: bool = False
+    duration: float = 0.0
+    download_time: float = 0.0
+    extract_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """The average download speed in MB/s."""
+        if self.download_time == 0:
+            return 0.0
+
+        return self.bytes / 1024**2 / self.download_time
+
+    def summary(self) -> str:
+        """Returns a one line description of the pull."""
+        if self.up_to_date:
+            return "Image is up to date, skipped the pull"
+
+        return (
+            f"Pulled {self.layers} layers ({self.bytes / 1024**2:.1f} MB) in {self.duration:.1f}s: "
+            f"download {self.download_time:.1f}s at {self.throughput:.1f} MB/s, "
+            f"extract {self.extract_time:.1f}s"
+        )
+
+
+class LayerTracker:
+    """Turns the events of a streaming image pull into progress rows and pull statistics."""
+
+    def __init__(self, progress: Progress) -> None:
+        self.progress = progress
+        self.rows: dict[str, int] = {}
+        self.downloaded: dict[str, int] = {}
+        self.phases: dict[str, list[float]] = {}
+        self.start = time.perf_counter()
+
+    def _mark(self, phase: str) -> None:
+        """Records the first and latest time a pull phase was seen."""
+        now = time.perf_counter()
+        times = self.phases.setdefault(phase, [now, now])
+        times[1] = now
+
+    def _row(self, layer: str) -> int:
+        if layer not in self.rows:
+            self.rows[layer] = self.progress.add_task(
+                f"  Layer {layer}", total=None, transfer=True
+            )
+
+        return self.rows[layer]
+
+    def update(self, event: dict) -> None:
+        """Applies a single pull event."""
+        if "error" in event:
+            raise DockerException(event["error"])
+
+        layer, status = event.get("id"), event.get("status", "")
+        if not layer or status not in LAYER_STATUSES:
+            return
+
+        detail = event.get("progressDetail") or {}
+        row = self._row(layer)
+
+        if status == "Downloading" and detail.get("total"):
+            self._mark("download")
+            self.downloaded[layer] = detail["current"]
+            self.progress.update(
+                row, total=detail["total"], completed=detail["current"]
+            )
+        elif status == "Download complete":
+            self._mark("download")
+            total = self.progress.tasks[row].total
+            if total:
+                self.downloaded[layer] = int(total)
+                self.progress.update(row, completed=total)
+        elif status == "Extracting":
+            self._mark("extract")
+            self.progress.update(row, description=f"  Layer {layer}: extracting")
+        elif status in ("Pull complete", "Already exists"):
+            self._mark("extract")
+            total = self.progress.tasks[row].total or 1
+            self.progress.update(
+                row,
+                description=f"  Layer {layer}: {status.lower()}",
+                total=total,
+                completed=total,
+            )
+
+    def stats(self) -> PullStats:
+        """Returns the statistics for the pull so far."""
+
+        def elapsed(phase: str) -> float:
+            first, last = self.phases.get(phase, [0.0, 0.0])
+            return last - first
+
+        return PullStats(
+            layers=len(self.rows),
+            bytes=sum(self.downloaded.values()),
+            duration=time.perf_counter() - self.start,
+            download_time=elapsed("download"),
+            extract_time=elapsed("extract"),
+        )
+
+
+def new_run_id() -> str:
+    """Returns a random id for a run that has no project directory of its own."""
+    return uuid.uuid4().hex[:12]
+
+
+def project_run_id(root: Path) -> str:
+    """Returns the run id for a project directory, so a rerun can find the containers an interrupted run left behind."""
+    return hashlib.sha256(str(Path(root).resolve()).encode()).hexdigest()[:12]
 
 
 class DockerBuilder(BaseModel):
-    """Contains information and methods for using docker containers."""
+    """
+    Contains information and methods for using docker containers.
+
+    Images are pulled from the first reachable `mirrors`, falling back to the `registry` (Docker Hub by default). An `image_digest` pins the exact image to use.
+
+    When the image isn't published under its `tag` and there's no local copy, the `fallback_tag` is used instead.
+
+    The pull is skipped when the local image already matches the remote digest. With `keep_image`, the image is kept after use so later runs can reuse it. When it isn't set, only images with a tag in `keep_tags` are kept.
+
+    `cancel` stops a running `use` from another thread, before its next step or copied chunk.
+
+    Containers are named and labelled with the `run_id`, so runs at the same time never touch each other's containers.
+    """
 
     image_name: str
     container_name: str
+    tag: str = "latest"
+    fallback_tag: str | None = None
+    registry: str | None = None
+    image_digest: str | None = None
+    mirrors: list[str] = Field(default_factory=list)
+    mirror_timeout: float = 5.0
+    keep_image: bool | None = None
+    keep_tags: list[str] = Field(default_factory=list)
+    run_id: str = Field(default_factory=new_run_id)
 
     _client = PrivateAttr(None)
+    _reachable: dict[str, bool] = PrivateAttr(default_factory=dict)
+    _remote_digest: list[str | None] = PrivateAttr(default_factory=list)
+    _cancelled: threading.Event = PrivateAttr(default_factory=threading.Event)
+    _container: Container | None = PrivateAttr(None)
 
     def model_post_init(self, __context) -> None:
-        self._client = docker.from_env()
+        self._client = docker_connection.client
 
     @property
     def client(self) -> docker.DockerClient:
         return self._client
 
-    def use(self, path: str) -> None:
-        """Performs a set of required docker operations: pull, run, copy, and cleanup."""
-        self.pull()
-        container = self.run()
+    @property
+    def repository(self) -> str:
+        if self.registry:
+            return f"{registry_host(self.registry)}/{self.image_name}"
+
+        return self.image_name
 
-        self.copy(container, path)
-        self.cleanup(container)
+    @property
+    def image(self) -> str:
+        return f"{self.repository}:{self.tag}"
 
-    def pull(self) -> None:
-        """Pulls the docker image."""
-        self.client.images.pull(f"{self.image_name}:latest")
+    @property
+    def keeps_image(self) -> bool:
+        if self.keep_image is not None:
+            return self.keep_image
 
-    def run(self) -> Container:
-        """Runs the docker container."""
-        return self.client.containers.run(
-            f"{self.image_name}:latest",
-            name=self.container_name,
-            detach=True,
-        )
+        return self.tag in self.keep_tags
+
+    @property
+    def run_container_name(self) -> str:
+        return f"{self.container_name}-{self.run_id}"
 
-    def copy(self, container: Container, path: str) -> None:
-        bits, _ = container.get_archive(path=path)
+    def reference(self, repository: str) -> str:
+        """The image reference to pull from a repository, by digest when pinned."""
+        if self.image_digest:
+            return f"{repository}@{self.image_digest}"
 
-        with open("temp.tar", "wb") as f:
-            for chunk in bits:
-                f.write(chunk)
+        return f"{repository}:{self.tag}"
 
-        with tarfile.open("temp.tar") as tar:
-            tar.extractall(path=".")
+    def sources(self) -> Iterator[str]:
+        """Yields the repositories to try in order: each reachable mirror, then the registry."""
+        for mirror in self.mirrors:
+            if mirror not in self._reachable:
+                self._reachable[mirror] = probe_registry(mirror, self.mirror_timeout)
 
-        os.remove("temp.tar")
+            if self._reachable[mirror]:
+                yield f"{registry_host(mirror)}/{self.image_name}"
+
+        yield self.repository
+
+    def use(
+        self,
+        path: str,
+        dest: str = ".",
+        progress: Progress | None = None,
+        extra: dict[str, Path] | None = None,
+    ) -> PullStats:
+        """
+        Performs a set of required docker operations: pull, create, copy, and cleanup. Returns the pull statistics.
+
+        `extra` maps any other container paths to copy to the directory their contents are merged into.
+        """
+        self.resolve_tag()
+        stats = PullStats(up_to_date=True) if self.up_to_date() else self.pull(progress)
+        self.check_cancelled()
+        self.remove_stale()
+        container = self._container = self.create()
+
+        try:
+            self.check_cancelled()
+            self.copy(container, path, dest)
+
+            for source, target in (extra or {}).items():
+                self.merge(container, source, target)
+        finally:
+            self._container = None
+            self.cleanup(container)
+
+        return stats
+
+    def cancel(self) -> None:
+        """Asks a running `use` to stop, removing its container so any copy in progress ends."""
+        self._cancelled.set()
+        container = self._container
+
+        if container is not None:
+            try:
+                container.remove(force=True)
+            except DockerException:
+                pass
+
+    def check_cancelled(self) -> None:
+        """Raises `TaskCancelled` if the builder has been cancelled."""
+        if self._cancelled.is_set():
+            raise TaskCancelled(f"Stopped using {self.image}")
+
+    def resolve_tag(self) -> None:
+        """Switches to the `fallback_tag` if the image can't be found under its tag, either remotely or locally."""
+        if self.fallback_tag in (None, self.tag) or self.image_digest:
+            return
+
+        if self.digest() is not None or self.exists_locally():
+            return
+
+        self.tag = self.fallback_tag
+        self._remote_digest.clear()
+
+    def exists_locally(self) -> bool:
+        """Checks if there's a local copy of the image."""
+        try:
+            self.client.images.get(self.image)
+        except (ImageNotFound, DockerException):
+            return False
+
+        return True
+
+    def digest(self) -> str | None:
+        """
+        Gets the content digest of the image from its registry without pulling it, using a single manifest lookup. Returns `None` if it can't be found.
+
+        A pinned digest is returned as is, and a lookup is only done once per builder.
+        """
+        if self.image_digest:
+            return self.image_digest
+
+        if not self._remote_digest:
+            self._remote_digest.append(self._lookup_digest())
+
+        return self._remote_digest[0]
+
+    def _lookup_digest(self) -> str | None:
+        with profiler.span("docker.digest", category="docker", image=self.image):
+            for repository in self.sources():
+                try:
+                    return self.client.images.get_registry_data(
+                        self.reference(repository)
+                    ).id
+                except DockerException:
+                    continue
+
+        return None
+
+    def local_digests(self) -> set[str]:
+        """Gets the registry digests of the local copy of the image, if there is one."""
+        try:
+            image = self.client.images.get(self.image)
+        except (ImageNotFound, DockerException):
+            return set()
+
+        return {
+            ref.split("@", 1)[1]
+            for ref in image.attrs.get("RepoDigests") or []
+            if "@" in ref
+        }
+
+    def up_to_date(self) -> bool:
+        """Checks if the local image matches the remote one, so it doesn't need pulling."""
+        remote = self.digest()
+        return remote is not None and remote in self.local_digests()
+
+    def pull(self, progress: Progress | None = None) -> PullStats:
+        """
+        Pulls the docker image, showing a progress row for each layer. Returns the pull statistics.
+
+        Each source is tried in turn until one succeeds. The image is then tagged with its usual name, so the rest of the steps don't depend on where it came from.
+        """
+        if progress is None:
+            with task_progress() as progress:
+                return self.pull(progress)
+
+        error: Exception | None = None
+
+        for repository in self.sources():
+            try:
+                stats = self._pull(repository, progress)
+            except (DockerException, RequestException) as e:
+                error = e
+                continue
+
+            self._retag(repository)
+            return stats
+
+        raise error
+
+    def _pull(self, repository: str, progress: Progress) -> PullStats:
+        """Pulls the image from a single repository."""
+        with profiler.span("docker.pull", category="docker", image=repository):
+            tracker = LayerTracker(progress)
+            events = self.client.api.pull(
+                repository,
+                tag=self.image_digest or self.tag,
+                stream=True,
+                decode=True,
+            )
+
+            for event in events:
+                tracker.update(event)
+
+            return tracker.stats()
+
+    def _retag(self, repository: str) -> None:
+        """Gives an image pulled from a mirror or by digest its usual name."""
+        pulled = self.reference(repository)
+        if pulled == self.image:
+            return
+
+        self.client.api.tag(pulled, self.repository, self.tag)
+
+        # A kept mirror reference keeps its registry digest, so the next run can skip the pull
+        if repository != self.repository and not self.keeps_image:
+            self.client.images.remove(pulled)
+
+    def remove_stale(self) -> None:
+        """Removes the containers left behind by an interrupted run with the same run id, if there are any."""
+        with profiler.span("docker.remove_stale", category="docker"):
+            stale = self.client.containers.list(
+                all=True, filters={"label": f"{RUN_LABEL}={self.run_id}"}
+            )
+
+            for container in stale:
+                try:
+                    container.remove(force=True)
+                except NotFound:
+                    pass
+
+    def create(self) -> Container:
+        """Creates the docker container without starting it. Its files can be copied, but it never runs."""
+        with profiler.span("docker.create", category="docker"):
+            return self.client.containers.create(
+                self.image,
+                command=PLACEHOLDER_COMMAND,
+                name=self.run_container_name,
+                labels={CONTAINER_LABEL: self.container_name, RUN_LABEL: self.run_id},
+            )
+
+    def copy(self, container: Container, path: str, dest: str = ".") -> None:
+        """Streams a path from the container straight into the destination directory."""
+        with profiler.span("docker.copy", category="docker", path=path):
+            bits, _ = container.get_archive(path=path, chunk_size=ARCHIVE_CHUNK_SIZE)
+            extract_stream(self._chunks(bits), dest)
+
+    def _chunks(self, bits: Iterator[bytes]) -> Iterator[bytes]:
+        """Passes on the chunks of an archive, stopping once the builder is cancelled."""
+        for chunk in bits:
+            self.check_cancelled()
+            yield chunk
+
+    def merge(self, container: Container, path: str, dest: Path) -> None:
+        """Merges the contents of a container directory into a local one, keeping the files already there."""
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.TemporaryDirectory(dir=dest.parent) as tmp:
+            self.copy(container, path, tmp)
+            sync_tree(Path(tmp, PurePosixPath(path).name), dest)
 
     def cleanup(self, container: Container) -> None:
-        """Stops a docker container and cleans up its files."""
-        container.stop()
-        container.remove()
-        self.client.images.remove(self.image_name)
+        """Removes a docker container and cleans up its files. The image is removed too, unless it's being kept."""
+        with profiler.span("docker.cleanup", category="docker"):
+            try:
+                container.remove(force=True)
+            except NotFound:
+                # Already removed by `cancel`
+                pass
+
+            if not self.keeps_image:
+                self.client.images.remove(self.image)
@@ -0,0 +1,78 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class InitJournal:
+    """
+    Records the completed steps of `zentra init` inside the project, so an interrupted or failed run can resume where it stopped.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """Checks if an unfinished run has left a journal behind."""
+        return self.path.is_file()
+
+    def _read(self) -> dict:
+        """Reads the journal, returning an empty one if it's missing or invalid."""
+        if not self.exists():
+            return {}
+
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def completed(self) -> set[str]:
+        """Returns the names of the completed steps."""
+        try:
+            return set(self._read()["completed"])
+        except (KeyError, TypeError):
+            return set()
+
+    def values(self) -> dict:
+        """Returns the values saved by the completed steps, for a resumed run to reuse."""
+        values = self._read().get("values")
+        return values if isinstance(values, dict) else {}
+
+    def _write(self, completed: set[str], values: dict) -> None:
+        """Writes the journal atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(self.path.parent, f"{self.path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "completed": sorted(completed),
+                    "values": values,
+                    "updated": time.time(),
+                }
+            )
+        )
+        os.replace(tmp_path, self.path)
+
+    def start(self) -> None:
+        """Creates the journal if it doesn't already exist."""
+        with self._lock:
+            if not self.exists():
+                self._write(set(), {})
+
+    def record(self, name: str, **values) -> None:
+        """Marks a step as completed, saving any values found along the way. Values of `None` are skipped."""
+        with self._lock:
+            saved = self.values()
+            saved.update(
+                {key: value for key, value in values.items() if value is not None}
+            )
+            self._write(self.completed() | {name}, saved)
+
+    def clear(self) -> None:
+        """Removes the journal once every step has completed."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,162 @@
+import json
+import os
+import shutil
+import tarfile
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Iterator
+
+INDEX_MEDIA_TYPES = {
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+}
+
+WHITEOUT_PREFIX = ".wh."
+OPAQUE_WHITEOUT = ".wh..wh..opq"
+
+
+class OCILayout:
+    """Reads the image layers from an on-disk OCI image layout directory, without a Docker daemon."""
+
+    def __init__(self, path: Path, platform: str = "linux/amd64") -> None:
+        self.path = Path(path)
+        self.platform = platform
+
+    def _blob_path(self, digest: str) -> Path:
+        algorithm, value = digest.split(":", 1)
+        return Path(self.path, "blobs", algorithm, value)
+
+    def _read_json(self, digest: str) -> dict:
+        return json.loads(self._blob_path(digest).read_text())
+
+    def _select(self, manifests: list[dict]) -> dict:
+        """Picks the manifest for the target platform, or the first one."""
+        for manifest in manifests:
+            platform = manifest.get("platform", {})
+            name = f"{platform.get('os')}/{platform.get('architecture')}"
+            if name == self.platform:
+                return manifest
+
+        return manifests[0]
+
+    def manifest(self) -> dict:
+        """Returns the image manifest, resolving any image indexes."""
+        descriptor = self._select(
+            json.loads(Path(self.path, "index.json").read_text())["manifests"]
+        )
+
+        while descriptor.get("mediaType") in INDEX_MEDIA_TYPES:
+            descriptor = self._select(
+                self._read_json(descriptor["digest"])["manifests"]
+            )
+
+        return self._read_json(descriptor["digest"])
+
+    @contextmanager
+    def layers(self) -> Iterator[Iterator[BinaryIO]]:
+        """Yields the layer blobs, lowest layer first."""
+
+        def blobs() -> Iterator[BinaryIO]:
+            for layer in self.manifest()["layers"]:
+                with open(self._blob_path(layer["digest"]), "rb") as f:
+                    yield f
+
+        yield blobs()
+
+
+class ImageArchive:
+    """Reads the image layers from a `docker save` archive, without a Docker daemon."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+    @contextmanager
+    def layers(self) -> Iterator[Iterator[BinaryIO]]:
+        """Yields the layer tarballs, lowest layer first."""
+        with tarfile.open(self.path) as archive:
+            manifest = json.load(archive.extractfile("manifest.json"))
+
+            def blobs() -> Iterator[BinaryIO]:
+                for name in manifest[0]["Layers"]:
+                    yield archive.extractfile(name)
+
+            yield blobs()
+
+
+def _member_path(name: str) -> PurePosixPath:
+    """Returns the relative path of a layer member, rejecting absolute paths and `..` parts."""
+    path = PurePosixPath(name.removeprefix("./"))
+
+    if path.is_absolute() or ".." in path.parts:
+        raise ValueError(f"Unsafe path in image layer: {name!r}")
+
+    return path
+
+
+def _inside(dest: Path, path: Path) -> Path:
+    """Checks that a path stays inside the destination, even through symlinked directories."""
+    resolved = Path(path.parent.resolve(), path.name)
+
+    if not resolved.is_relative_to(dest.resolve()):
+        raise ValueError(f"Image layer path escapes the destination: {path}")
+
+    return path
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif path.exists() or path.is_symlink():
+        os.remove(path)
+
+
+def apply_layer(
+    layer: BinaryIO,
+    prefix: str,
+    dest: Path,
+) -> None:
+    """
+    Applies one layer to the destination, keeping only the files under `prefix` and honouring whiteouts.
+
+    Members with absolute paths or `..` parts are rejected, and every removal is checked to stay inside the destination.
+    """
+    root = PurePosixPath(prefix)
+    written: set[PurePosixPath] = set()
+
+    with tarfile.open(fileobj=layer, mode="r|*") as tar:
+        for member in tar:
+            name = _member_path(member.name)
+            if name != root and root not in name.parents:
+                continue
+
+            target = Path(dest, name.parent)
+
+            if name.name == OPAQUE_WHITEOUT:
+                if target.is_dir():
+                    _inside(dest, target)
+                    for child in target.iterdir():
+                        if name.parent / child.name not in written:
+                            _remove(_inside(dest, child))
+                continue
+
+            if name.name.startswith(WHITEOUT_PREFIX):
+                removed = Path(target, name.name.removeprefix(WHITEOUT_PREFIX))
+                _remove(_inside(dest, removed))
+                continue
+
+            existing = _inside(dest, Path(dest, name))
+            if not (member.isdir() and existing.is_dir()):
+                _remove(existing)
+
+            member.name = str(name)
+            tar.extract(member, path=dest, filter="data")
+            written.add(name)
+
+
+def extract_layers(source: OCILayout | ImageArchive, path: str, dest: Path) -> None:
+    """Extracts a path from an image by applying its layers in order, without starting a container."""
+    prefix = path.strip("/")
+
+    with source.layers() as layers:
+        for layer in layers:
+            apply_layer(layer, prefix, Path(dest))
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from zentra_sdk.cli.constants import BUILD_IGNORE_DIRS
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class FileRecord(BaseModel):
+    """The stat details and content hash of a single input file."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+class ComponentRecord(BaseModel):
+    """The input files of a component and a digest that covers all of them."""
+
+    digest: str
+    files: dict[str, FileRecord] = Field(default_factory=dict)
+
+
+def file_hash(path: Path) -> str:
+    """Returns the SHA-256 hash of a file's contents."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            sha.update(chunk)
+
+    return sha.hexdigest()
+
+
+def input_files(root: Path, ignore: set[str] = BUILD_IGNORE_DIRS) -> list[str]:
+    """Returns the relative POSIX paths of the build inputs inside a directory."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in ignore]
+        rel_dir = Path(dirpath).relative_to(root)
+
+        for filename in filenames:
+            files.append(Path(rel_dir, filename).as_posix())
+
+    return sorted(files)
+
+
+def hash_component(
+    root: Path,
+    previous: ComponentRecord | None = None,
+    max_workers: int | None = None,
+) -> ComponentRecord:
+    """
+    Hashes the inputs of a component. Files with the same size and modification time as the `previous` record reuse its hash, so only changed files are read.
+    """
+    known = previous.files if previous else {}
+    records: dict[str, FileRecord] = {}
+    changed: list[tuple[str, os.stat_result]] = []
+
+    for name in input_files(root):
+        stat = os.stat(Path(root, name))
+        record = known.get(name)
+
+        if record and (record.size, record.mtime_ns) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            records[name] = record
+        else:
+            changed.append((name, stat))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        hashes = executor.map(lambda item: file_hash(Path(root, item[0])), changed)
+
+        for (name, stat), sha in zip(changed, hashes):
+            records[name] = FileRecord(
+                size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=sha
+            )
+
+    digest = hashlib.sha256()
+    for name in sorted(records):
+        digest.update(f"{name}\0{records[name].sha256}\n".encode())
+
+    return ComponentRecord(digest=digest.hexdigest(), files=records)
+
+
+class BuildManifest:
+    """
+    Stores the input hashes of each project component from its last successful build, so unchanged components can be skipped.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> dict[str, ComponentRecord]:
+        """Reads the component records from the manifest."""
+        if not self.path.is_file():
+            return {}
+
+        try:
+            data = json.loads(self.path.read_text())
+            return {
+                name: ComponentRecord(**record)
+                for name, record in data["components"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def save(self, components: dict[str, ComponentRecord]) -> None:
+        """Writes the component records to the manifest atomically."""
+        tmp_path = Path(self.path.parent, f".{self.path.name}-{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "components": {
+                        name: record.model_dump() for name, record in components.items()
+                    }
+                }
+            )
+        )
+        os.replace(tmp_path, self.path)
+
+    def record(self, name: str, component: ComponentRecord) -> None:
+        """Stores the record of a component that built successfully."""
+        components = self.load()
+        components[name] = component
+        self.save(components)
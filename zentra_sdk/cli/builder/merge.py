@@ -0,0 +1,155 @@
+import json
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+from zentra_sdk.cli.builder.manifest import file_hash
+from zentra_sdk.cli.builder.sync import copy_file
+
+
+def sdk_version() -> str:
+    """Returns the installed version of the SDK."""
+    try:
+        return version("zentra_sdk")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class TemplateManifest(BaseModel):
+    """The template version a project was created or last updated from, and the hash of each template file."""
+
+    sdk_version: str = Field(default_factory=sdk_version)
+    template: str | None = None
+    files: dict[str, str] = Field(default_factory=dict)
+
+    @classmethod
+    def scan(
+        cls,
+        root: Path,
+        names: list[str],
+        template: str | None = None,
+        max_workers: int | None = None,
+    ) -> "TemplateManifest":
+        """Hashes the template files inside a project."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hashes = executor.map(lambda name: file_hash(Path(root, name)), names)
+            files = dict(zip(names, hashes))
+
+        return cls(template=template, files=dict(sorted(files.items())))
+
+    @classmethod
+    def load(cls, path: Path) -> "TemplateManifest | None":
+        """Reads a manifest, returning `None` if it's missing or invalid."""
+        try:
+            return cls(**json.loads(Path(path).read_text()))
+        except (OSError, ValueError, TypeError, ValidationError):
+            return None
+
+    def save(self, path: Path) -> None:
+        """Writes the manifest atomically."""
+        tmp_path = Path(path.parent, f".{path.name}-{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(self.model_dump_json(indent=2))
+        os.replace(tmp_path, path)
+
+
+class UpdatePlan(BaseModel):
+    """The changes needed to move a project's template files from one template version to another."""
+
+    added: list[str] = Field(default_factory=list)
+    updated: list[str] = Field(default_factory=list)
+    removed: list[str] = Field(default_factory=list)
+    conflicts: list[str] = Field(default_factory=list)
+
+    @property
+    def changes(self) -> list[str]:
+        return self.added + self.updated + self.removed
+
+
+def _current_hashes(
+    root: Path, names: set[str], max_workers: int | None = None
+) -> dict[str, str | None]:
+    """Hashes the project's copy of each file, with `None` for missing files."""
+
+    def current(name: str) -> str | None:
+        path = Path(root, name)
+        return file_hash(path) if path.is_file() else None
+
+    ordered = sorted(names)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(ordered, executor.map(current, ordered)))
+
+
+def plan_update(
+    root: Path,
+    base: TemplateManifest,
+    new: TemplateManifest,
+    max_workers: int | None = None,
+) -> UpdatePlan:
+    """
+    Compares the old template, the new template and the project's files by their hashes. Files the user hasn't changed are updated, files the template hasn't changed are kept, and files both have changed are conflicts.
+    """
+    plan = UpdatePlan()
+    current = _current_hashes(root, set(base.files) | set(new.files), max_workers)
+
+    for name, new_hash in new.files.items():
+        base_hash = base.files.get(name)
+        ours = current[name]
+
+        if ours == new_hash or base_hash == new_hash:
+            continue
+
+        if ours is None:
+            (plan.added if base_hash is None else plan.conflicts).append(name)
+        elif ours == base_hash:
+            plan.updated.append(name)
+        else:
+            plan.conflicts.append(name)
+
+    for name in base.files.keys() - new.files.keys():
+        ours = current[name]
+
+        if ours == base.files[name]:
+            plan.removed.append(name)
+        elif ours is not None:
+            plan.conflicts.append(name)
+
+    plan.conflicts.sort()
+    plan.removed.sort()
+    return plan
+
+
+def apply_update(
+    plan: UpdatePlan,
+    source: Path,
+    root: Path,
+    max_workers: int | None = None,
+) -> None:
+    """Copies the added and updated files from the new template into the project, and deletes removed ones."""
+
+    def write(name: str) -> None:
+        dest = Path(root, name)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        copy_file(Path(source, name), dest)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(write, plan.added + plan.updated))
+
+    for name in plan.removed:
+        Path(root, name).unlink(missing_ok=True)
+
+
+def merged_manifest(
+    plan: UpdatePlan, base: TemplateManifest, new: TemplateManifest
+) -> TemplateManifest:
+    """Creates the manifest for an updated project. Conflicting files keep their old hash, so they're reported until resolved."""
+    files = {name: sha for name, sha in new.files.items() if name not in plan.conflicts}
+
+    for name in plan.conflicts:
+        if name in base.files:
+            files[name] = base.files[name]
+
+    return TemplateManifest(template=new.template, files=dict(sorted(files.items())))
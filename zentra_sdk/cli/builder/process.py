@@ -0,0 +1,77 @@
+import subprocess
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.markup import escape
+
+from zentra_sdk.cli.conf.logger import DebugLogger
+from zentra_sdk.cli.conf.profiler import profiler
+
+
+class PrefixedOutput:
+    """Writes the output of a worker to the console, prefixing each line with the worker's name."""
+
+    def __init__(
+        self,
+        name: str,
+        colour: str,
+        console: Console,
+        logger: DebugLogger | None = None,
+        width: int = 8,
+    ) -> None:
+        self.name = name
+        self.prefix = f"[{colour}]{name:>{width}} |[/{colour}] "
+        self.console = console
+        self.logger = logger
+
+    def write(self, line: str) -> None:
+        """Writes a single line of output."""
+        line = line.rstrip()
+        self.console.print(self.prefix + escape(line), highlight=False)
+
+        if self.logger is not None:
+            self.logger.info(f"{self.name} | {line}")
+
+    def finish(self, cmd: list[str], exit_code: int, duration: float) -> None:
+        """Logs the outcome of a command."""
+        if self.logger is not None:
+            self.logger.info(
+                f"Command finished: {' '.join(cmd)}",
+                exit_code=exit_code,
+                duration=round(duration, 3),
+            )
+
+
+def run_streamed(cmd: list[str], cwd: Path, output: PrefixedOutput) -> int:
+    """Runs a command, streaming its combined stdout and stderr into `output` line by line. Returns its exit code."""
+    start = time.perf_counter()
+
+    with profiler.span("subprocess", category="process", cmd=" ".join(cmd)):
+        exit_code = _run_streamed(cmd, cwd, output)
+
+    output.finish(cmd, exit_code, time.perf_counter() - start)
+    return exit_code
+
+
+def _run_streamed(cmd: list[str], cwd: Path, output: PrefixedOutput) -> int:
+    try:
+        process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
+    except FileNotFoundError:
+        output.write(f"Command not found: {cmd[0]}")
+        return 127
+
+    with process.stdout:
+        for line in process.stdout:
+            output.write(line)
+
+    return process.wait()
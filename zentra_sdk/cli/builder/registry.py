@@ -0,0 +1,24 @@
+import urllib.error
+import urllib.request
+
+
+def registry_host(registry: str) -> str:
+    """Returns the host of a registry address, as used in image references."""
+    return registry.split("://", 1)[-1].rstrip("/")
+
+
+def registry_url(registry: str, path: str = "") -> str:
+    """Returns the URL of a registry API path. Registries without a scheme use HTTPS."""
+    base = registry.rstrip("/") if "://" in registry else f"https://{registry}"
+    return f"{base}/v2/{path}"
+
+
+def probe_registry(registry: str, timeout: float) -> bool:
+    """Checks if a registry answers its API root within the timeout. A request for credentials still counts."""
+    try:
+        with urllib.request.urlopen(registry_url(registry), timeout=timeout):
+            return True
+    except urllib.error.HTTPError as e:
+        return e.code == 401
+    except (urllib.error.URLError, OSError, ValueError):
+        return False
@@ -0,0 +1,81 @@
+import os
+import tarfile
+import uuid
+from importlib.resources.abc import Traversable
+from pathlib import Path
+
+from zentra_sdk.cli.builder.archive import ARCHIVE_CHUNK_SIZE, extract_stream
+from zentra_sdk.cli.builder.layers import ImageArchive, OCILayout, extract_layers
+from zentra_sdk.cli.constants import PackagePaths, UserPaths
+
+SNAPSHOT_PREFIX = "frontend-"
+SNAPSHOT_SUFFIX = ".tar.gz"
+
+
+def snapshot_name(version: str) -> str:
+    """Returns the archive filename for a snapshot version."""
+    return f"{SNAPSHOT_PREFIX}{version}{SNAPSHOT_SUFFIX}"
+
+
+class SnapshotStore:
+    """
+    Manages versioned frontend template archives for offline project creation. Exported snapshots take priority over the ones bundled with the package.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        bundled: Traversable | None = None,
+    ) -> None:
+        self.root = root or UserPaths().SNAPSHOTS
+        self.bundled = bundled or PackagePaths().SNAPSHOTS
+
+    @staticmethod
+    def _latest(snapshots: list) -> Traversable | None:
+        """Returns the snapshot with the highest version, if any."""
+        snapshots = [
+            item
+            for item in snapshots
+            if item.name.startswith(SNAPSHOT_PREFIX)
+            and item.name.endswith(SNAPSHOT_SUFFIX)
+        ]
+        return max(snapshots, key=lambda item: item.name, default=None)
+
+    def find(self, path: Path | None = None) -> Traversable | None:
+        """Finds the snapshot to use. Returns the given `path` if it exists, otherwise the latest exported or bundled snapshot."""
+        if path is not None:
+            return path if path.exists() else None
+
+        for folder in (self.root, self.bundled):
+            if folder.is_dir():
+                snapshot = self._latest(list(folder.iterdir()))
+                if snapshot is not None:
+                    return snapshot
+
+        return None
+
+    def export(self, source: Path, version: str, output: Path | None = None) -> Path:
+        """Archives a template directory as a snapshot. Returns the archive path."""
+        output = output or Path(self.root, snapshot_name(version))
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = Path(output.parent, f".{output.name}-{uuid.uuid4().hex}")
+        with tarfile.open(tmp_path, "w:gz") as tar:
+            tar.add(source, arcname=source.name)
+
+        os.replace(tmp_path, output)
+        return output
+
+
+def extract_snapshot(snapshot: Traversable, dest: Path) -> None:
+    """
+    Extracts the frontend into the destination directory from a snapshot archive, an OCI image layout directory or a `docker save` image archive.
+    """
+    if snapshot.is_dir():
+        return extract_layers(OCILayout(snapshot), "/frontend", dest)
+
+    if not snapshot.name.endswith(SNAPSHOT_SUFFIX):
+        return extract_layers(ImageArchive(snapshot), "/frontend", dest)
+
+    with snapshot.open("rb") as f:
+        extract_stream(iter(lambda: f.read(ARCHIVE_CHUNK_SIZE), b""), dest)
@@ -0,0 +1,158 @@
+import asyncio
+import os
+import signal
+import time
+from collections import defaultdict
+from contextlib import suppress
+from pathlib import Path
+
+from zentra_sdk.cli.builder.process import PrefixedOutput
+from zentra_sdk.cli.constants import (
+    DEV_MAX_BACKOFF,
+    DEV_RESTART_BACKOFF,
+    DEV_STABLE_AFTER,
+    DEV_STOP_TIMEOUT,
+)
+
+
+class Service:
+    """A long running command, such as a dev server, with the output its lines are written to."""
+
+    def __init__(
+        self,
+        name: str,
+        cmd: list[str],
+        cwd: Path,
+        output: PrefixedOutput,
+        env: dict[str, str] | None = None,
+    ) -> None:
+        self.name = name
+        self.cmd = cmd
+        self.cwd = cwd
+        self.output = output
+        self.env = env
+
+
+class Supervisor:
+    """
+    Runs services as child processes at the same time, streaming their output as it arrives. A service that crashes is restarted after a delay that doubles with each crash, and resets once it has stayed up for a while.
+
+    When cancelled, such as by Ctrl-C, every child is asked to stop and is killed if it doesn't within the timeout.
+    """
+
+    def __init__(
+        self,
+        services: list[Service],
+        backoff: float = DEV_RESTART_BACKOFF,
+        max_backoff: float = DEV_MAX_BACKOFF,
+        stable_after: float = DEV_STABLE_AFTER,
+        stop_timeout: float = DEV_STOP_TIMEOUT,
+    ) -> None:
+        self.services = services
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stable_after = stable_after
+        self.stop_timeout = stop_timeout
+
+        self.processes: dict[str, asyncio.subprocess.Process] = {}
+        self.restarts: dict[str, int] = defaultdict(int)
+        self._stopping = False
+
+    async def run(self) -> None:
+        """Runs every service until they have all exited, or the supervisor is cancelled."""
+        try:
+            await asyncio.gather(
+                *(self.supervise(service) for service in self.services)
+            )
+        finally:
+            self._stopping = True
+            await self.stop()
+
+    async def supervise(self, service: Service) -> None:
+        """Runs a service, restarting it with backoff whenever it crashes."""
+        delay = self.backoff
+
+        while True:
+            start = time.monotonic()
+            exit_code = await self._run_once(service)
+
+            if exit_code is None or self._stopping:
+                return
+
+            if exit_code == 0:
+                service.output.write("Exited")
+                return
+
+            if time.monotonic() - start >= self.stable_after:
+                delay = self.backoff
+
+            service.output.write(
+                f"Exited with code {exit_code}, restarting in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+            self.restarts[service.name] += 1
+            delay = min(delay * 2, self.max_backoff)
+
+    async def _run_once(self, service: Service) -> int | None:
+        """Runs a service until it exits. Returns its exit code, or `None` if it can't be started."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *service.cmd,
+                cwd=service.cwd,
+                env={**os.environ, **service.env} if service.env else None,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                # Its own process group, so the whole tree can be stopped together
+                start_new_session=os.name == "posix",
+            )
+        except FileNotFoundError:
+            service.output.write(f"Command not found: {service.cmd[0]}")
+            return None
+
+        self.processes[service.name] = process
+
+        await asyncio.gather(
+            self._stream(process.stdout, service.output),
+            self._stream(process.stderr, service.output),
+        )
+        exit_code = await process.wait()
+
+        del self.processes[service.name]
+        return exit_code
+
+    @staticmethod
+    async def _stream(reader: asyncio.StreamReader, output: PrefixedOutput) -> None:
+        """Writes each line from a child's output stream as soon as it arrives."""
+        while line := await reader.readline():
+            output.write(line.decode(errors="replace"))
+
+    @staticmethod
+    def _signal(process: asyncio.subprocess.Process, sig: int) -> None:
+        with suppress(ProcessLookupError):
+            if os.name == "posix":
+                os.killpg(process.pid, sig)
+            elif sig == signal.SIGTERM:
+                process.terminate()
+            else:
+                process.kill()
+
+    async def stop(self) -> None:
+        """Stops every running child, killing any that don't exit within the timeout."""
+        processes = [p for p in self.processes.values() if p.returncode is None]
+
+        for process in processes:
+            self._signal(process, signal.SIGTERM)
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(p.wait() for p in processes)), self.stop_timeout
+            )
+        except TimeoutError:
+            for process in processes:
+                self._signal(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+
+            await asyncio.gather(*(p.wait() for p in processes))
+
+        self.processes.clear()
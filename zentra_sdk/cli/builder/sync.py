@@ -0,0 +1,203 @@
+import filecmp
+import os
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources.abc import Traversable
+from pathlib import Path
+from typing import Iterator
+
+from pydantic import BaseModel
+
+# Linux ioctl that shares the blocks of one file with another (copy-on-write)
+FICLONE = 0x40049409
+
+# Trees with fewer files than this are copied on the calling thread
+PARALLEL_MIN_FILES = 32
+
+
+class SyncStats(BaseModel):
+    """The number of files copied and skipped by a sync."""
+
+    copied: int = 0
+    skipped: int = 0
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clones a file's blocks on filesystems that support it, such as Btrfs and XFS."""
+    try:
+        import fcntl
+
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+def _copy_range(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copies a file inside the kernel with `copy_file_range`, where it's available."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    try:
+        copied = 0
+        while copied < size:
+            n = os.copy_file_range(src_fd, dst_fd, size - copied)
+            if n == 0:
+                break
+            copied += n
+    except OSError:
+        return False
+
+    return copied == size
+
+
+def copy_file(src: Path, dest: Path) -> None:
+    """
+    Copies a file with its permissions and modification time, using a reflink or `copy_file_range` when possible. The destination is replaced atomically.
+    """
+    tmp_path = Path(dest.parent, f".{dest.name}.{uuid.uuid4().hex}.tmp")
+    size = os.stat(src).st_size
+
+    try:
+        with open(src, "rb") as fsrc, open(tmp_path, "wb") as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+
+            if not (_reflink(src_fd, dst_fd) or _copy_range(src_fd, dst_fd, size)):
+                # A failed kernel copy may have moved both file offsets
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst)
+
+        shutil.copystat(src, tmp_path)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _identical(src: Path, dest: Path) -> bool:
+    """Checks if two files match by size and modification time, falling back to their contents."""
+    try:
+        s, d = os.stat(src), os.stat(dest)
+    except FileNotFoundError:
+        return False
+
+    if s.st_size != d.st_size:
+        return False
+
+    if s.st_mtime_ns == d.st_mtime_ns:
+        return True
+
+    if filecmp.cmp(src, dest, shallow=False):
+        # Match the times so the next sync only needs a stat
+        os.utime(dest, ns=(d.st_atime_ns, s.st_mtime_ns))
+        return True
+
+    return False
+
+
+def _sync_file(src: Path, dest: Path) -> bool:
+    """Copies a file unless the destination is already identical. Returns `True` if it was copied."""
+    if _identical(src, dest):
+        return False
+
+    copy_file(src, dest)
+    return True
+
+
+def _sync_link(src: Path, dest: Path) -> bool:
+    """Copies a symlink as a symlink, unless the destination already points to the same place. Returns `True` if it was copied."""
+    link = os.readlink(src)
+
+    if dest.is_symlink() and os.readlink(dest) == link:
+        return False
+
+    tmp_path = Path(dest.parent, f".{dest.name}.{uuid.uuid4().hex}.tmp")
+    os.symlink(link, tmp_path)
+
+    try:
+        os.replace(tmp_path, dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return True
+
+
+def _is_link(resource: Traversable) -> bool:
+    return isinstance(resource, Path) and resource.is_symlink()
+
+
+def _write_resource(resource: Traversable, dest: Path) -> bool:
+    """Writes a resource that isn't on the filesystem, such as a file in a zip. Returns `True` if it was written."""
+    data = resource.read_bytes()
+
+    if (
+        dest.is_file()
+        and dest.stat().st_size == len(data)
+        and dest.read_bytes() == data
+    ):
+        return False
+
+    tmp_path = Path(dest.parent, f".{dest.name}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, dest)
+    return True
+
+
+def _walk(source: Traversable, parts: tuple[str, ...] = ()) -> Iterator:
+    """Yields the relative path parts and resource of every directory, file and symlink under a traversable. Symlinks aren't followed."""
+    for child in source.iterdir():
+        child_parts = (*parts, child.name)
+
+        if _is_link(child):
+            yield child_parts, child
+        elif child.is_dir():
+            yield child_parts, child
+            yield from _walk(child, child_parts)
+        elif child.is_file():
+            yield child_parts, child
+
+
+def sync_tree(
+    source: Traversable | Path,
+    dest: Path,
+    max_workers: int | None = None,
+) -> SyncStats:
+    """
+    Copies a directory tree into `dest`, skipping files that are already identical. Works with package resources, even when the package is installed as a zip.
+
+    Like `shutil.copytree`, empty directories are created and symlinks are copied as symlinks.
+    """
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    files = []
+
+    for parts, resource in _walk(source):
+        if resource.is_dir() and not _is_link(resource):
+            Path(dest, *parts).mkdir(parents=True, exist_ok=True)
+        else:
+            files.append((parts, resource))
+
+    def sync(item: tuple) -> bool:
+        parts, resource = item
+        target = Path(dest, *parts)
+
+        if _is_link(resource):
+            return _sync_link(resource, target)
+
+        if isinstance(resource, Path):
+            return _sync_file(resource, target)
+
+        return _write_resource(resource, target)
+
+    if len(files) < PARALLEL_MIN_FILES:
+        results = [sync(item) for item in files]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(sync, files))
+
+    copied = sum(results)
+    return SyncStats(copied=copied, skipped=len(results) - copied)
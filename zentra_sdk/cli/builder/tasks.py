@@ -0,0 +1,247 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import suppress
+import time
+from typing import Callable
+
+from pydantic import BaseModel, Field
+from rich.progress import (
+    DownloadColumn,
+    Progress,
+    ProgressColumn,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+    TransferSpeedColumn,
+)
+from rich.text import Text
+import typer
+
+from zentra_sdk.cli.conf.logger import DebugLogger, current_task
+from zentra_sdk.cli.conf.profiler import profiler
+from zentra_sdk.cli.constants import console
+
+
+class TaskCancelled(Exception):
+    """Raised by a task that stopped early because it was asked to."""
+
+
+class Task(BaseModel):
+    """
+    A single unit of work with the names of the tasks it depends on, and how to undo it if it fails.
+
+    `cancel` asks the task to stop early when the run is interrupted. It's called from another thread while the task is running.
+    """
+
+    name: str
+    func: Callable[[], None]
+    depends_on: list[str] = Field(default_factory=list)
+    description: str | None = None
+    rollback: Callable[[], None] | None = None
+    cancel: Callable[[], None] | None = None
+
+    @property
+    def label(self) -> str:
+        return self.description or self.name
+
+
+class TransferColumn(ProgressColumn):
+    """Shows the size, speed and time remaining of rows that transfer data, such as image layers."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.columns = [DownloadColumn(), TransferSpeedColumn(), TimeRemainingColumn()]
+
+    def render(self, task) -> Text:
+        if not task.fields.get("transfer") or task.total is None:
+            return Text("")
+
+        parts = [column.render(task) for column in self.columns]
+        return Text(" • ").join(parts)
+
+
+def task_progress() -> Progress:
+    """Creates the progress display used for running tasks, one row per task."""
+    return Progress(
+        SpinnerColumn(finished_text="[green]✓[/green]"),
+        TextColumn("[progress.description]{task.description}"),
+        TimeElapsedColumn(),
+        TransferColumn(),
+        console=console,
+        transient=False,
+    )
+
+
+class TaskScheduler:
+    """
+    Runs a graph of tasks on a thread pool. A task starts as soon as all of its dependencies have finished, so independent branches run at the same time.
+    """
+
+    def __init__(
+        self,
+        tasks: list[Task],
+        max_workers: int | None = None,
+        logger: DebugLogger | None = None,
+    ) -> None:
+        self.tasks = {task.name: task for task in tasks}
+        self.max_workers = max_workers or max(len(tasks), 1)
+        self.logger = logger
+        self.timings: dict[str, float] = {}
+
+        self.validate()
+
+    def validate(self) -> None:
+        """Checks that every dependency exists and the graph has no cycles."""
+        for task in self.tasks.values():
+            for dep in task.depends_on:
+                if dep not in self.tasks:
+                    raise ValueError(
+                        f"Task '{task.name}' depends on unknown task '{dep}'."
+                    )
+
+        self.order()
+
+    def order(self) -> list[str]:
+        """Returns the task names in a valid execution order."""
+        remaining = {name: set(task.depends_on) for name, task in self.tasks.items()}
+        ordered = []
+
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Cyclic task dependencies: {sorted(remaining)}.")
+
+            for name in ready:
+                ordered.append(name)
+                del remaining[name]
+
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+        return ordered
+
+    def run(
+        self,
+        progress: Progress | None = None,
+        completed: set[str] | None = None,
+        on_complete: Callable[[str], None] | None = None,
+    ) -> None:
+        """
+        Runs the tasks, respecting their dependencies. Tasks in `completed` are skipped and `on_complete` is called with the name of each task that finishes.
+
+        On an error or interrupt, the unfinished tasks are rolled back and the error is re-raised.
+        """
+        progress = progress or task_progress()
+        done = set(completed or ())
+
+        with progress:
+            rows = {}
+            for name, task in self.tasks.items():
+                if name in done:
+                    rows[name] = progress.add_task(
+                        f"{task.label} [dim](done)[/dim]", total=1, completed=1
+                    )
+                else:
+                    rows[name] = progress.add_task(task.label, total=1, start=False)
+
+            self._execute(progress, rows, done, on_complete)
+
+    def _execute(
+        self,
+        progress: Progress,
+        rows: dict[str, int],
+        done: set[str],
+        on_complete: Callable[[str], None] | None,
+    ) -> None:
+        """Submits tasks to the thread pool as their dependencies complete."""
+        pending = {name: task for name, task in self.tasks.items() if name not in done}
+        running: dict[Future, str] = {}
+        errors: dict[str, BaseException] = {}
+
+        def finish(future: Future, name: str) -> None:
+            if future.exception() is not None:
+                progress.stop_task(rows[name])
+                errors[name] = future.exception()
+                return
+
+            progress.update(rows[name], completed=1)
+            done.add(name)
+
+            if on_complete is not None:
+                on_complete(name)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while (pending or running) and not errors:
+                for name, task in list(pending.items()):
+                    if set(task.depends_on) <= done:
+                        progress.start_task(rows[name])
+                        running[executor.submit(self._timed, task)] = name
+                        del pending[name]
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    finish(future, running.pop(future))
+        except BaseException:
+            # Interrupted, so ask the running tasks to stop early
+            self.cancel([name for future, name in running.items() if not future.done()])
+            raise
+        finally:
+            # Threads can't be stopped, so wait for running tasks and keep their results before undoing any partial work
+            executor.shutdown(wait=True, cancel_futures=True)
+
+            for future, name in running.items():
+                if not future.cancelled():
+                    finish(future, name)
+
+            self.rollback(list(errors))
+
+        if errors:
+            raise next(iter(errors.values()))
+
+    def _timed(self, task: Task) -> None:
+        """Runs a task, recording how long it took and logging its outcome."""
+        token = current_task.set(task.name)
+        start = time.perf_counter()
+        exit_code = 1
+
+        try:
+            with profiler.span(task.name, category="task"):
+                task.func()
+            exit_code = 0
+        except typer.Exit as e:
+            exit_code = getattr(e.exit_code, "value", e.exit_code)
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            self.timings[task.name] = duration
+
+            if self.logger is not None:
+                log = self.logger.info if exit_code == 0 else self.logger.error
+                log(
+                    f"Task '{task.name}' finished",
+                    duration=round(duration, 3),
+                    exit_code=exit_code,
+                )
+
+            current_task.reset(token)
+
+    def cancel(self, names: list[str]) -> None:
+        """Asks running tasks to stop early."""
+        for name in names:
+            cancel = self.tasks[name].cancel
+
+            if cancel is not None:
+                with suppress(Exception):
+                    cancel()
+
+    def rollback(self, names: list[str]) -> None:
+        """Undoes the partial work of tasks that didn't finish."""
+        for name in names:
+            rollback = self.tasks[name].rollback
+
+            if rollback is not None:
+                # Never hide the original error behind a rollback failure
+                with suppress(Exception):
+                    rollback()
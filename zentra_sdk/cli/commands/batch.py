@@ -0,0 +1,195 @@
+import json
+import os
+import tempfile
+import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import typer
+from pydantic import BaseModel, Field, ValidationError
+
+from zentra_sdk.cli.builder.backend import BackendInit, worker_pool
+from zentra_sdk.cli.builder.client import docker_connection
+from zentra_sdk.cli.builder.sync import sync_tree
+from zentra_sdk.cli.builder.tasks import task_progress
+from zentra_sdk.cli.commands.setup import SetupTasks
+from zentra_sdk.cli.constants import (
+    CommonErrorCodes,
+    ProjectPaths,
+    SetupSuccessCodes,
+    console,
+)
+from zentra_sdk.cli.constants.display import batch_summary_table
+
+
+class ProjectSpec(BaseModel):
+    """A single project to create, with its own `.env.local` values."""
+
+    path: Path
+    env: dict[str, str] = Field(default_factory=dict)
+
+
+class BatchSpec(BaseModel):
+    """The projects to create with `zentra init --from-spec`, and the options shared by all of them."""
+
+    projects: list[ProjectSpec]
+    workers: int | None = None
+    offline: bool = False
+    warm: bool = False
+    snapshot: Path | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> "BatchSpec":
+        """Reads a spec from a TOML or JSON file. Relative project paths are resolved from the file's directory."""
+        path = Path(path)
+
+        try:
+            if path.suffix == ".json":
+                data = json.loads(path.read_text())
+            else:
+                data = tomllib.loads(path.read_text())
+
+            spec = cls(**data)
+        except (OSError, ValueError, TypeError, ValidationError):
+            raise typer.Exit(code=CommonErrorCodes.INVALID_SPEC)
+
+        for project in spec.projects:
+            project.path = Path(path.parent, project.path).resolve()
+
+        if spec.snapshot is not None:
+            spec.snapshot = Path(path.parent, spec.snapshot).resolve()
+
+        return spec
+
+
+class ProjectResult(BaseModel):
+    """The outcome of creating a single project."""
+
+    path: Path
+    duration: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def write_env(path: Path, values: dict[str, str]) -> None:
+    """Sets values in an env file, replacing existing keys and adding new ones."""
+    lines = path.read_text().splitlines() if path.is_file() else []
+    remaining = dict(values)
+
+    for i, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        if not line.lstrip().startswith("#") and key in remaining:
+            lines[i] = f"{key}={remaining.pop(key)}"
+
+    lines.extend(f"{key}={value}" for key, value in remaining.items())
+    path.write_text("\n".join(lines) + "\n")
+
+
+class BatchSetup:
+    """
+    Creates many projects at once for `zentra init --from-spec`. The frontend template is prepared once, then copied into each project while their backends are created in a pool of worker processes.
+    """
+
+    def __init__(self, spec_path: Path, test_logging: bool = False) -> None:
+        self.spec = BatchSpec.load(spec_path)
+        self.test_logging = test_logging
+
+        if not self.spec.offline and not docker_connection.available():
+            raise typer.Exit(code=CommonErrorCodes.DOCKER_NOT_INSTALLED)
+
+        self.workers = (
+            self.spec.workers or min(len(self.spec.projects), os.cpu_count() or 1) or 1
+        )
+
+    def prepare_template(self, root: Path) -> SetupTasks:
+        """Builds the shared project files, everything except the backend, into `root`."""
+        template_tasks = SetupTasks(
+            ProjectPaths(root),
+            test_logging=self.test_logging,
+            offline=self.spec.offline,
+            snapshot=self.spec.snapshot,
+            warm=self.spec.warm,
+        )
+        template_tasks.build_template()
+        return template_tasks
+
+    def create_project(
+        self,
+        project: ProjectSpec,
+        template: SetupTasks,
+        executor,
+    ) -> ProjectResult:
+        """Copies the template into a project and creates its backend."""
+        start = time.perf_counter()
+        paths = ProjectPaths(project.path)
+
+        def result(error: str | None = None) -> ProjectResult:
+            return ProjectResult(
+                path=project.path, duration=time.perf_counter() - start, error=error
+            )
+
+        if any(
+            path.is_dir() and any(path.iterdir())
+            for path in (paths.BACKEND_PATH, paths.FRONTEND_PATH)
+        ):
+            return result("already exists")
+
+        try:
+            paths.ROOT.mkdir(parents=True, exist_ok=True)
+            sync_tree(template.paths.ROOT, paths.ROOT)
+
+            if project.env:
+                write_env(paths.ENV_LOCAL, project.env)
+
+            BackendInit(paths.ROOT, template.logger, executor=executor).run()
+        except typer.Exit as e:
+            name = getattr(e.exit_code, "name", str(e.exit_code))
+            return result(name.lower().replace("_", " "))
+        except Exception as e:
+            template.logger.stderr.error(f"{project.path}: {e!r}")
+            return result(str(e) or e.__class__.__name__)
+
+        return result()
+
+    def build(self) -> list[ProjectResult]:
+        """Creates every project, then shows a summary table."""
+        with tempfile.TemporaryDirectory(prefix="zentra-template-") as tmp:
+            template = self.prepare_template(Path(tmp))
+            results = self.create_projects(template)
+
+        console.print(batch_summary_table(results))
+
+        if not all(result.ok for result in results):
+            raise typer.Exit(code=CommonErrorCodes.BATCH_FAILED)
+
+        raise typer.Exit(code=SetupSuccessCodes.BATCH_COMPLETE)
+
+    def create_projects(self, template: SetupTasks) -> list[ProjectResult]:
+        """Creates the projects in parallel, showing a progress row for each one."""
+        progress = task_progress()
+        results: dict[Path, ProjectResult] = {}
+        executor = worker_pool(self.workers)
+
+        try:
+            with progress, ThreadPoolExecutor(max_workers=self.workers) as threads:
+                rows = {
+                    p.path: progress.add_task(f"Creating {p.path}...", total=1)
+                    for p in self.spec.projects
+                }
+                futures = {
+                    threads.submit(self.create_project, p, template, executor): p
+                    for p in self.spec.projects
+                }
+
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[result.path] = result
+                    progress.update(rows[result.path], completed=1)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return [results[p.path] for p in self.spec.projects]
@@ -0,0 +1,206 @@
+import re
+import time
+from pathlib import Path
+
+import typer
+from docker.errors import DockerException, ImageNotFound
+
+from zentra_sdk.cli.builder.client import docker_connection
+from zentra_sdk.cli.builder.manifest import (
+    BuildManifest,
+    ComponentRecord,
+    hash_component,
+)
+from zentra_sdk.cli.builder.process import PrefixedOutput, run_streamed
+from zentra_sdk.cli.builder.tasks import Task, TaskScheduler, task_progress
+from zentra_sdk.cli.conf.checks import zentra_root_path
+from zentra_sdk.cli.conf.logger import set_loggers
+from zentra_sdk.cli.conf.profiler import profiler
+from zentra_sdk.cli.constants import (
+    FRONTEND_PACKAGE_MANAGERS,
+    BuildErrorCodes,
+    BuildSuccessCodes,
+    CommonErrorCodes,
+    ProjectPaths,
+    console,
+)
+from zentra_sdk.cli.constants.display import build_summary_table
+from zentra_sdk.cli.constants.message import unchanged_msg
+
+
+def package_manager(path: Path) -> str:
+    """Detects the package manager of a frontend from its lockfile. Defaults to `npm`."""
+    for lockfile, manager in FRONTEND_PACKAGE_MANAGERS.items():
+        if Path(path, lockfile).is_file():
+            return manager
+
+    return "npm"
+
+
+def image_tag(root: Path, component: str) -> str:
+    """Creates a valid Docker image tag for a project component."""
+    name = re.sub(r"[^a-z0-9._-]+", "-", root.name.lower()).strip("-._") or "zentra"
+    return f"{name}-{component}:latest"
+
+
+class Build:
+    """Performs the production build for the `build` command."""
+
+    def __init__(self, force: bool = False) -> None:
+        self.force = force
+
+        root_marker = zentra_root_path()
+        if root_marker is None:
+            raise typer.Exit(code=CommonErrorCodes.PROJECT_NOT_FOUND)
+
+        if not self.docker_installed():
+            raise typer.Exit(code=CommonErrorCodes.DOCKER_NOT_INSTALLED)
+
+        self.paths = ProjectPaths(root_marker.parent)
+        self.build_tasks = BuildTasks(self.paths)
+        self.manifest = BuildManifest(self.paths.BUILD_MANIFEST)
+
+    def docker_installed(self) -> bool:
+        """Checks if Docker is installed."""
+        return docker_connection.available()
+
+    def hash_inputs(self) -> dict[str, ComponentRecord]:
+        """Hashes the inputs of each component, reusing unchanged file hashes from the manifest."""
+        previous = self.manifest.load()
+        return {
+            name: hash_component(path, previous.get(name))
+            for name, path in self.build_tasks.components().items()
+        }
+
+    def unchanged(self, records: dict[str, ComponentRecord]) -> set[str]:
+        """Returns the components whose inputs match their last build and whose artifacts still exist."""
+        if self.force:
+            return set()
+
+        previous = self.manifest.load()
+        return {
+            name
+            for name, record in records.items()
+            if name in previous
+            and previous[name].digest == record.digest
+            and self.build_tasks.artifact_exists(name)
+        }
+
+    def build(self) -> None:
+        """Builds the backend and frontend at the same time, skipping unchanged components."""
+        start = time.perf_counter()
+        records = self.hash_inputs()
+        skipped = self.unchanged(records)
+
+        if skipped:
+            console.print(unchanged_msg(skipped))
+
+        scheduler = TaskScheduler(
+            self.build_tasks.get_tasks(), logger=self.build_tasks.logger.stdout
+        )
+        try:
+            scheduler.run(
+                self.build_tasks.progress,
+                completed=skipped,
+                on_complete=lambda name: self.manifest.record(name, records[name]),
+            )
+        finally:
+            total = time.perf_counter() - start
+            console.print(build_summary_table(scheduler.timings, total, skipped))
+
+        raise typer.Exit(code=BuildSuccessCodes.COMPLETE)
+
+
+class BuildTasks:
+    """Contains the tasks for the `build` command."""
+
+    def __init__(self, paths: ProjectPaths, test_logging: bool = False) -> None:
+        self.paths = paths
+        self.logger = set_loggers(test_logging)
+        self.progress = task_progress()
+
+        self.backend_output = PrefixedOutput(
+            "backend", "yellow", console, self.logger.stdout
+        )
+        self.frontend_output = PrefixedOutput(
+            "frontend", "green", console, self.logger.stdout
+        )
+
+    def components(self) -> dict[str, Path]:
+        """Returns the directory of each buildable component."""
+        return {
+            "backend": self.paths.BACKEND_PATH,
+            "frontend": self.paths.FRONTEND_PATH,
+        }
+
+    def artifact_exists(self, name: str) -> bool:
+        """Checks if the output of a previous build is still available."""
+        if name == "frontend":
+            return Path(self.paths.FRONTEND_PATH, ".next").is_dir()
+
+        try:
+            docker_connection.client.images.get(image_tag(self.paths.ROOT, name))
+        except (ImageNotFound, DockerException):
+            return False
+
+        return True
+
+    def _build_backend(self) -> None:
+        """Builds the backend as a production Docker image."""
+        output = self.backend_output
+
+        if not Path(self.paths.BACKEND_PATH, "Dockerfile").is_file():
+            output.write("No Dockerfile found in the backend directory.")
+            raise typer.Exit(code=BuildErrorCodes.BACKEND_FAILED)
+
+        tag = image_tag(self.paths.ROOT, "backend")
+
+        try:
+            with profiler.span("docker.build", category="docker", tag=tag):
+                events = docker_connection.client.api.build(
+                    path=str(self.paths.BACKEND_PATH),
+                    tag=tag,
+                    rm=True,
+                    decode=True,
+                )
+
+                for event in events:
+                    if "error" in event:
+                        output.write(event["error"])
+                        raise typer.Exit(code=BuildErrorCodes.BACKEND_FAILED)
+
+                    for line in event.get("stream", "").splitlines():
+                        if line.strip():
+                            output.write(line)
+
+        except DockerException as e:
+            output.write(str(e))
+            raise typer.Exit(code=BuildErrorCodes.BACKEND_FAILED)
+
+    def _build_frontend(self) -> None:
+        """Builds the frontend with the `build` script of its package manager."""
+        path = self.paths.FRONTEND_PATH
+        manager = package_manager(path)
+        commands = [[manager, "run", "build"]]
+
+        if not Path(path, "node_modules").is_dir():
+            commands.insert(0, [manager, "install"])
+
+        for cmd in commands:
+            if run_streamed(cmd, path, self.frontend_output) != 0:
+                raise typer.Exit(code=BuildErrorCodes.FRONTEND_FAILED)
+
+    def get_tasks(self) -> list[Task]:
+        """Gets the tasks to run. The backend and frontend are built at the same time."""
+        return [
+            Task(
+                name="backend",
+                func=self._build_backend,
+                description="Building backend image...",
+            ),
+            Task(
+                name="frontend",
+                func=self._build_frontend,
+                description="Building frontend...",
+            ),
+        ]
@@ -0,0 +1,85 @@
+import asyncio
+from pathlib import Path
+from urllib.parse import urlparse
+
+import typer
+
+from zentra_sdk.cli.builder.process import PrefixedOutput
+from zentra_sdk.cli.builder.supervisor import Service, Supervisor
+from zentra_sdk.cli.commands.build import package_manager
+from zentra_sdk.cli.conf.checks import zentra_root_path
+from zentra_sdk.cli.conf.logger import set_loggers
+from zentra_sdk.cli.constants import (
+    DEV_BACKEND_COMMAND,
+    DEV_BACKEND_URL,
+    CommonErrorCodes,
+    DevSuccessCodes,
+    ProjectPaths,
+    console,
+)
+from zentra_sdk.cli.constants.message import dev_msg
+
+
+def read_env(path: Path) -> dict[str, str]:
+    """Reads the values of an env file, ignoring comments and blank lines."""
+    if not path.is_file():
+        return {}
+
+    values = {}
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith("#") and "=" in line:
+            key, value = line.split("=", 1)
+            values[key.strip()] = value.strip().strip("\"'")
+
+    return values
+
+
+class Dev:
+    """Runs the backend and frontend dev servers for the `dev` command."""
+
+    def __init__(self, test_logging: bool = False) -> None:
+        root_marker = zentra_root_path()
+        if root_marker is None:
+            raise typer.Exit(code=CommonErrorCodes.PROJECT_NOT_FOUND)
+
+        self.paths = ProjectPaths(root_marker.parent)
+        self.logger = set_loggers(test_logging)
+
+    def backend_url(self) -> str:
+        """The URL the frontend expects the backend on, from its `.env.local` file."""
+        return read_env(self.paths.ENV_LOCAL).get(
+            "BACKEND_CONNECTION_URL", DEV_BACKEND_URL
+        )
+
+    def services(self) -> list[Service]:
+        """Gets the dev servers to run, with the backend on the port the frontend connects to."""
+        port = urlparse(self.backend_url()).port or urlparse(DEV_BACKEND_URL).port
+        frontend = self.paths.FRONTEND_PATH
+
+        return [
+            Service(
+                name="backend",
+                cmd=[*DEV_BACKEND_COMMAND, str(port)],
+                cwd=self.paths.BACKEND_PATH,
+                output=PrefixedOutput("backend", "yellow", console, self.logger.stdout),
+            ),
+            Service(
+                name="frontend",
+                cmd=[package_manager(frontend), "run", "dev"],
+                cwd=frontend,
+                output=PrefixedOutput("frontend", "green", console, self.logger.stdout),
+            ),
+        ]
+
+    def run(self) -> None:
+        """Runs the dev servers until they exit or Ctrl-C is pressed."""
+        services = self.services()
+        console.print(dev_msg(self.backend_url()))
+
+        try:
+            asyncio.run(Supervisor(services).run())
+        except KeyboardInterrupt:
+            pass
+
+        raise typer.Exit(code=DevSuccessCodes.STOPPED)
@@ -0,0 +1,90 @@
+import gzip
+import heapq
+import json
+import logging
+import re
+from itertools import chain
+from pathlib import Path
+from typing import Iterator
+
+from zentra_sdk.cli.constants import UserPaths
+
+LOG_SUFFIX = ".jsonl"
+ROTATED_PATTERN = re.compile(
+    rf"^(?P<name>.+){re.escape(LOG_SUFFIX)}\.(?P<index>\d+)\.gz$"
+)
+
+
+class LogReader:
+    """
+    Streams the structured task logs, including rotated and compressed files, oldest first. Records are read one line at a time, so large logs are never loaded into memory.
+    """
+
+    def __init__(self, folder: Path | None = None) -> None:
+        self.folder = Path(folder or UserPaths().LOGS)
+
+    def logs(self) -> dict[str, list[Path]]:
+        """Returns the files of each log, oldest first."""
+        logs: dict[str, list[tuple[int, Path]]] = {}
+
+        if not self.folder.is_dir():
+            return {}
+
+        for path in self.folder.iterdir():
+            if path.name.endswith(LOG_SUFFIX):
+                logs.setdefault(path.name.removesuffix(LOG_SUFFIX), []).append(
+                    (0, path)
+                )
+            elif match := ROTATED_PATTERN.match(path.name):
+                index = int(match.group("index"))
+                logs.setdefault(match.group("name"), []).append((index, path))
+
+        return {
+            name: [path for _, path in sorted(files, reverse=True)]
+            for name, files in sorted(logs.items())
+        }
+
+    @staticmethod
+    def read(path: Path) -> Iterator[dict]:
+        """Yields the records of a single log file, skipping lines that aren't valid JSON."""
+        opener = gzip.open if path.suffix == ".gz" else open
+
+        with opener(path, "rt", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                if isinstance(record, dict):
+                    yield record
+
+    def records(
+        self,
+        run: str | None = None,
+        task: str | None = None,
+        level: str | None = None,
+    ) -> Iterator[dict]:
+        """Yields the records of every log in time order, filtered by run id prefix, task name and minimum level."""
+        levels = logging.getLevelNamesMapping()
+        if level and level.upper() not in levels:
+            raise ValueError(f"Unknown log level '{level}'.")
+
+        min_level = levels[level.upper()] if level else 0
+
+        streams = [
+            chain.from_iterable(self.read(path) for path in files)
+            for files in self.logs().values()
+        ]
+
+        for record in heapq.merge(*streams, key=lambda r: r.get("time", "")):
+            if run and not str(record.get("run_id", "")).startswith(run):
+                continue
+
+            if task and record.get("task") != task:
+                continue
+
+            if levels.get(record.get("level"), 0) < min_level:
+                continue
+
+            yield record
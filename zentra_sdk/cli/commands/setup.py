@@ -1,41 +1,63 @@
 import os
 from pathlib import Path
-import subprocess
 import shutil
-from typing import Callable
 
-from zentra_sdk.cli.builder.docker import DockerBuilder
+from zentra_sdk.cli.builder.backend import BackendInit
+from zentra_sdk.cli.builder.cache import TemplateCache
+from zentra_sdk.cli.builder.client import docker_connection
+from zentra_sdk.cli.builder.docker import DockerBuilder, project_run_id
+from zentra_sdk.cli.builder.journal import InitJournal
+from zentra_sdk.cli.builder.manifest import input_files
+from zentra_sdk.cli.builder.merge import TemplateManifest
+from zentra_sdk.cli.builder.snapshot import SnapshotStore, extract_snapshot
+from zentra_sdk.cli.builder.sync import sync_tree
+from zentra_sdk.cli.builder.tasks import Task, TaskScheduler, task_progress
+from zentra_sdk.cli.conf.config import frontend_details
 from zentra_sdk.cli.conf.logger import set_loggers
+from zentra_sdk.cli.conf.profiler import profiler
 from zentra_sdk.cli.constants import (
-    DOCKER_FRONTEND_DETAILS,
+    DOCKER_FRONTEND_CACHE_PATH,
+    DOCKER_FRONTEND_WARM_TAG,
     FRONTEND_FILES_TO_REMOVE,
+    FRONTEND_WARM_FILES,
     CommonErrorCodes,
     PackagePaths,
     SetupSuccessCodes,
     ProjectPaths,
+    UserPaths,
     console,
 )
 from zentra_sdk.cli.constants.display import (
     already_configured_panel,
     setup_complete_panel,
 )
-from zentra_sdk.cli.constants.message import creation_msg
+from zentra_sdk.cli.constants.message import creation_msg, resume_msg
 
 import typer
-from rich.progress import track
-import docker
-from docker.errors import DockerException
 
 
 class Setup:
     """Performs project creation for the `init` command."""
 
-    def __init__(self, root: Path = Path(os.getcwd())) -> None:
-        if not self.docker_installed():
+    def __init__(
+        self,
+        root: Path = Path(os.getcwd()),
+        offline: bool = False,
+        snapshot: Path | None = None,
+        isolated: bool = False,
+        warm: bool = False,
+    ) -> None:
+        if not offline and not self.docker_installed():
             raise typer.Exit(code=CommonErrorCodes.DOCKER_NOT_INSTALLED)
 
         self.paths = ProjectPaths(root)
-        self.setup_tasks = SetupTasks(self.paths)
+        self.setup_tasks = SetupTasks(
+            self.paths,
+            offline=offline,
+            snapshot=snapshot,
+            isolated=isolated,
+            warm=warm,
+        )
 
     def project_exists(self) -> bool:
         """Checks if a project has already been created."""
@@ -56,76 +78,239 @@ class Setup:
 
     def docker_installed(self) -> bool:
         """Checks if Docker is installed."""
-        try:
-            client = docker.from_env()
-            client.ping()
-            return True
-        except DockerException:
-            return False
+        return docker_connection.available()
 
     def build(self) -> None:
-        """Builds the project."""
-        if self.project_exists():
-            console.print(already_configured_panel())
+        """Builds the project. Resumes from the journal if a previous run didn't finish."""
+        journal = InitJournal(self.paths.INIT_JOURNAL)
+
+        if not journal.exists() and self.project_exists():
+            console.print(already_configured_panel(warm=self.setup_tasks.warm))
             raise typer.Exit(code=SetupSuccessCodes.ALREADY_CONFIGURED)
 
+        completed = journal.completed()
+        journal.start()
+
+        # Only found by `build_frontend`, so a resumed run reads it back from the journal
+        self.setup_tasks.template_version = journal.values().get("template_version")
+
+        def record_step(name: str) -> None:
+            journal.record(name, template_version=self.setup_tasks.template_version)
+
         tasks = self.setup_tasks.get_tasks()
+        if completed:
+            console.print(resume_msg(completed))
 
-        for task in track(tasks, description="Building..."):
-            task()
+        TaskScheduler(tasks, logger=self.setup_tasks.logger.stdout).run(
+            self.setup_tasks.progress,
+            completed=completed,
+            on_complete=record_step,
+        )
+        journal.clear()
 
-        console.print(setup_complete_panel())
+        console.print(setup_complete_panel(warm=self.setup_tasks.warm))
         raise typer.Exit(code=SetupSuccessCodes.COMPLETE)
 
 
 class SetupTasks:
     """Contains the tasks for the `init` command."""
 
-    def __init__(self, paths: ProjectPaths, test_logging: bool = False) -> None:
+    def __init__(
+        self,
+        paths: ProjectPaths,
+        test_logging: bool = False,
+        offline: bool = False,
+        snapshot: Path | None = None,
+        isolated: bool = False,
+        warm: bool = False,
+    ) -> None:
         self.paths = paths
         self.package_paths = PackagePaths()
+        self.user_paths = UserPaths()
+        self.offline = offline
+        self.snapshot = snapshot
+        # Snapshots don't carry a package cache
+        self.warm = warm and not offline
+        self.template_version: str | None = None
 
         self.logger = set_loggers(test_logging)
-        self.docker_frontend = DockerBuilder(**DOCKER_FRONTEND_DETAILS)
+        self.progress = task_progress()
+        self.snapshots = SnapshotStore()
+        self.template_cache = TemplateCache()
+        self.docker_frontend = None if offline else self.frontend_builder()
+        self.backend = BackendInit(paths.ROOT, self.logger, isolated=isolated)
+
+    def frontend_builder(self) -> DockerBuilder:
+        """Creates the builder for the frontend template image, using its warm variant in warm mode."""
+        details = frontend_details()
+        if self.warm:
+            # The fallback image has no package cache to copy
+            details["tag"] = DOCKER_FRONTEND_WARM_TAG
+            details["fallback_tag"] = None
+
+        return DockerBuilder(**details, run_id=project_run_id(self.paths.ROOT))
 
     def _build_frontend(self) -> None:
-        """Builds the frontend from a docker container."""
-        self.docker_frontend.use(path="/frontend")
+        """Builds the frontend from the template cache, or a docker container on a cache miss."""
+        if self.offline:
+            return self._build_frontend_offline()
+
+        self.docker_frontend.resolve_tag()
+        digest = self.docker_frontend.digest()
+        self.template_version = digest or self.docker_frontend.image
+
+        # The package cache only comes from the image, so it needs a container if it was removed
+        cache_ready = not self.warm or self.user_paths.BUN_CACHE.is_dir()
+
+        if (
+            digest
+            and cache_ready
+            and self.template_cache.restore(digest, self.paths.ROOT)
+        ):
+            return
+
+        extra = (
+            {DOCKER_FRONTEND_CACHE_PATH: self.user_paths.BUN_CACHE}
+            if self.warm
+            else None
+        )
+        stats = self.docker_frontend.use(
+            path="/frontend",
+            dest=self.paths.ROOT,
+            progress=self.progress,
+            extra=extra,
+        )
+        self.logger.stdout.info(stats.summary())
+
+        if digest:
+            self.template_cache.store(
+                digest,
+                self.paths.FRONTEND_PATH,
+                image=self.docker_frontend.image,
+            )
+
+    def _build_frontend_offline(self) -> None:
+        """Builds the frontend from a template snapshot, without using Docker."""
+        snapshot = self.snapshots.find(self.snapshot)
+
+        if snapshot is None:
+            raise typer.Exit(code=CommonErrorCodes.SNAPSHOT_NOT_FOUND)
+
+        self.template_version = Path(snapshot).name
+
+        with profiler.span(
+            "extract snapshot", category="files", snapshot=str(snapshot)
+        ):
+            extract_snapshot(snapshot, self.paths.ROOT)
 
     def _build_backend(self) -> None:
         """Builds the backend using the `API` package."""
-        subprocess.run(["zentra-api", "init", "backend", "--hide-output"])
+        with profiler.span("zentra-api init", category="process"):
+            self.backend.run()
 
     def _remove_files(self) -> None:
         """Removes redundant files from the project."""
+        keep = FRONTEND_WARM_FILES if self.warm else []
+
         for file in FRONTEND_FILES_TO_REMOVE:
-            os.remove(self.paths.FRONTEND_PATH.joinpath(file))
+            if file in keep:
+                continue
+
+            try:
+                os.remove(self.paths.FRONTEND_PATH.joinpath(file))
+            except FileNotFoundError:
+                # Already removed by an interrupted run
+                pass
+
+    def _rollback_backend(self) -> None:
+        """Removes a partially created backend."""
+        shutil.rmtree(self.paths.BACKEND_PATH, ignore_errors=True)
+
+    def _rollback_frontend(self) -> None:
+        """Removes a partially created frontend."""
+        shutil.rmtree(self.paths.FRONTEND_PATH, ignore_errors=True)
+
+    def _cancel_frontend(self) -> None:
+        """Stops copying the frontend out of its container."""
+        if self.docker_frontend is not None:
+            self.docker_frontend.cancel()
 
     def _move_files(self) -> None:
         """Moves required files from the assets folder into the project."""
-        shutil.copytree(
-            self.package_paths.FRONTEND,
-            self.paths.FRONTEND_PATH,
-            dirs_exist_ok=True,
-        )
-        shutil.copytree(
-            self.package_paths.ROOT,
-            self.paths.ROOT,
-            dirs_exist_ok=True,
-        )
+        with profiler.span("copy frontend assets", category="files"):
+            sync_tree(self.package_paths.FRONTEND, self.paths.FRONTEND_PATH)
+
+        with profiler.span("copy root assets", category="files"):
+            sync_tree(self.package_paths.ROOT, self.paths.ROOT)
 
         os.rename(
             Path(self.paths.FRONTEND_PATH, ".env.local.template"),
             self.paths.ENV_LOCAL,
         )
 
-    def get_tasks(self) -> list[Callable]:
-        """Gets the tasks to run as a list of methods."""
+    def template_files(self) -> list[str]:
+        """
+        Returns the paths of the files added by the template, relative to the project root.
+
+        Files only kept in warm mode are left out, so `zentra update` never treats them as removed.
+        """
+        frontend = [
+            Path("frontend", name).as_posix()
+            for name in input_files(self.paths.FRONTEND_PATH)
+            if name not in FRONTEND_WARM_FILES
+        ]
+        root = [
+            item.name for item in self.package_paths.ROOT.iterdir() if item.is_file()
+        ]
+        return sorted(frontend + root)
+
+    def _record_template(self) -> None:
+        """Saves the template version and file hashes, so `zentra update` can upgrade the project later."""
+        manifest = TemplateManifest.scan(
+            self.paths.ROOT, self.template_files(), template=self.template_version
+        )
+        manifest.save(self.paths.TEMPLATE_MANIFEST)
+
+    def build_template(self) -> None:
+        """Creates the template files only, without the backend, so they can be copied into other projects."""
+        tasks = [task for task in self.get_tasks() if task.name != "build_backend"]
+        TaskScheduler(tasks, logger=self.logger.stdout).run(self.progress)
+
+    def get_tasks(self) -> list[Task]:
+        """Gets the tasks to run, along with the tasks they depend on."""
         console.print(creation_msg())
 
         return [
-            self._build_backend,
-            self._build_frontend,
-            self._remove_files,
-            self._move_files,
+            Task(
+                name="build_backend",
+                func=self._build_backend,
+                description="Building backend...",
+                rollback=self._rollback_backend,
+            ),
+            Task(
+                name="build_frontend",
+                func=self._build_frontend,
+                description="Building frontend...",
+                rollback=self._rollback_frontend,
+                cancel=self._cancel_frontend,
+            ),
+            Task(
+                name="remove_files",
+                func=self._remove_files,
+                depends_on=["build_frontend"],
+                description="Removing redundant files...",
+            ),
+            # Runs after removal so the replacement `next.config.mjs` is kept
+            Task(
+                name="move_files",
+                func=self._move_files,
+                depends_on=["remove_files"],
+                description="Adding project files...",
+            ),
+            Task(
+                name="record_template",
+                func=self._record_template,
+                depends_on=["move_files"],
+                description="Recording template version...",
+            ),
         ]
@@ -0,0 +1,52 @@
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import typer
+
+from zentra_sdk.cli.builder.cache import TemplateCache
+from zentra_sdk.cli.builder.client import docker_connection
+from zentra_sdk.cli.builder.docker import DockerBuilder
+from zentra_sdk.cli.builder.snapshot import SnapshotStore
+from zentra_sdk.cli.conf.config import frontend_details
+from zentra_sdk.cli.constants import CommonErrorCodes
+
+
+class TemplateExport:
+    """Exports the frontend template as a snapshot for the `template export` command."""
+
+    def __init__(self, store: SnapshotStore | None = None) -> None:
+        if not self.docker_installed():
+            raise typer.Exit(code=CommonErrorCodes.DOCKER_NOT_INSTALLED)
+
+        self.store = store or SnapshotStore()
+        self.template_cache = TemplateCache()
+        self.docker_frontend = DockerBuilder(**frontend_details())
+
+    def docker_installed(self) -> bool:
+        """Checks if Docker is installed."""
+        return docker_connection.available()
+
+    @staticmethod
+    def version(digest: str | None) -> str:
+        """Creates a sortable snapshot version from the current time and image digest."""
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        if digest is None:
+            return timestamp
+
+        return f"{timestamp}-{digest.removeprefix('sha256:')[:12]}"
+
+    def export(self, output: Path | None = None) -> Path:
+        """Fetches the frontend template and archives it. Returns the snapshot path."""
+        self.docker_frontend.resolve_tag()
+        digest = self.docker_frontend.digest()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            if not (digest and self.template_cache.restore(digest, Path(tmp_dir))):
+                self.docker_frontend.use(path="/frontend", dest=tmp_dir)
+
+            return self.store.export(
+                Path(tmp_dir, "frontend"),
+                self.version(digest),
+                output,
+            )
@@ -0,0 +1,83 @@
+import tempfile
+from pathlib import Path
+
+import typer
+
+from zentra_sdk.cli.builder.client import docker_connection
+from zentra_sdk.cli.builder.merge import (
+    TemplateManifest,
+    apply_update,
+    merged_manifest,
+    plan_update,
+)
+from zentra_sdk.cli.commands.setup import SetupTasks
+from zentra_sdk.cli.conf.checks import zentra_root_path
+from zentra_sdk.cli.conf.profiler import profiler
+from zentra_sdk.cli.constants import (
+    CommonErrorCodes,
+    ProjectPaths,
+    UpdateErrorCodes,
+    UpdateSuccessCodes,
+    console,
+)
+from zentra_sdk.cli.constants.display import update_table
+
+
+class Update:
+    """Upgrades the template files of a project for the `update` command."""
+
+    def __init__(
+        self,
+        offline: bool = False,
+        snapshot: Path | None = None,
+        dry_run: bool = False,
+        test_logging: bool = False,
+    ) -> None:
+        self.offline = offline
+        self.snapshot = snapshot
+        self.dry_run = dry_run
+        self.test_logging = test_logging
+
+        root_marker = zentra_root_path()
+        if root_marker is None:
+            raise typer.Exit(code=CommonErrorCodes.PROJECT_NOT_FOUND)
+
+        self.paths = ProjectPaths(root_marker.parent)
+        self.base = TemplateManifest.load(self.paths.TEMPLATE_MANIFEST)
+
+        if self.base is None:
+            raise typer.Exit(code=UpdateErrorCodes.MANIFEST_NOT_FOUND)
+
+        if not offline and not docker_connection.available():
+            raise typer.Exit(code=CommonErrorCodes.DOCKER_NOT_INSTALLED)
+
+    def update(self) -> None:
+        """Builds the latest template and applies its changes to the project, keeping the user's edits."""
+        with tempfile.TemporaryDirectory(prefix="zentra-template-") as tmp:
+            template = SetupTasks(
+                ProjectPaths(Path(tmp)),
+                test_logging=self.test_logging,
+                offline=self.offline,
+                snapshot=self.snapshot,
+            )
+            template.build_template()
+            new = TemplateManifest.load(template.paths.TEMPLATE_MANIFEST)
+
+            with profiler.span("three-way merge", category="files"):
+                plan = plan_update(self.paths.ROOT, self.base, new)
+
+                if not self.dry_run:
+                    apply_update(plan, template.paths.ROOT, self.paths.ROOT)
+                    merged_manifest(plan, self.base, new).save(
+                        self.paths.TEMPLATE_MANIFEST
+                    )
+
+        console.print(update_table(plan, dry_run=self.dry_run))
+
+        if plan.conflicts:
+            raise typer.Exit(code=UpdateErrorCodes.CONFLICTS)
+
+        if not plan.changes:
+            raise typer.Exit(code=UpdateSuccessCodes.UP_TO_DATE)
+
+        raise typer.Exit(code=UpdateSuccessCodes.COMPLETE)
@@ -1,45 +1,122 @@
 import os
+import stat
+import threading
 from pathlib import Path
 
-from pydantic import validate_call
+ROOT_MARKER = "zentra.root"
+ROOT_ENV = "ZENTRA_ROOT"
 
+# Directories that mark the top of a repository, where the search stops
+ROOT_BOUNDARIES = (".git",)
 
-@validate_call(validate_return=True)
-def zentra_root_path() -> Path | None:
+
+class RootResolver:
     """
-    Searches for the `zentra.root` file by traversing up the directory tree from the current directory.
+    Finds the `zentra.root` marker of the current project. Found markers are memoised by starting directory and re-validated with a single `stat`, so repeated lookups don't walk the directory tree again.
 
-    If found, returns its `Path`. Otherwise, `None`.
+    The search stops at a repository root or a filesystem boundary. The `ZENTRA_ROOT` environment variable overrides it entirely.
     """
-    current_dir = Path(os.getcwd())
 
-    while True:
-        potential_root = Path(current_dir, "zentra.root")
-        if potential_root.is_file():
-            return potential_root
+    def __init__(
+        self,
+        marker: str = ROOT_MARKER,
+        boundaries: tuple[str, ...] = ROOT_BOUNDARIES,
+    ) -> None:
+        self.marker = marker
+        self.boundaries = boundaries
+
+        self._found: dict[str, Path] = {}
+        self._lock = threading.Lock()
+
+    def _is_marker(self, path: Path) -> bool:
+        """Checks if a path is a marker file, using one `stat` call."""
+        try:
+            return stat.S_ISREG(os.stat(path).st_mode)
+        except OSError:
+            return False
 
-        # Traverse up parent directory
-        parent_dir = Path(os.path.dirname(current_dir))
-        if parent_dir == current_dir:
-            # Reached root directory without finding
+    def _device(self, path: str) -> int | None:
+        try:
+            return os.stat(path).st_dev
+        except OSError:
             return None
 
-        current_dir = parent_dir
+    def _at_boundary(self, path: str) -> bool:
+        """Checks if a directory is the top of a repository."""
+        return any(os.path.lexists(os.path.join(path, b)) for b in self.boundaries)
+
+    def _override(self) -> Path | None:
+        """Gets the marker from the `ZENTRA_ROOT` environment variable, which can point to it or its directory."""
+        path = Path(os.environ[ROOT_ENV]).expanduser()
+        if path.name != self.marker:
+            path = Path(path, self.marker)
+
+        return path if self._is_marker(path) else None
+
+    def search(self, start: str) -> Path | None:
+        """Walks up the directory tree from `start` looking for the marker."""
+        current = start
+        device = self._device(current)
+
+        while True:
+            candidate = Path(current, self.marker)
+            if self._is_marker(candidate):
+                return candidate
+
+            parent = os.path.dirname(current)
+            if (
+                parent == current
+                or self._at_boundary(current)
+                or self._device(parent) != device
+            ):
+                return None
+
+            current = parent
+
+    def resolve(self, start: Path | None = None) -> Path | None:
+        """Returns the marker for the project containing `start`, defaulting to the current directory. Returns `None` if it can't be found."""
+        if os.environ.get(ROOT_ENV):
+            return self._override()
+
+        key = os.path.abspath(start or os.getcwd())
+        cached = self._found.get(key)
+
+        if cached is not None and self._is_marker(cached):
+            return cached
+
+        found = self.search(key)
+
+        with self._lock:
+            if found is None:
+                self._found.pop(key, None)
+            else:
+                self._found[key] = found
+
+        return found
+
+    def clear(self) -> None:
+        """Forgets every memoised marker."""
+        with self._lock:
+            self._found.clear()
+
+
+root_resolver = RootResolver()
+
+
+def zentra_root_path(start: Path | None = None) -> Path | None:
+    """
+    Searches for the `zentra.root` file by traversing up the directory tree from the current directory, or `start`.
+
+    If found, returns its `Path`. Otherwise, `None`.
+    """
+    return root_resolver.resolve(start)
 
 
-@validate_call(validate_return=True)
 def check_file_exists(filepath: Path) -> bool:
     """Checks if a file exists based on the given filepath."""
-    if os.path.exists(filepath) and os.path.isfile(filepath):
-        return True
-
-    return False
+    return os.path.isfile(filepath)
 
 
-@validate_call(validate_return=True)
 def check_folder_exists(dirpath: Path) -> bool:
     """Checks if a directory exists based on the given directory path."""
-    if os.path.exists(dirpath) and os.path.isdir(dirpath):
-        return True
-
-    return False
+    return os.path.isdir(dirpath)
@@ -0,0 +1,131 @@
+import os
+import tomllib
+from pathlib import Path
+
+import typer
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from zentra_sdk.cli.constants import (
+    DOCKER_FRONTEND_DETAILS,
+    DOCKER_PROBE_TIMEOUT,
+    LOG_BACKUP_COUNT,
+    LOG_MAX_BYTES,
+    TEMPLATE_CACHE_MAX_BYTES,
+    CommonErrorCodes,
+    UserPaths,
+)
+
+# Environment variables that override the `[template]` table of the config file
+TEMPLATE_ENV_VARS = {
+    "registry": "ZENTRA_TEMPLATE_REGISTRY",
+    "image_name": "ZENTRA_TEMPLATE_IMAGE",
+    "tag": "ZENTRA_TEMPLATE_TAG",
+    "digest": "ZENTRA_TEMPLATE_DIGEST",
+    "mirrors": "ZENTRA_TEMPLATE_MIRRORS",
+    "mirror_timeout": "ZENTRA_MIRROR_TIMEOUT",
+    "keep_image": "ZENTRA_KEEP_IMAGE",
+}
+
+
+# Environment variables for the CLI's own settings
+SETTINGS_ENV_VARS = {
+    "docker_timeout": "ZENTRA_DOCKER_TIMEOUT",
+    "cache_max_bytes": "ZENTRA_CACHE_MAX_BYTES",
+    "log_max_bytes": "ZENTRA_LOG_MAX_BYTES",
+    "log_backup_count": "ZENTRA_LOG_BACKUP_COUNT",
+}
+
+
+class Settings(BaseModel):
+    """The CLI settings read from environment variables."""
+
+    docker_timeout: float = Field(DOCKER_PROBE_TIMEOUT, gt=0)
+    cache_max_bytes: int = Field(TEMPLATE_CACHE_MAX_BYTES, ge=0)
+    log_max_bytes: int = Field(LOG_MAX_BYTES, gt=0)
+    log_backup_count: int = Field(LOG_BACKUP_COUNT, ge=0)
+
+
+def settings() -> Settings:
+    """Reads the settings from their environment variables when they're needed, so a bad value is reported as an invalid config."""
+    env = {
+        field: os.environ[var]
+        for field, var in SETTINGS_ENV_VARS.items()
+        if var in os.environ
+    }
+
+    try:
+        return Settings(**env)
+    except ValidationError:
+        raise typer.Exit(code=CommonErrorCodes.INVALID_CONFIG)
+
+
+class TemplateConfig(BaseModel):
+    """The user settings for where the frontend template image is pulled from."""
+
+    registry: str | None = None
+    image_name: str | None = None
+    tag: str | None = None
+    image_digest: str | None = Field(None, alias="digest")
+    mirrors: list[str] | None = None
+    mirror_timeout: float | None = None
+    keep_image: bool | None = None
+
+    @field_validator("mirrors", mode="before")
+    @classmethod
+    def split_mirrors(cls, value):
+        """Accepts a comma separated string, as set in an environment variable."""
+        if isinstance(value, str):
+            return [mirror.strip() for mirror in value.split(",") if mirror.strip()]
+
+        return value
+
+    @field_validator("image_digest")
+    @classmethod
+    def check_digest(cls, value: str | None) -> str | None:
+        if value is not None and not value.startswith("sha256:"):
+            raise ValueError("digest must start with 'sha256:'")
+
+        return value
+
+
+def read_config(path: Path | None = None) -> dict:
+    """Reads the user config file. Returns an empty config if it doesn't exist."""
+    path = Path(path or UserPaths().CONFIG_FILE)
+
+    if not path.is_file():
+        return {}
+
+    try:
+        return tomllib.loads(path.read_text())
+    except (OSError, ValueError):
+        raise typer.Exit(code=CommonErrorCodes.INVALID_CONFIG)
+
+
+def template_config(path: Path | None = None) -> TemplateConfig:
+    """Loads the template settings from the config file, with environment variables taking priority."""
+    values = read_config(path).get("template", {})
+    env = {
+        field: os.environ[var]
+        for field, var in TEMPLATE_ENV_VARS.items()
+        if var in os.environ
+    }
+
+    try:
+        return TemplateConfig(**{**values, **env})
+    except (ValidationError, TypeError):
+        raise typer.Exit(code=CommonErrorCodes.INVALID_CONFIG)
+
+
+def frontend_details(path: Path | None = None) -> dict:
+    """
+    Returns the details of the frontend template image, including any user settings.
+
+    A tag set by the user has no fallback, so a missing image is reported instead of replaced.
+    """
+    settings = template_config(path).model_dump(exclude_none=True)
+    details = {**DOCKER_FRONTEND_DETAILS, **settings}
+
+    if "tag" in settings:
+        details["fallback_tag"] = None
+
+    return details
@@ -1,7 +1,214 @@
+import atexit
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import cache
+import gzip
+import json
 import logging
+from logging.handlers import QueueHandler, RotatingFileHandler
+import os
 from pathlib import Path
+import queue
+import shutil
+import threading
+from typing import Callable
+import uuid
 
-from zentra_sdk.cli.constants import LOG_FOLDER
+from zentra_sdk.cli.conf.config import settings
+from zentra_sdk.cli.constants import UserPaths
+
+# Maximum number of records written between flushes
+LOG_BATCH_SIZE = 256
+
+# Identifies every record written by this process
+RUN_ID = uuid.uuid4().hex[:12]
+
+# Structured fields added to every record
+LOG_FIELDS = ("run_id", "task", "stream", "duration", "exit_code")
+
+# The name of the task running on the current thread
+current_task: ContextVar[str | None] = ContextVar("current_task", default=None)
+
+
+class ContextFilter(logging.Filter):
+    """Adds the run id, current task and stream to each record, unless the caller already set them."""
+
+    def __init__(self, stream: str | None = None) -> None:
+        super().__init__()
+        self.stream = stream
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        defaults = {
+            "run_id": RUN_ID,
+            "task": current_task.get(),
+            "stream": self.stream,
+        }
+
+        for field, value in defaults.items():
+            if getattr(record, field, None) is None:
+                setattr(record, field, value)
+
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats each record as a single line of JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for field in LOG_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                data[field] = value
+
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+
+        return json.dumps(data, default=str)
+
+
+def gzip_namer(name: str) -> str:
+    return f"{name}.gz"
+
+
+def gzip_rotator(source: str, dest: str) -> None:
+    """Compresses a rotated log file."""
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+
+    os.remove(source)
+
+
+class BatchFileHandler(RotatingFileHandler):
+    """
+    A file handler that leaves flushing to the log listener, so records are written in batches. Files are rotated and compressed once they reach `maxBytes`, if set.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.namer = gzip_namer
+        self.rotator = gzip_rotator
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+
+            if self.stream is None:
+                self.stream = self._open()
+
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class LogListener:
+    """
+    Owns the file handlers of queued loggers. Callers only put records on a queue, and a single background thread writes them in batches, flushing after each batch and on exit.
+    """
+
+    _STOP = object()
+
+    def __init__(self, batch_size: int = LOG_BATCH_SIZE) -> None:
+        self.batch_size = batch_size
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.handlers: dict[str, list[logging.Handler]] = {}
+
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._registered = False
+
+    def add_handler(self, logger: logging.Logger, handler: logging.Handler) -> None:
+        """Routes the records of a logger to a handler, through the queue."""
+        with self._lock:
+            if logger.name not in self.handlers:
+                self.handlers[logger.name] = []
+                logger.addHandler(QueueHandler(self.queue))
+
+            self.handlers[logger.name].append(handler)
+            self._start()
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._run, name="zentra-log-listener", daemon=True
+        )
+        self._thread.start()
+
+        if not self._registered:
+            atexit.register(self.stop)
+            self._registered = True
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if not self._write(batch):
+                return
+
+    def _write(self, batch: list) -> bool:
+        """Writes a batch of records and flushes the handlers. Returns `False` once told to stop."""
+        running = True
+
+        for item in batch:
+            if item is self._STOP:
+                running = False
+            elif isinstance(item, threading.Event):
+                # Flush markers are set once everything before them is written
+                self._flush_handlers()
+                item.set()
+            else:
+                for handler in self.handlers.get(item.name, []):
+                    if item.levelno >= handler.level:
+                        handler.handle(item)
+
+        self._flush_handlers()
+        return running
+
+    def _flush_handlers(self) -> None:
+        for handlers in list(self.handlers.values()):
+            for handler in handlers:
+                handler.flush()
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Blocks until every record queued so far has been written."""
+        if self._thread is None:
+            return
+
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
+
+    def stop(self) -> None:
+        """Writes the remaining records and stops the background thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is None:
+            return
+
+        self.queue.put(self._STOP)
+        thread.join()
+        self._flush_handlers()
+
+
+log_listener = LogListener()
 
 
 class BaseLogger:
@@ -11,9 +218,38 @@ class BaseLogger:
         self,
         logger_name: str,
         level: int = logging.DEBUG,
+        queued: bool = False,
+        stream: str | None = None,
     ) -> None:
         self.logger = logging.getLogger(logger_name)
         self.logger.setLevel(level=level)
+        self.queued = queued
+
+        if not any(isinstance(f, ContextFilter) for f in self.logger.filters):
+            self.logger.addFilter(ContextFilter(stream))
+
+        self._deferred: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def defer(self, setup: Callable[[], None]) -> None:
+        """Delays part of the logger set up, such as creating its handlers, until it's first used."""
+        self._deferred.append(setup)
+
+    def _ready(self) -> None:
+        """Runs the deferred set up, once."""
+        if not self._deferred:
+            return
+
+        # Other threads wait here until the set up has finished
+        with self._lock:
+            for setup in self._deferred:
+                setup()
+
+            self._deferred = []
+
+    @staticmethod
+    def _extra(fields: dict) -> dict:
+        return {"extra": fields} if fields else {}
 
     def console_handler(
         self,
@@ -34,34 +270,55 @@ class BaseLogger:
         level: int = logging.DEBUG,
         format: str = "%(asctime)s (%(name)s): %(levelname)s | %(message)s",
         datefmt: str = "%Y-%m-%d %H:%M:%S",
+        formatter: logging.Formatter | None = None,
+        max_bytes: int = 0,
+        backup_count: int = 0,
     ) -> None:
-        """Configuration for file handlers."""
-        handler = logging.FileHandler(log_filepath)
+        """
+        Configuration for file handlers. In queued mode, the handler is owned by the log listener and rotates the file once it reaches `max_bytes`, if set.
+        """
+        if self.queued:
+            handler = BatchFileHandler(
+                log_filepath,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                delay=True,
+            )
+        else:
+            handler = logging.FileHandler(log_filepath)
+
         handler.setLevel(level=level)
+        handler.setFormatter(formatter or logging.Formatter(format, datefmt=datefmt))
 
-        formatter = logging.Formatter(format, datefmt=datefmt)
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        if self.queued:
+            log_listener.add_handler(self.logger, handler)
+        else:
+            self.logger.addHandler(handler)
 
-    def debug(self, msg: str) -> None:
-        """Sends a debug message to the logger."""
-        self.logger.debug(msg)
+    def debug(self, msg: str, **fields) -> None:
+        """Sends a debug message to the logger, with optional structured fields."""
+        self._ready()
+        self.logger.debug(msg, **self._extra(fields))
 
-    def info(self, msg: str) -> None:
-        """Sends a info message to the logger."""
-        self.logger.info(msg)
+    def info(self, msg: str, **fields) -> None:
+        """Sends a info message to the logger, with optional structured fields."""
+        self._ready()
+        self.logger.info(msg, **self._extra(fields))
 
-    def warning(self, msg: str) -> None:
-        """Sends a warning message to the logger."""
-        self.logger.warning(msg)
+    def warning(self, msg: str, **fields) -> None:
+        """Sends a warning message to the logger, with optional structured fields."""
+        self._ready()
+        self.logger.warning(msg, **self._extra(fields))
 
-    def error(self, msg: str) -> None:
-        """Sends an error message to the logger."""
-        self.logger.error(msg)
+    def error(self, msg: str, **fields) -> None:
+        """Sends an error message to the logger, with optional structured fields."""
+        self._ready()
+        self.logger.error(msg, **self._extra(fields))
 
-    def critical(self, msg: str) -> None:
-        """Sends a critical message to the logger."""
-        self.logger.critical(msg)
+    def critical(self, msg: str, **fields) -> None:
+        """Sends a critical message to the logger, with optional structured fields."""
+        self._ready()
+        self.logger.critical(msg, **self._extra(fields))
 
 
 class DebugLogger(BaseLogger):
@@ -71,36 +328,69 @@ class DebugLogger(BaseLogger):
         self,
         logger_name: str,
         log_filename: str = "debug.log",
-        log_folder: str = LOG_FOLDER,
+        log_folder: str | None = None,
         active: bool = False,
+        queued: bool = False,
+        structured: bool = False,
+        stream: str | None = None,
     ):
-        super().__init__(logger_name, level=logging.DEBUG)
+        super().__init__(logger_name, level=logging.DEBUG, queued=queued, stream=stream)
+
+        self.log_filepath = Path(log_folder or UserPaths().LOGS, log_filename)
+        self.active = active
+        self.structured = structured
+        # Read here, since a queued log is opened on the writer thread
+        self.settings = settings()
+
+        if queued:
+            self.defer(self._open_log)
+        else:
+            self._open_log()
+
+    def _open_log(self) -> None:
+        """Creates the log file and, if active, its file handler."""
+        if not self.log_filepath.exists():
+            self.log_filepath.parent.mkdir(parents=True, exist_ok=True)
+            self.log_filepath.touch(exist_ok=True)
+
+        if self.active and self.structured:
+            self.file_handler(
+                self.log_filepath,
+                formatter=JSONFormatter(),
+                max_bytes=self.settings.log_max_bytes,
+                backup_count=self.settings.log_backup_count,
+            )
+        elif self.active:  # pragma: no cover
+            self.file_handler(self.log_filepath)
+
+
+TASK_LOGGERS = {
+    "task_output_logger": ("TaskOutputLogger", "task_output.jsonl", "stdout"),
+    "task_error_logger": ("TaskErrorLogger", "task_error.jsonl", "stderr"),
+    "task_test_logger": ("TaskTestLogger", "testing.jsonl", None),
+}
 
-        log_filepath = Path(log_folder, log_filename)
 
-        if not log_filepath.exists():
-            Path(log_folder).mkdir(exist_ok=True)
-            log_filepath.touch(exist_ok=True)
+@cache
+def get_task_logger(name: str) -> DebugLogger:
+    """Returns one of the task loggers. Its log file and handlers are created when it's first used."""
+    logger_name, log_filename, stream = TASK_LOGGERS[name]
+    return DebugLogger(
+        logger_name,
+        log_filename,
+        active=True,
+        queued=True,
+        structured=True,
+        stream=stream,
+    )
 
-        if active:  # pragma: no cover
-            self.file_handler(log_filepath)
 
+def __getattr__(name: str):
+    # Deferred until first use to avoid creating log files on import
+    if name in TASK_LOGGERS:
+        return get_task_logger(name)
 
-task_output_logger = DebugLogger(
-    "TaskOutputLogger",
-    "task_output.log",
-    active=True,
-)
-task_error_logger = DebugLogger(
-    "TaskErrorLogger",
-    "task_error.log",
-    active=True,
-)
-task_test_logger = DebugLogger(
-    "TaskTestLogger",
-    "testing.log",
-    active=True,
-)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ErrorLoggers:
@@ -114,6 +404,10 @@ class ErrorLoggers:
 def set_loggers(testing: bool = False) -> ErrorLoggers:
     """Returns a logger object containing debug loggers."""
     if testing:
-        return ErrorLoggers(stdout=task_test_logger, stderr=task_test_logger)
+        test_logger = get_task_logger("task_test_logger")
+        return ErrorLoggers(stdout=test_logger, stderr=test_logger)
 
-    return ErrorLoggers(stdout=task_output_logger, stderr=task_error_logger)
+    return ErrorLoggers(
+        stdout=get_task_logger("task_output_logger"),
+        stderr=get_task_logger("task_error_logger"),
+    )
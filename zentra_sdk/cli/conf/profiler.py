@@ -0,0 +1,121 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class Span:
+    """A timed section of work, recorded as a complete trace event when it exits."""
+
+    __slots__ = ("profiler", "name", "category", "args", "start")
+
+    def __init__(self, profiler: "Profiler", name: str, category: str, args: dict):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+
+        self.profiler.add(self.name, self.category, self.start, end, self.args)
+
+
+class NullSpan:
+    """A span that records nothing, used when profiling is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+NULL_SPAN = NullSpan()
+
+
+class Profiler:
+    """
+    Records nested spans across threads and saves them as Chrome trace-event JSON, viewable in Perfetto or `chrome://tracing`. Spans are free when profiling is off.
+    """
+
+    def __init__(self) -> None:
+        self.path: Path | None = None
+        self.events: list[dict] = []
+        self.threads: dict[int, str] = {}
+
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def start(self, path: Path) -> None:
+        """Starts recording spans, to be saved to `path`."""
+        self.path = Path(path)
+        self.events = []
+        self.threads = {}
+        self._origin = time.perf_counter_ns()
+
+    def span(self, name: str, category: str = "zentra", **args) -> Span | NullSpan:
+        """Returns a context manager that times the work inside it."""
+        if self.path is None:
+            return NULL_SPAN
+
+        return Span(self, name, category, args)
+
+    def add(self, name: str, category: str, start: int, end: int, args: dict) -> None:
+        """Adds a complete event for a finished span."""
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) / 1000,
+            "dur": (end - start) / 1000,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": args,
+        }
+
+        with self._lock:
+            self.events.append(event)
+            self.threads.setdefault(thread.ident, thread.name)
+
+    def trace(self) -> dict:
+        """Returns the recorded spans in the Chrome trace-event format."""
+        pid = os.getpid()
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in self.threads.items()
+        ]
+        return {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+
+    def save(self) -> Path | None:
+        """Writes the trace file and stops recording. Returns its path, if profiling was on."""
+        path, self.path = self.path, None
+        if path is None:
+            return None
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.trace()))
+        return path
+
+
+profiler = Profiler()
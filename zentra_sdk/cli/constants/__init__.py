@@ -1,13 +1,9 @@
 import os
 from pathlib import Path
 from enum import Enum
+from functools import cache
 import importlib.resources as pkg_resources
 
-from rich.console import Console
-
-
-console = Console()
-
 # Core URLs
 DOCS_URL = "https://zentra.achronus.dev"
 GITHUB_ROOT = "https://github.com/Achronus/zentra"
@@ -18,9 +14,6 @@ ERROR_GUIDE_URL = f"{DOCS_URL}/help/errors/"
 
 DOCKER_URL = "https://docs.docker.com/engine/install/"
 
-PKG_DIR = pkg_resources.files("zentra_sdk")
-LOG_FOLDER = PKG_DIR.joinpath("logs")
-
 # Custom print emoji's
 PASS = "[green]\u2713[/green]"
 FAIL = "[red]\u274c[/red]"
@@ -28,10 +21,67 @@ PARTY = ":party_popper:"
 MAGIC = ":sparkles:"
 
 
-# Docker details
+# Docker details, the `template` tag is a data-only image holding just the `/frontend` files
+# Users can change where it's pulled from in their config file (see `conf.config`)
 DOCKER_FRONTEND_DETAILS = {
     "image_name": "achronus/nextjs-core",
     "container_name": "nextjs-container",
+    "tag": "template",
+    # The runtime image also holds `/frontend`, so it's used when the data-only tag isn't published
+    "fallback_tag": "latest",
+    "registry": None,
+    "image_digest": None,
+    "mirrors": [],
+    "mirror_timeout": 5.0,
+    # Only the small data-only image is kept by default, to skip the pull on the next run
+    "keep_tags": ["template"],
+}
+
+# The template image tag that also carries a package cache matching its lockfile
+DOCKER_FRONTEND_WARM_TAG = "warm"
+DOCKER_FRONTEND_CACHE_PATH = "/bun-cache"
+
+# Defaults for the settings that can be changed with environment variables (see `conf.config`)
+# Seconds to wait for the Docker daemon before treating it as unavailable
+DOCKER_PROBE_TIMEOUT = 3.0
+
+# Template cache details
+TEMPLATE_CACHE_MAX_BYTES = 1024**3
+
+# Log file details, rotated and compressed once they exceed the size limit
+LOG_MAX_BYTES = 10 * 1024**2
+LOG_BACKUP_COUNT = 5
+
+# Package managers for the frontend, detected by their lockfile
+FRONTEND_PACKAGE_MANAGERS = {
+    "bun.lockb": "bun",
+    "bun.lock": "bun",
+    "pnpm-lock.yaml": "pnpm",
+    "yarn.lock": "yarn",
+    "package-lock.json": "npm",
+}
+
+# Dev servers, the backend port comes from `BACKEND_CONNECTION_URL` in `.env.local`
+DEV_BACKEND_COMMAND = ["poetry", "run", "fastapi", "dev", "app/main.py", "--port"]
+DEV_BACKEND_URL = "http://localhost:8080/"
+DEV_FRONTEND_URL = "http://localhost:3000/"
+
+# Seconds between restarts of a crashed dev server, doubling up to the maximum
+DEV_RESTART_BACKOFF = 1.0
+DEV_MAX_BACKOFF = 30.0
+# Seconds a dev server must stay up before its restart delay resets
+DEV_STABLE_AFTER = 30.0
+# Seconds to wait for dev servers to stop before killing them
+DEV_STOP_TIMEOUT = 5.0
+
+# Directories that hold dependencies or build outputs, never build inputs
+BUILD_IGNORE_DIRS = {
+    ".git",
+    ".next",
+    ".venv",
+    "__pycache__",
+    ".pytest_cache",
+    "node_modules",
 }
 
 FRONTEND_FILES_TO_REMOVE = [
@@ -40,17 +90,72 @@ FRONTEND_FILES_TO_REMOVE = [
     ".gitignore",
 ]
 
+# Kept in warm mode, so installs resolve the cached package versions
+FRONTEND_WARM_FILES = ["bun.lockb"]
+
+
+@cache
+def get_console():
+    """Returns the shared `rich` console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def __getattr__(name: str):
+    # Deferred until first use to avoid import-time side effects
+    if name == "console":
+        return get_console()
+
+    if name == "PKG_DIR":
+        return pkg_resources.files("zentra_sdk")
+
+    if name == "LOG_FOLDER":
+        return UserPaths().LOGS
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class SetupSuccessCodes(Enum):
     TEST_SUCCESS = -2
     COMPLETE = 10
     ALREADY_CONFIGURED = 11
+    BATCH_COMPLETE = 12
+
+
+class DevSuccessCodes(Enum):
+    STOPPED = 70
+
+
+class UpdateSuccessCodes(Enum):
+    COMPLETE = 50
+    UP_TO_DATE = 51
+
+
+class UpdateErrorCodes(Enum):
+    MANIFEST_NOT_FOUND = 60
+    CONFLICTS = 61
+
+
+class BuildSuccessCodes(Enum):
+    COMPLETE = 30
+
+
+class BuildErrorCodes(Enum):
+    BACKEND_FAILED = 40
+    FRONTEND_FAILED = 41
 
 
 class CommonErrorCodes(Enum):
     TEST_ERROR = -1
     DOCKER_NOT_INSTALLED = 20
     PROJECT_NOT_FOUND = 21
+    SNAPSHOT_NOT_FOUND = 22
+    BACKEND_NOT_INSTALLED = 23
+    BACKEND_INIT_FAILED = 24
+    INVALID_SPEC = 25
+    BATCH_FAILED = 26
+    INVALID_CONFIG = 27
     UNKNOWN_ERROR = 1000
 
 
@@ -63,6 +168,10 @@ class ProjectPaths:
         self.FRONTEND_PATH = Path(self.ROOT, "frontend")
 
         self.ENV_LOCAL = Path(self.FRONTEND_PATH, ".env.local")
+        self.INIT_JOURNAL = Path(self.ROOT, ".zentra-init.json")
+        self.ROOT_MARKER = Path(self.ROOT, "zentra.root")
+        self.BUILD_MANIFEST = Path(self.ROOT, "zentra.build.json")
+        self.TEMPLATE_MANIFEST = Path(self.ROOT, "zentra.template.json")
 
 
 class PackagePaths:
@@ -74,3 +183,35 @@ class PackagePaths:
 
         self.ROOT = self.SETUP_ASSETS.joinpath("root")
         self.FRONTEND = self.SETUP_ASSETS.joinpath("frontend")
+        self.SNAPSHOTS = self.SETUP_ASSETS.joinpath("snapshots")
+
+
+class UserPaths:
+    """Contains the user-level filepaths, following the XDG base directory layout."""
+
+    def __init__(self) -> None:
+        self.CACHE = Path(
+            os.getenv("XDG_CACHE_HOME", Path(Path.home(), ".cache")), "zentra"
+        )
+        self.TEMPLATES = Path(self.CACHE, "templates")
+
+        self.DATA = Path(
+            os.getenv("XDG_DATA_HOME", Path(Path.home(), ".local", "share")), "zentra"
+        )
+        self.SNAPSHOTS = Path(self.DATA, "snapshots")
+
+        self.STATE = Path(
+            os.getenv("XDG_STATE_HOME", Path(Path.home(), ".local", "state")), "zentra"
+        )
+        self.LOGS = Path(self.STATE, "logs")
+
+        self.CONFIG = Path(
+            os.getenv("XDG_CONFIG_HOME", Path(Path.home(), ".config")), "zentra"
+        )
+        self.CONFIG_FILE = Path(self.CONFIG, "config.toml")
+
+        self.BUN_CACHE = Path(
+            os.getenv(
+                "BUN_INSTALL_CACHE_DIR", Path(Path.home(), ".bun", "install", "cache")
+            )
+        )
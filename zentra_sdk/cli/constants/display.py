@@ -1,9 +1,20 @@
+from datetime import datetime
 import textwrap
 
 from zentra_sdk.cli.constants import MAGIC
-from zentra_sdk.cli.constants.message import COMPLETE_MSG
+from zentra_sdk.cli.constants.message import COMPLETE_MSG, WARM_COMPLETE_MSG
 
 from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+LOG_LEVEL_STYLES = {
+    "DEBUG": "dim",
+    "INFO": "green",
+    "WARNING": "yellow",
+    "ERROR": "red",
+    "CRITICAL": "bold red",
+}
 
 
 def create_panel(
@@ -25,11 +36,117 @@ def success_panel(title: str, desc: str) -> Panel:
     {desc}""")
 
 
-def setup_complete_panel() -> Panel:
+def setup_complete_panel(warm: bool = False) -> Panel:
     """Creates a printable panel after successfully completing the `init` command."""
-    return success_panel("Project created successfully!", COMPLETE_MSG)
+    return success_panel(
+        "Project created successfully!", WARM_COMPLETE_MSG if warm else COMPLETE_MSG
+    )
 
 
-def already_configured_panel() -> Panel:
+def already_configured_panel(warm: bool = False) -> Panel:
     """Creates a printable panel for the `init` command if the project already exists."""
-    return success_panel("Project already exists!", COMPLETE_MSG)
+    return success_panel(
+        "Project already exists!", WARM_COMPLETE_MSG if warm else COMPLETE_MSG
+    )
+
+
+def cache_table(entries: list) -> Table:
+    """Creates a printable table of the template cache entries."""
+    table = Table(title="Template Cache", title_style="bright_green")
+    table.add_column("Digest", style="cyan")
+    table.add_column("Image", style="yellow")
+    table.add_column("Size", justify="right")
+    table.add_column("Last Used", style="dark_goldenrod")
+
+    for entry in entries:
+        table.add_row(
+            entry.digest.removeprefix("sha256:")[:12],
+            entry.image,
+            f"{entry.size / 1024**2:.1f} MB",
+            datetime.fromtimestamp(entry.last_used).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+    return table
+
+
+def build_summary_table(
+    timings: dict[str, float], total: float, skipped: set[str] | None = None
+) -> Table:
+    """Creates a printable table of the time taken by each build stage."""
+    table = Table(title="Build Summary", title_style="bright_green")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Time", justify="right")
+
+    for stage, duration in timings.items():
+        table.add_row(stage, f"{duration:.1f}s")
+
+    for stage in sorted(skipped or ()):
+        table.add_row(stage, "[dim]unchanged[/dim]")
+
+    table.add_section()
+    table.add_row("[bold]Total[/bold]", f"[bold]{total:.1f}s[/bold]")
+    return table
+
+
+def batch_summary_table(results: list) -> Table:
+    """Creates a printable table of the outcome and time taken for each project in a batch."""
+    table = Table(title="Batch Summary", title_style="bright_green")
+    table.add_column("Project", style="cyan")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+
+    for result in results:
+        status = (
+            "[green]✓ created[/green]" if result.ok else f"[red]✗ {result.error}[/red]"
+        )
+        table.add_row(str(result.path), status, f"{result.duration:.1f}s")
+
+    created = sum(result.ok for result in results)
+    table.add_section()
+    table.add_row(
+        "[bold]Total[/bold]", f"[bold]{created}/{len(results)} created[/bold]", ""
+    )
+    return table
+
+
+def update_table(plan, dry_run: bool = False) -> Table:
+    """Creates a printable table of the files changed by a template update."""
+    title = "Update Plan" if dry_run else "Update Summary"
+    table = Table(title=title, title_style="bright_green")
+    table.add_column("File", style="cyan")
+    table.add_column("Change")
+
+    changes = {
+        "[green]added[/green]": plan.added,
+        "[yellow]updated[/yellow]": plan.updated,
+        "[dim]removed[/dim]": plan.removed,
+        "[red]conflict[/red]": plan.conflicts,
+    }
+    for change, names in changes.items():
+        for name in names:
+            table.add_row(name, change)
+
+    if not plan.changes and not plan.conflicts:
+        table.add_row("[dim]No template changes[/dim]", "")
+
+    return table
+
+
+def log_line(record: dict) -> Text:
+    """Creates a printable line for a structured log record."""
+    level = record.get("level", "")
+    details = [
+        f"{key}={record[key]}" for key in ("exit_code", "duration") if key in record
+    ]
+
+    line = Text()
+    line.append(record.get("time", "")[:19].replace("T", " "), style="dim")
+    line.append(f" {level:<8}", style=LOG_LEVEL_STYLES.get(level, ""))
+    line.append(f" {record.get('run_id', '-')}", style="cyan")
+    line.append(f" {record.get('task') or '-'}", style="magenta")
+    line.append(f" | {record.get('message', '')}")
+
+    if details:
+        line.append(f" ({', '.join(details)})", style="dim")
+
+    return line
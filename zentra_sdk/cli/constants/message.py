@@ -6,13 +6,19 @@ from rich.console import Console
 from rich.panel import Panel
 
 from zentra_sdk.cli.constants import (
+    DEV_FRONTEND_URL,
     DOCKER_URL,
     ERROR_GUIDE_URL,
     FAIL,
     GITHUB_ISSUES_URL,
     MAGIC,
+    BuildErrorCodes,
+    BuildSuccessCodes,
     CommonErrorCodes,
+    DevSuccessCodes,
     SetupSuccessCodes,
+    UpdateErrorCodes,
+    UpdateSuccessCodes,
 )
 
 
@@ -20,6 +26,22 @@ def creation_msg() -> str:
     return f"\n{MAGIC} Creating new [yellow]FastAPI[/yellow] and [green]Next.js[/green] project {MAGIC}\n"
 
 
+def resume_msg(completed: set[str]) -> str:
+    return f"{MAGIC} Resuming previous run, skipping {len(completed)} completed step(s) {MAGIC}\n"
+
+
+def dev_msg(backend_url: str) -> str:
+    return (
+        f"\n{MAGIC} Starting the [yellow]backend[/yellow] on [cyan]{backend_url}[/cyan] "
+        f"and the [green]frontend[/green] on [cyan]{DEV_FRONTEND_URL}[/cyan] {MAGIC}\n"
+        "Press [yellow]Ctrl+C[/yellow] to stop both.\n"
+    )
+
+
+def unchanged_msg(skipped: set[str]) -> str:
+    return f"{MAGIC} No changes in {', '.join(sorted(skipped))}, reusing the previous build {MAGIC}\n"
+
+
 COMPLETE_MSG = """
 [yellow]Backend[/yellow] [cyan]Next Steps[/cyan]
     1. Access the [yellow]backend[/yellow] with [dark_goldenrod]cd backend[/dark_goldenrod]
@@ -32,6 +54,11 @@ COMPLETE_MSG = """
     3. Start programming!
 """
 
+WARM_COMPLETE_MSG = COMPLETE_MSG.replace(
+    "Install the packages using [dark_goldenrod]npm install[/dark_goldenrod] (or equivalent)",
+    "Install the packages from the local cache using [dark_goldenrod]bun install[/dark_goldenrod]",
+)
+
 MORE_HELP_INFO = f"""
 [dark_goldenrod]Need more help?[/dark_goldenrod] 
   Check our [bright_blue][link={ERROR_GUIDE_URL}]Error Message Guide[/link][/bright_blue].
@@ -44,10 +71,46 @@ MISSING_PROJECT = """
 Have you run [yellow]zentra init[/yellow]?
 """
 
+MISSING_SNAPSHOT = """
+Have you exported one with [yellow]zentra template export[/yellow]?
+"""
+
+MISSING_BACKEND_PACKAGE = """
+Have you installed the [yellow]zentra-api[/yellow] package?
+"""
+
+BACKEND_INIT_FAILED = """
+Check the backend output with [yellow]zentra logs --task build_backend[/yellow].
+"""
+
+MISSING_TEMPLATE_MANIFEST = """
+Projects created before template versioning don't have a [yellow]zentra.template.json[/yellow] file, so they can't be updated automatically.
+"""
+
+UPDATE_CONFLICTS = """
+The files marked as conflicts above were changed by you and the template. They were left as they are, so merge them by hand.
+"""
+
+INVALID_CONFIG = """
+Check [yellow]~/.config/zentra/config.toml[/yellow] and the [yellow]ZENTRA_*[/yellow] environment variables.
+"""
+
+INVALID_SPEC = """
+Check the spec file is valid TOML or JSON with a list of [yellow]projects[/yellow].
+"""
+
+BATCH_FAILED = """
+Check the summary table above, or the logs with [yellow]zentra logs --level error[/yellow].
+"""
+
 MISSING_DOCKER = f"""
 Have you installed the [link={DOCKER_URL}][cyan]Docker Engine[/link][/cyan] and turned it on?
 """
 
+BUILD_FAILED = """
+Check the [yellow]{name}[/yellow] output above for the cause of the error.
+"""
+
 UNKNOWN_ERROR = f"""
 {FAIL} 🥴 Well this is awkward... We didn't account for this! 🥴 {FAIL}
 
@@ -72,6 +135,7 @@ SUCCESS_MSG_MAP = {
     SetupSuccessCodes.TEST_SUCCESS: success_msg_with_checks("Test", desc=""),
     SetupSuccessCodes.COMPLETE: "",
     SetupSuccessCodes.ALREADY_CONFIGURED: "",
+    SetupSuccessCodes.BATCH_COMPLETE: "",
 }
 
 
@@ -85,12 +149,73 @@ COMMON_ERROR_MAP = {
         "Project not found!",
         desc=MISSING_PROJECT,
     ),
+    CommonErrorCodes.SNAPSHOT_NOT_FOUND: error_msg_with_checks(
+        "Template snapshot not found!",
+        desc=MISSING_SNAPSHOT,
+    ),
+    CommonErrorCodes.BACKEND_NOT_INSTALLED: error_msg_with_checks(
+        "Backend package not found!",
+        desc=MISSING_BACKEND_PACKAGE,
+    ),
+    CommonErrorCodes.BACKEND_INIT_FAILED: error_msg_with_checks(
+        "Backend creation failed!",
+        desc=BACKEND_INIT_FAILED,
+    ),
+    CommonErrorCodes.INVALID_SPEC: error_msg_with_checks(
+        "Invalid project spec!",
+        desc=INVALID_SPEC,
+    ),
+    CommonErrorCodes.BATCH_FAILED: error_msg_with_checks(
+        "Some projects failed!",
+        desc=BATCH_FAILED,
+    ),
+    CommonErrorCodes.INVALID_CONFIG: error_msg_with_checks(
+        "Invalid config!",
+        desc=INVALID_CONFIG,
+    ),
+}
+
+
+DEV_MSG_MAP = {
+    DevSuccessCodes.STOPPED: success_msg_with_checks("Dev servers stopped", desc=""),
+}
+
+
+UPDATE_MSG_MAP = {
+    UpdateSuccessCodes.COMPLETE: success_msg_with_checks("Project updated", desc=""),
+    UpdateSuccessCodes.UP_TO_DATE: success_msg_with_checks(
+        "Already up to date", desc=""
+    ),
+    UpdateErrorCodes.MANIFEST_NOT_FOUND: error_msg_with_checks(
+        "Template manifest not found!",
+        desc=MISSING_TEMPLATE_MANIFEST,
+    ),
+    UpdateErrorCodes.CONFLICTS: error_msg_with_checks(
+        "Update finished with conflicts!",
+        desc=UPDATE_CONFLICTS,
+    ),
+}
+
+
+BUILD_MSG_MAP = {
+    BuildSuccessCodes.COMPLETE: "",
+    BuildErrorCodes.BACKEND_FAILED: error_msg_with_checks(
+        "Backend build failed!",
+        desc=BUILD_FAILED.format(name="backend"),
+    ),
+    BuildErrorCodes.FRONTEND_FAILED: error_msg_with_checks(
+        "Frontend build failed!",
+        desc=BUILD_FAILED.format(name="frontend"),
+    ),
 }
 
 
 MSG_MAPPER = {
     **SUCCESS_MSG_MAP,
     **COMMON_ERROR_MAP,
+    **BUILD_MSG_MAP,
+    **UPDATE_MSG_MAP,
+    **DEV_MSG_MAP,
 }
 
 
@@ -118,6 +243,11 @@ class MessageHandler:
         """Handles success messages and returns a panel with their information."""
         return Panel(msg, expand=False, border_style="bright_green")
 
+    @staticmethod
+    def is_error(e: typer.Exit) -> bool:
+        """Checks if an exit code is an error code."""
+        return "Error" in e.exit_code.__class__.__name__
+
     def msg(self, e: typer.Exit) -> None:
         """Assigns a success or error message depending on the code received."""
         try:
@@ -129,12 +259,10 @@ class MessageHandler:
         except AttributeError:
             e.exit_code = CommonErrorCodes.UNKNOWN_ERROR
 
-        msg_type = e.exit_code.__class__.__name__
-
         if msg != "":
             panel = (
                 self.__error_msg(msg, e)
-                if "Error" in msg_type
+                if self.is_error(e)
                 else self.__success_msg(msg, e)
             )
             self.console.print(panel)
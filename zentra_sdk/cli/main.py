@@ -1,8 +1,11 @@
+from functools import cache
+from pathlib import Path
+
 import typer
 
-from zentra_sdk.cli.constants import console
-from zentra_sdk.cli.constants.message import MSG_MAPPER, MessageHandler
-from zentra_sdk.cli.commands.setup import Setup
+from zentra_sdk.cli.constants import MAGIC
+
+# Command modules are imported inside their commands to keep `zentra --help` fast
 
 init_command = typer.style("zentra init", typer.colors.YELLOW)
 
@@ -12,21 +15,254 @@ app = typer.Typer(
     pretty_exceptions_enable=True,
 )
 
-msg_handler = MessageHandler(console, MSG_MAPPER)
+cache_app = typer.Typer(help="Manages the local frontend template cache.")
+app.add_typer(cache_app, name="cache")
+
+template_app = typer.Typer(help="Manages the frontend template.")
+app.add_typer(template_app, name="template")
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    profile: Path = typer.Option(
+        None,
+        "--profile",
+        help="Save a timeline of the command to this file, viewable in [yellow]Perfetto[/yellow] or [yellow]chrome://tracing[/yellow].",
+    ),
+) -> None:
+    """Sets up the options shared by every command."""
+    if profile is None:
+        return
+
+    from zentra_sdk.cli.conf.profiler import profiler
+    from zentra_sdk.cli.constants import console
+
+    profiler.start(profile)
+    span = profiler.span(f"zentra {ctx.invoked_subcommand}", category="command")
+    span.__enter__()
+
+    def save_profile() -> None:
+        span.__exit__(None, None, None)
+        console.print(f"{MAGIC} Profile saved to [cyan]{profiler.save()}[/cyan]")
+
+    ctx.call_on_close(save_profile)
+
+
+@cache
+def msg_handler():
+    """Returns the shared message handler for success and error codes."""
+    from zentra_sdk.cli.constants import console
+    from zentra_sdk.cli.constants.message import MSG_MAPPER, MessageHandler
+
+    return MessageHandler(console, MSG_MAPPER)
+
+
+def exit_with(e: typer.Exit) -> None:
+    """Shows the message for an exit code. Errors are raised again with their code, so scripts can detect the failure."""
+    handler = msg_handler()
+    handler.msg(e)
+
+    if handler.is_error(e):
+        raise typer.Exit(code=e.exit_code.value)
 
 
 @app.command("init")
-def init() -> None:
+def init(
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Create the frontend from a template snapshot, without Docker.",
+    ),
+    snapshot: Path = typer.Option(
+        None,
+        "--snapshot",
+        help="The snapshot archive to use with [yellow]--offline[/yellow]. Defaults to the latest exported or bundled one.",
+    ),
+    isolated: bool = typer.Option(
+        False,
+        "--isolated",
+        help="Create the backend in a separate worker process.",
+    ),
+    warm: bool = typer.Option(
+        False,
+        "--warm",
+        help="Seed the local [yellow]bun[/yellow] cache with the template's packages, so the first install is offline.",
+    ),
+    from_spec: Path = typer.Option(
+        None,
+        "--from-spec",
+        help="Create every project listed in a TOML or JSON spec file, at the same time.",
+    ),
+) -> None:
     """Creates a new FastAPI and Next.js project in a current directory."""
+    if from_spec is not None:
+        init_from_spec(
+            from_spec, offline=offline, snapshot=snapshot, isolated=isolated, warm=warm
+        )
+        return
+
     try:
-        setup = Setup()
+        from zentra_sdk.cli.commands.setup import Setup
+
+        setup = Setup(offline=offline, snapshot=snapshot, isolated=isolated, warm=warm)
         setup.build()
 
     except typer.Exit as e:
-        msg_handler.msg(e)
+        msg_handler().msg(e)
+
+
+def init_from_spec(spec: Path, **options) -> None:
+    """Creates the projects in a spec file. Their options come from the spec, so the single project flags are rejected."""
+    used = [f"--{name}" for name, value in options.items() if value]
+    if used:
+        raise typer.BadParameter(
+            f"Can't be combined with {', '.join(used)}, set batch options in the spec file instead.",
+            param_hint="--from-spec",
+        )
+
+    from zentra_sdk.cli.commands.batch import BatchSetup
+
+    try:
+        BatchSetup(spec).build()
+
+    except typer.Exit as e:
+        exit_with(e)
 
 
 @app.command("build")
-def build() -> None:
+def build(
+    force: bool = typer.Option(
+        False, "--force", help="Rebuild every component, even if it hasn't changed."
+    ),
+) -> None:
     """Creates a production ready version of the project."""
-    pass
+    from zentra_sdk.cli.commands.build import Build
+
+    try:
+        builder = Build(force=force)
+        builder.build()
+
+    except typer.Exit as e:
+        exit_with(e)
+
+
+@app.command("dev")
+def dev() -> None:
+    """Runs the backend and frontend dev servers together, restarting them if they crash."""
+    from zentra_sdk.cli.commands.dev import Dev
+
+    try:
+        Dev().run()
+
+    except typer.Exit as e:
+        exit_with(e)
+
+
+@app.command("update")
+def update(
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Update from a template snapshot, without Docker.",
+    ),
+    snapshot: Path = typer.Option(
+        None,
+        "--snapshot",
+        help="The snapshot archive to use with [yellow]--offline[/yellow].",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show the changes without writing them."
+    ),
+) -> None:
+    """Updates the project's template files to the latest version, keeping your changes."""
+    from zentra_sdk.cli.commands.update import Update
+
+    try:
+        updater = Update(offline=offline, snapshot=snapshot, dry_run=dry_run)
+        updater.update()
+
+    except typer.Exit as e:
+        exit_with(e)
+
+
+@app.command("logs")
+def logs(
+    run: str = typer.Option(None, "--run", help="Only show records from this run id."),
+    task: str = typer.Option(None, "--task", help="Only show records from this task."),
+    level: str = typer.Option(
+        None, "--level", help="Only show records at or above this level."
+    ),
+    tail: int = typer.Option(None, "--tail", help="Only show the last N records."),
+) -> None:
+    """Shows the task logs, filtered by run, task or level."""
+    from collections import deque
+
+    from zentra_sdk.cli.commands.logs import LogReader
+    from zentra_sdk.cli.constants import console
+    from zentra_sdk.cli.constants.display import log_line
+
+    records = LogReader().records(run=run, task=task, level=level)
+
+    try:
+        if tail:
+            records = deque(records, maxlen=tail)
+
+        for record in records:
+            console.print(log_line(record), highlight=False)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--level")
+
+
+@cache_app.command("ls")
+def cache_ls() -> None:
+    """Lists the cached frontend templates."""
+    from zentra_sdk.cli.builder.cache import TemplateCache
+    from zentra_sdk.cli.constants import console
+    from zentra_sdk.cli.constants.display import cache_table
+
+    try:
+        console.print(cache_table(TemplateCache().entries()))
+
+    except typer.Exit as e:
+        exit_with(e)
+
+
+@cache_app.command("prune")
+def cache_prune(
+    all: bool = typer.Option(False, "--all", help="Remove every cached template."),
+) -> None:
+    """Removes cached templates that exceed the disk budget."""
+    from zentra_sdk.cli.builder.cache import TemplateCache
+    from zentra_sdk.cli.constants import console
+
+    try:
+        removed = TemplateCache().prune(all=all)
+
+    except typer.Exit as e:
+        exit_with(e)
+        return
+
+    freed = sum(entry.size for entry in removed) / 1024**2
+    console.print(f"{MAGIC} Removed {len(removed)} template(s), freeing {freed:.1f} MB")
+
+
+@template_app.command("export")
+def template_export(
+    output: Path = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Where to save the snapshot. Defaults to the user data directory.",
+    ),
+) -> None:
+    """Exports the frontend template as a snapshot for [yellow]zentra init --offline[/yellow]."""
+    from zentra_sdk.cli.commands.template import TemplateExport
+    from zentra_sdk.cli.constants import console
+
+    try:
+        path = TemplateExport().export(output)
+        console.print(f"{MAGIC} Template snapshot saved to [cyan]{path}[/cyan]")
+
+    except typer.Exit as e:
+        exit_with(e)